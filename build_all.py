@@ -5,193 +5,668 @@ Uses --onedir for stable builds that work on clean machines.
 """
 import os
 import sys
+import argparse
+import json
 import shutil
+import hashlib
+import importlib.metadata
+import tarfile
+import zipfile
+import ctypes
+import threading
+import queue
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import platform
 
+# Looked up once and shared by every build step
+PLATFORM = platform.system()
+PROJECT_ROOT = Path(__file__).resolve().parent
+
+# Native copy flags used by _fast_copyfile
+CLONE_NOFOLLOW = 0x0001
+COPY_FILE_NO_BUFFERING = 0x00001000
+LARGE_FILE_BYTES = 16 * 1024 * 1024
+
+# Read size for large-file copies (shutil defaults to 64 KiB-1 MiB)
+COPY_BUFFER_BYTES = 16 * 1024 * 1024
+
+# Files up to this size are read ahead whole; text ones get a higher level
+READ_AHEAD_BYTES = 1024 * 1024
+
+README_WIN_TEMPLATE = """# EntraLense - Windows Portable Version {version}
+
+## Quick Start
+1. Double-click `Launch.bat` or run `EntraLense\\EntraLense.exe`
+2. Enter your Azure credentials when prompted
+3. Use the menu to generate reports
+
+## Directory Structure
+- `EntraLense/` - Application files (DO NOT MODIFY)
+- `exports/` - CSV reports will be saved here
+- `logs/` - Application logs for troubleshooting
+- `Launch.bat` - Easy launcher
+
+## Azure Setup Required
+Before first use, you need:
+1. Azure Tenant ID
+2. Azure Client ID
+3. (Optional) Client Secret
+
+Get these from: https://portal.azure.com > Azure AD > App registrations
+
+## Troubleshooting
+If the app fails to start:
+1. Check `logs/` folder for error details
+2. From the menu, press 'L' to open logs folder
+3. Ensure you're running as Administrator if needed
+
+## Support
+Email: stephen.cantoria@thisbyte.com
+
+---
+EntraLense v{version} | The Full Stack and Beneath
+"""
+
+LAUNCH_BAT_TEMPLATE = """@echo off
+title EntraLense v{version}
+echo ========================================
+echo EntraLense - Azure AD Audit Tool
+echo Version {version}
+echo ========================================
+echo.
+echo Starting EntraLense...
+echo.
+cd /d "%~dp0"
+start "" "EntraLense\\EntraLense.exe"
+"""
+
+LAUNCHER_SH = """#!/bin/bash
+cd "$(dirname "$0")/EntraLense"
+./EntraLense
+"""
+
+INFO_PLIST_TEMPLATE = """<?xml version="1.0" encoding="UTF-8"?>
+<!DOCTYPE plist PUBLIC "-//Apple//DTD PLIST 1.0//EN" "http://www.apple.com/DTDs/PropertyList-1.0.dtd">
+<plist version="1.0">
+<dict>
+    <key>CFBundleName</key>
+    <string>EntraLense</string>
+    <key>CFBundleDisplayName</key>
+    <string>EntraLense</string>
+    <key>CFBundleIdentifier</key>
+    <string>com.thisbyte.entralense</string>
+    <key>CFBundleVersion</key>
+    <string>{version}</string>
+    <key>CFBundleShortVersionString</key>
+    <string>{version}</string>
+    <key>CFBundleExecutable</key>
+    <string>launcher.sh</string>
+    <key>LSMinimumSystemVersion</key>
+    <string>11.0</string>
+    <key>NSHumanReadableCopyright</key>
+    <string>Copyright 2026 ThisByte, LLC. All rights reserved.</string>
+</dict>
+</plist>
+"""
+
+
 class EntraLenseBuilder:
-    def __init__(self):
-        self.project_root = Path(__file__).parent
+    # Files and directories whose contents shape the PyInstaller bundle
+    CACHE_INPUTS = (
+        "entra_lense.py",
+        "requirements.txt",
+        "SecurityCompliancePortal.ps1",
+        ".env",
+        "assets",
+        "modules",
+        "config",
+        "data",
+        "UPX",
+    )
+
+    ICON_FILES = ("icon.ico", "icon_256x256.png")
+    ICON_SIZES = tuple((size, size) for size in (16, 32, 48, 64, 128, 256))
+
+    # Already compressed formats gain nothing from another DEFLATE pass
+    STORED_SUFFIXES = {".zip", ".pyz", ".gz", ".bz2", ".xz", ".whl", ".png", ".ico", ".jpg", ".dmg"}
+    BUILD_TOOLS = ("pip", "setuptools", "wheel", "pyinstaller", "colorama", "packaging")
+
+    # Packages whose submodules are all bundled (mostly imported dynamically)
+    COLLECTED_PACKAGES = ("charset_normalizer", "azure.identity", "msgraph")
+
+    # Imported dynamically, so PyInstaller's analysis does not see them
+    HIDDEN_IMPORTS = (
+        "pandas", "pandas._libs", "pandas._libs.tslibs", "colorama",
+        "aiohttp", "aiohttp.client", "dotenv", "python_dotenv",
+    )
+
+    # Stdlib and test packages the app never imports at runtime
+    EXCLUDED_MODULES = (
+        "tkinter", "test", "pydoc", "lib2to3", "xmlrpc", "distutils",
+        "pandas.tests", "numpy.tests",
+    )
+
+    # Runtime DLLs that break or get flagged by antivirus when packed;
+    # python*.dll is skipped as well
+    UPX_EXCLUDE = {"vcruntime140.dll", "vcruntime140_1.dll", "msvcp140.dll", "ucrtbase.dll"}
+
+    # Created up front; dist/ and build/ are made by the builds themselves
+    SETUP_DIRECTORIES = ("assets", "build_cache", "exports", "logs")
+
+    TEXT_SUFFIXES = {".txt", ".md", ".bat", ".ps1", ".json", ".plist"}
+
+    def __init__(self, archive_format="zip", clean=False):
+        self.project_root = PROJECT_ROOT
         self.version = "1.0.0"
+        self.archive_format = archive_format
+        self.clean = clean
+
+        # Paths used throughout the build
+        self.assets = self.project_root / "assets"
+        self.icon_ico = self.assets / "icon.ico"
+        self.icon_png = self.assets / "icon_256x256.png"
+        self.dist = self.project_root / "dist"
+        self.dist_win = self.dist / "windows"
+        self.dist_mac = self.dist / "macos"
+        self.build_win = self.project_root / "build" / "windows"
+        self.build_mac = self.project_root / "build" / "macos"
+        self.build_cache = self.project_root / "build_cache"
+
+        # Packaging files are rendered once; the Windows ones use CRLF line endings
+        self._readme_win = README_WIN_TEMPLATE.format(version=self.version).replace("\n", "\r\n").encode("utf-8")
+        self._launch_bat = LAUNCH_BAT_TEMPLATE.format(version=self.version).replace("\n", "\r\n").encode("utf-8")
+        self._launcher_sh = LAUNCHER_SH.encode("utf-8")
+        self._info_plist = INFO_PLIST_TEMPLATE.format(version=self.version).encode("utf-8")
+
+        # Lives outside the project so it survives cleaning dist/ and build/
+        self.cache_root = Path.home() / ".cache" / "entralense-build"
+        self.cache_dir = self.cache_root / "dist-cache"
+        self.use_cache = not clean and os.environ.get("ENTRALENSE_NO_CACHE") != "1"
 
     def setup_environment(self):
         """Setup build environment"""
         print("Setting up build environment...")
 
         # Ensure directories exist
-        directories = [
-            "assets",
-            "dist/windows",
-            "dist/macos",
-            "build/windows",
-            "build/macos",
-            "exports",
-            "logs"
-        ]
-
-        for dir_path in directories:
+        for dir_path in self.SETUP_DIRECTORIES:
             (self.project_root / dir_path).mkdir(parents=True, exist_ok=True)
 
-        # Install build dependencies
+        # Skip pip entirely when this interpreter already has the build tools
+        deps_key = hashlib.sha256(
+            " ".join((sys.executable, *self.BUILD_TOOLS)).encode()
+        ).hexdigest()[:12]
+        deps_sentinel = self.build_cache / f"deps-{deps_key}.ok"
+        if self.use_cache and deps_sentinel.exists():
+            print("Build tools already installed")
+            return
+
+        # Install build dependencies in one resolver pass
         print("Installing build tools...")
         subprocess.run([
             sys.executable, "-m", "pip", "install",
-            "--upgrade", "pip", "setuptools", "wheel"
-        ])
+            "--cache-dir", str(self.cache_root / "pip"),
+            "--prefer-binary",
+            "--upgrade", *self.BUILD_TOOLS
+        ], check=True, env={**os.environ, "PIP_DISABLE_PIP_VERSION_CHECK": "1"})
 
-        subprocess.run([
-            sys.executable, "-m", "pip", "install",
-            "pyinstaller", "colorama", "packaging"
-        ])
+        deps_sentinel.touch()
 
     def create_icons(self):
         """Create placeholder icons if they don't exist"""
-        assets_dir = self.project_root / "assets"
+        assets_dir = self.assets
 
         # Create simple icons programmatically (placeholder)
         if not (assets_dir / "icon.ico").exists():
+            assets_dir.mkdir(parents=True, exist_ok=True)
+
+            # The placeholder is deterministic, so key it on what it is drawn from
+            icon_key = hashlib.sha256(f"{self.version}|1e88e5|EL".encode()).hexdigest()[:12]
+            cached_icons = self.cache_root / "icons" / icon_key
+
+            if self.use_cache and cached_icons.is_dir():
+                print("Restoring cached placeholder icons...")
+                for name in self.ICON_FILES:
+                    self._fast_copyfile(cached_icons / name, assets_dir / name)
+                return
+
             print("Creating placeholder icons...")
-            self.create_placeholder_icon()
+            if self.create_placeholder_icon() and self.use_cache:
+                cached_icons.mkdir(parents=True, exist_ok=True)
+                for name in self.ICON_FILES:
+                    self._fast_copyfile(assets_dir / name, cached_icons / name)
 
     def create_placeholder_icon(self):
         """Create simple placeholder icon using Python"""
         try:
             from PIL import Image, ImageDraw
 
-            # Create Windows .ico (multiple sizes)
-            sizes = [(16, 16), (32, 32), (48, 48), (64, 64), (128, 128), (256, 256)]
-            images = []
-
-            for size in sizes:
-                img = Image.new('RGB', size, (30, 136, 229))  # Azure blue
-                draw = ImageDraw.Draw(img)
+            # Draw the "EL" logo once at full size and downscale it
+            master = Image.new('RGB', (256, 256), (30, 136, 229))  # Azure blue
+            draw = ImageDraw.Draw(master)
+            draw.rectangle([(64, 64), (192, 192)], fill=(255, 255, 255))
+            draw.text((85, 85), "EL", fill=(30, 136, 229), font_size=85)
 
-                # Draw "EL" logo
-                draw.rectangle([(size[0]//4, size[1]//4),
-                               (3*size[0]//4, 3*size[1]//4)],
-                               fill=(255, 255, 255))
-                draw.text((size[0]//3, size[1]//3), "EL",
-                         fill=(30, 136, 229),
-                         font_size=size[0]//3)
+            # Save as .ico; Pillow downscales the master to each size
+            master.save(self.icon_ico, format='ICO', sizes=self.ICON_SIZES)
 
-                images.append(img)
-
-            # Save as .ico
-            images[0].save(self.project_root / "assets" / "icon.ico",
-                          format='ICO', sizes=[(img.width, img.height) for img in images])
-
-            # Save macOS .icns (first image as PNG)
-            images[-1].save(self.project_root / "assets" / "icon_256x256.png")
+            # Save macOS .icns (full size image as PNG)
+            master.save(self.icon_png)
 
             print("Created placeholder icons")
+            return True
 
         except ImportError:
             print("Install Pillow for better icons: pip install pillow")
             # Create empty files as fallback
-            (self.project_root / "assets" / "icon.ico").touch()
-            (self.project_root / "assets" / "icon_256x256.png").touch()
+            self.icon_ico.touch()
+            self.icon_png.touch()
+            return False
 
-    def build_windows(self):
-        """Build Windows executable"""
-        print("\n" + "="*60)
-        print("Building Windows Executable (--onedir)")
-        print("="*60)
+    def _async_purge(self, path: Path):
+        """Empty a directory by renaming it aside and deleting the old copy in the background"""
+        if path.exists():
+            scrap = path.with_name(f"{path.name}.old.{os.getpid()}")
+            try:
+                os.replace(path, scrap)
+            except OSError:
+                # A file inside is locked (e.g. on Windows), delete in place
+                shutil.rmtree(path, ignore_errors=True)
+            else:
+                # Non-daemon, so the interpreter finishes the delete before exiting
+                threading.Thread(target=shutil.rmtree, args=(scrap,), kwargs={"ignore_errors": True}).start()
+
+        path.mkdir(parents=True, exist_ok=True)
+
+    def _remove_pycache(self):
+        """Delete __pycache__ directories from the trees bundled with --add-data"""
+        for name in ("config", "data"):
+            for dirpath, dirnames, _ in os.walk(self.project_root / name):
+                if "__pycache__" in dirnames:
+                    shutil.rmtree(os.path.join(dirpath, "__pycache__"), ignore_errors=True)
+                    dirnames.remove("__pycache__")
+
+    def _walk_files(self, root, skip_dirs=()):
+        """Yield a DirEntry for every file below root"""
+        stack = [str(root)]
+        while stack:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in skip_dirs:
+                            stack.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        yield entry
+
+    def _tree_size(self, root):
+        """Total size in bytes of all files below root"""
+        # DirEntry.stat() is served from the directory listing on Windows
+        return sum(entry.stat(follow_symlinks=False).st_size for entry in self._walk_files(root))
+
+    def _fast_copytree(self, src, dst):
+        """Recursively copy src to dst using the OS native copier when available"""
+        try:
+            if PLATFORM == "Windows":
+                # robocopy exit codes below 8 all mean success
+                result = subprocess.run([
+                    "robocopy", str(src), str(dst), "/E", "/MT:8",
+                    "/NFL", "/NDL", "/NJH", "/NJS", "/NP"
+                ], stdout=subprocess.DEVNULL)
+                if result.returncode >= 8:
+                    raise subprocess.CalledProcessError(result.returncode, "robocopy")
+                return
+            if PLATFORM == "Darwin":
+                # -c clones files on APFS and falls back to a normal copy elsewhere
+                Path(dst).mkdir(parents=True, exist_ok=True)
+                subprocess.run(["cp", "-Rc", f"{src}/.", str(dst)], check=True)
+                return
+        except FileNotFoundError:
+            pass
+
+        shutil.copytree(src, dst, dirs_exist_ok=True, copy_function=self._fast_copyfile)
+
+    def _link_tree(self, src, dst):
+        """Mirror src at dst using hard links, copying when linking is not possible"""
+        try:
+            shutil.copytree(src, dst, copy_function=os.link)
+        except (OSError, shutil.Error):
+            # Different volume or a filesystem without hard links
+            shutil.rmtree(dst, ignore_errors=True)
+            self._fast_copytree(src, dst)
+
+    def _fast_copyfile(self, src, dst):
+        """Copy a single file with copy-on-write or unbuffered native copies when possible"""
+        src, dst = os.fspath(src), os.fspath(dst)
+
+        if PLATFORM == "Darwin" and not os.path.lexists(dst):
+            # clonefile(2) makes an APFS copy-on-write clone: a metadata-only copy
+            libc = ctypes.CDLL(None, use_errno=True)
+            if hasattr(libc, "clonefile") and libc.clonefile(src.encode(), dst.encode(), CLONE_NOFOLLOW) == 0:
+                return dst
+        elif PLATFORM == "Windows" and os.path.getsize(src) > LARGE_FILE_BYTES:
+            # Unbuffered copies skip the file cache for large binaries
+            if ctypes.windll.kernel32.CopyFileExW(src, dst, None, None, None, COPY_FILE_NO_BUFFERING):
+                return dst
+
+        return shutil.copy2(src, dst)
+
+    def _compute_build_hash(self, platform_tag, cmd):
+        """Hash everything that affects the PyInstaller output"""
+        files = []
+        for name in self.CACHE_INPUTS:
+            path = self.project_root / name
+            if path.is_dir():
+                files.extend(entry.path for entry in self._walk_files(path, skip_dirs=("__pycache__",)))
+            elif path.is_file():
+                files.append(str(path))
+
+        build_hash = hashlib.sha256()
+        build_hash.update(platform_tag.encode())
+        build_hash.update(json.dumps(cmd).encode())
+        build_hash.update(sys.version.encode())
+        build_hash.update(json.dumps(self._installed_versions()).encode())
+
+        # Small-file reads are syscall bound and release the GIL, so digest
+        # them concurrently; sorting keeps the result independent of scheduling
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            digests = sorted(zip(files, executor.map(self._file_digest, files)))
+
+        for file_path, digest in digests:
+            build_hash.update(os.path.relpath(file_path, self.project_root).encode())
+            build_hash.update(digest)
+
+        return build_hash.hexdigest()
+
+    @staticmethod
+    def _installed_versions():
+        """name==version for every installed distribution, which PyInstaller bundles from"""
+        return sorted(
+            f"{dist.metadata['Name']}=={dist.version}" for dist in importlib.metadata.distributions()
+        )
+
+    @staticmethod
+    def _file_digest(file_path):
+        """SHA256 digest of one file, read in C where the interpreter allows"""
+        with open(file_path, "rb") as f:
+            if hasattr(hashlib, "file_digest"):  # Python 3.11+
+                return hashlib.file_digest(f, lambda: hashlib.sha256(usedforsecurity=False)).digest()
+
+            file_hash = hashlib.sha256(usedforsecurity=False)
+            while chunk := f.read(COPY_BUFFER_BYTES):
+                file_hash.update(chunk)
+            return file_hash.digest()
+
+    def _restore_cached_dist(self, build_hash, dist_root: Path):
+        """Copy a cached dist into place, returns True on a cache hit"""
+        cached = self.cache_dir / build_hash
+        if not self.use_cache or not cached.is_dir():
+            return False
 
-        # Clean previous builds
-        for dir_path in ["dist/windows", "build/windows"]:
-            shutil.rmtree(self.project_root / dir_path, ignore_errors=True)
-            (self.project_root / dir_path).mkdir(parents=True, exist_ok=True)
+        shutil.rmtree(dist_root, ignore_errors=True)
+        self._fast_copytree(cached, dist_root)
+        return True
 
-        # PyInstaller command with --onedir
-        icon_path = self.project_root / "assets" / "icon.ico"
-        icon_arg = ["--icon", str(icon_path)] if icon_path.exists() else []
+    def _store_cached_dist(self, build_hash, dist_root: Path):
+        """Save a fresh dist so the next build with the same inputs can reuse it"""
+        if not self.use_cache:
+            return
 
-        cmd = [
+        cached = self.cache_dir / build_hash
+        staging = cached.with_name(f"{build_hash}.tmp")
+        try:
+            shutil.rmtree(staging, ignore_errors=True)
+            self._fast_copytree(dist_root, staging)
+            os.replace(staging, cached)
+        except (OSError, subprocess.CalledProcessError) as e:
+            print(f"Could not cache build output: {e}")
+            shutil.rmtree(staging, ignore_errors=True)
+
+    def _run_pyinstaller(self, cmd, platform_tag):
+        """Run PyInstaller with its output going straight to a log file
+
+        Returns the exit code and the last lines of the log for error reports.
+        """
+        log_path = self.project_root / "logs" / f"pyinstaller-{platform_tag}.log"
+        log_path.parent.mkdir(parents=True, exist_ok=True)
+        print(f"PyInstaller log: {log_path}")
+
+        try:
+            # Imported here because setup_environment may only just have installed it
+            import PyInstaller.__main__ as pyinstaller_main
+        except ImportError:
+            pyinstaller_main = None
+
+        if pyinstaller_main is None:
+            # The child writes to the file itself, so no pipe has to be drained here
+            with open(log_path, "wb") as log_file:
+                returncode = subprocess.run(cmd, stdout=log_file, stderr=subprocess.STDOUT, cwd=self.project_root).returncode
+        else:
+            returncode = self._run_pyinstaller_in_process(pyinstaller_main, cmd[3:], log_path)
+
+        with open(log_path, "rb") as log_file:
+            log_file.seek(max(0, log_path.stat().st_size - 8192))
+            output_tail = log_file.read().decode(errors="replace").splitlines()[-20:]
+
+        return returncode, output_tail
+
+    def _run_pyinstaller_in_process(self, pyinstaller_main, args, log_path):
+        """Call PyInstaller directly, skipping a second interpreter start-up"""
+        import logging
+
+        handler = logging.FileHandler(log_path, mode="w", encoding="utf-8")
+        handler.setFormatter(logging.Formatter("%(relativeCreated)d %(levelname)s: %(message)s"))
+        logger = logging.getLogger("PyInstaller")
+        logger.addHandler(handler)
+
+        # The command only uses absolute paths, so the working directory,
+        # which is shared with every other thread, is left alone
+        try:
+            pyinstaller_main.run(args)
+            returncode = 0
+        except SystemExit as e:
+            returncode = e.code if isinstance(e.code, int) else 1
+        except Exception as e:
+            logger.error(f"PyInstaller raised an error: {e}")
+            returncode = 1
+        finally:
+            logger.removeHandler(handler)
+            handler.close()
+
+        return returncode
+
+    def _upx_compress(self, upx, dist_dir: Path):
+        """Pack the DLLs and extension modules in dist_dir with UPX, several at a time"""
+        binaries = [
+            entry.path for entry in self._walk_files(dist_dir)
+            if entry.name.lower().endswith((".dll", ".pyd"))
+            and entry.name.lower() not in self.UPX_EXCLUDE
+            and not entry.name.lower().startswith("python")
+        ]
+        print(f"Compressing {len(binaries)} binaries with UPX...")
+
+        # Each file is an independent UPX process, so threads only wait on them
+        def pack(path):
+            # UPX's default level, as PyInstaller itself would run it
+            return subprocess.run([str(upx), "-q", path], capture_output=True).returncode
+
+        with ThreadPoolExecutor(max_workers=os.cpu_count() or 4) as executor:
+            failed = sum(1 for returncode in executor.map(pack, binaries) if returncode != 0)
+
+        # UPX refuses files it cannot pack (e.g. Control Flow Guard DLLs) and leaves them intact
+        if failed:
+            print(f"   UPX skipped {failed} binaries")
+
+    def _collected_package_args(self):
+        """PyInstaller arguments that pull in everything from COLLECTED_PACKAGES
+
+        Like --collect-all, this bundles each package's submodules, data
+        files and shared libraries. Enumerating them means importing the
+        packages, which PyInstaller would redo on every build. The lists are
+        computed once per set of installed packages and handed to
+        PyInstaller through a hook instead.
+        """
+        hooks_dir = self.build_cache
+        req_key = hashlib.sha256(
+            (self.project_root / "requirements.txt").read_bytes()
+            + sys.version.encode()
+            + json.dumps(self._installed_versions()).encode()
+        ).hexdigest()[:12]
+        manifest = hooks_dir / f"collected-{req_key}.json"
+
+        if not manifest.exists():
+            print("Collecting package contents (cached until the installed packages change)...")
+            script = (
+                "import json, sys\n"
+                "from PyInstaller.utils.hooks import collect_data_files, collect_dynamic_libs, collect_submodules\n"
+                f"names = {list(self.COLLECTED_PACKAGES)!r}\n"
+                "json.dump({\n"
+                "    'hiddenimports': sorted({m for n in names for m in collect_submodules(n)}),\n"
+                "    'datas': sorted({d for n in names for d in collect_data_files(n)}),\n"
+                "    'binaries': sorted({b for n in names for b in collect_dynamic_libs(n)}),\n"
+                "}, sys.stdout)\n"
+            )
+            result = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True)
+            if result.returncode != 0:
+                print("Could not collect package contents, falling back to --collect-all")
+                return [arg for name in self.COLLECTED_PACKAGES for arg in ("--collect-all", name)]
+
+            hooks_dir.mkdir(parents=True, exist_ok=True)
+            manifest.write_text(result.stdout, encoding="utf-8")
+
+        # Hooks apply when their module is imported; entra_lense.py always imports modules
+        collected = json.loads(manifest.read_text(encoding="utf-8"))
+        # JSON turns the (source, destination) pairs into lists; hooks expect tuples
+        datas = [tuple(pair) for pair in collected["datas"]]
+        binaries = [tuple(pair) for pair in collected["binaries"]]
+        (hooks_dir / "hook-modules.py").write_text(
+            f"hiddenimports = {collected['hiddenimports']!r}\n"
+            f"datas = {datas!r}\n"
+            f"binaries = {binaries!r}\n",
+            encoding="utf-8"
+        )
+
+        return ["--additional-hooks-dir", str(hooks_dir)]
+
+    def _pyinstaller_cmd(self, platform_tag, sep, extra_args=()):
+        """PyInstaller --onedir command shared by the platform builds
+
+        sep is the --add-data separator PyInstaller expects on that platform.
+        Every path is absolute, so the result does not depend on the working
+        directory it runs in.
+        """
+        root = self.project_root
+        # modules/ is not added: PyInstaller compiles it into the PYZ archive
+        add_data = [f"{root / 'config'}{sep}config", f"{root / 'data'}{sep}data"]
+        if (root / ".env").exists():
+            add_data.append(f"{root / '.env'}{sep}.")
+
+        return [
             sys.executable, "-m", "PyInstaller",
             "--name", "EntraLense",
             "--onedir",
             "--console",
-            "--clean",
-            "--distpath", "dist/windows",
-            "--workpath", "build/windows",
-            "--add-data", "modules;modules",
-            "--add-data", "config;config",
-            "--add-data", "data;data",
-            *(["--add-data", ".env;."] if Path(".env").exists() else []),
-            "--add-data", "SecurityCompliancePortal.ps1;.",
-            "--hidden-import", "azure.identity",
-            "--hidden-import", "azure.identity._internal",
-            "--hidden-import", "azure.identity._credentials",
-            "--hidden-import", "azure.identity._credentials.browser",
-            "--hidden-import", "azure.identity._credentials.client_secret",
-            "--hidden-import", "msgraph",
-            "--hidden-import", "msgraph.generated",
-            "--hidden-import", "msgraph.generated.users",
-            "--hidden-import", "msgraph.generated.models",
-            "--hidden-import", "pandas",
-            "--hidden-import", "pandas._libs",
-            "--hidden-import", "pandas._libs.tslibs",
-            "--hidden-import", "colorama",
-            "--hidden-import", "aiohttp",
-            "--hidden-import", "aiohttp.client",
-            "--hidden-import", "charset_normalizer",
-            "--hidden-import", "dotenv",
-            "--hidden-import", "python_dotenv",
-            "--collect-all", "charset_normalizer",
-            "--collect-all", "azure.identity",
-            "--collect-all", "msgraph",
-            *(["--upx-dir", "UPX"] if (self.project_root / "UPX").exists() else []),
-            *icon_arg,
-            "entra_lense.py"
+            "--noconfirm",
+            *(["--clean"] if self.clean else []),
+            "--distpath", str(self.dist / platform_tag),
+            "--workpath", str(root / "build" / platform_tag),
+            "--specpath", str(root),
+            *[arg for data in add_data for arg in ("--add-data", data)],
+            *[arg for name in self.HIDDEN_IMPORTS for arg in ("--hidden-import", name)],
+            *self._collected_package_args(),
+            *[arg for name in self.EXCLUDED_MODULES for arg in ("--exclude-module", name)],
+            *extra_args,
+            str(root / "entra_lense.py")
         ]
 
-        # Filter out None values
-        cmd = [x for x in cmd if x is not None]
+    def build_windows(self):
+        """Build Windows executable"""
+        print("\n" + "="*60)
+        print("Building Windows Executable (--onedir)")
+        print("="*60)
+
+        # Clean previous output; the work dir is kept between builds so
+        # PyInstaller can reuse its cached analysis unless --clean is given
+        dirs_to_clean = [self.dist_win, self.build_win] if self.clean else [self.dist_win]
+        for dir_path in dirs_to_clean:
+            self._async_purge(dir_path)
+
+        # Host bytecode caches would otherwise be bundled by --add-data
+        self._remove_pycache()
+
+        # Windows-only extras on top of the shared command
+        extra_args = ["--add-data", f"{self.project_root / 'SecurityCompliancePortal.ps1'};."]
+        upx_dir = self.project_root / "UPX"
+        upx = shutil.which("upx", path=str(upx_dir)) if upx_dir.exists() else None
+        if upx:
+            # Binaries are packed afterwards in parallel rather than one by one
+            extra_args.append("--noupx")
+        elif upx_dir.exists():
+            # No upx executable found there; leave the directory to PyInstaller
+            extra_args += ["--upx-dir", str(upx_dir)]
+        if self.icon_ico.exists():
+            extra_args += ["--icon", str(self.icon_ico)]
+
+        cmd = self._pyinstaller_cmd("windows", ";", extra_args)
+
+        dist_root = self.dist_win
+        build_hash = self._compute_build_hash("windows", cmd)
+
+        if self._restore_cached_dist(build_hash, dist_root):
+            print(f"Reusing cached build {build_hash[:12]} (set ENTRALENSE_NO_CACHE=1 to rebuild)")
+            success = True
+        else:
+            print("Running PyInstaller...")
+            print(f"Command: {' '.join(cmd[:10])}...")
 
-        print("Running PyInstaller...")
-        print(f"Command: {' '.join(cmd[:10])}...")
+            returncode, output_tail = self._run_pyinstaller(cmd, "windows")
+            success = returncode == 0
 
-        result = subprocess.run(cmd, capture_output=True, text=True, cwd=self.project_root)
+            if success:
+                if upx:
+                    self._upx_compress(upx, dist_root / "EntraLense")
+                self._store_cached_dist(build_hash, dist_root)
+            else:
+                print("Windows build failed!")
+                print("\n".join(output_tail))
 
-        if result.returncode == 0:
+        if success:
             print("Windows build successful!")
 
             # Find the distribution directory
-            dist_dir = self.project_root / "dist" / "windows" / "EntraLense"
+            dist_dir = self.dist_win / "EntraLense"
             if dist_dir.exists():
-                # Calculate total size
-                total_size = sum(f.stat().st_size for f in dist_dir.rglob('*') if f.is_file())
-                size_mb = total_size / (1024*1024)
-
                 print(f"Distribution: {dist_dir.name}/")
-                print(f"Total Size: {size_mb:.1f} MB")
                 print(f"Location: {dist_dir.parent}")
 
-                # Create portable package
-                self.create_windows_portable(dist_dir)
+                # Create portable package; its walk over dist_dir also totals the size
+                total_size = self.create_windows_portable(dist_dir)
+                size_mb = total_size / (1024*1024)
+                print(f"Total Size: {size_mb:.1f} MB")
 
                 return True
-        else:
-            print("Windows build failed!")
-            print("STDOUT:", result.stdout[-500:])
-            print("STDERR:", result.stderr[-500:])
 
         return False
 
     def create_windows_portable(self, dist_dir: Path):
-        """Create portable Windows package from --onedir build"""
+        """Create portable Windows package from --onedir build
+
+        Returns the total size in bytes of the distribution directory.
+        """
         print("\nCreating portable package...")
 
-        portable_dir = self.project_root / "dist" / "EntraLense_Windows_Portable"
+        portable_dir = self.dist / "EntraLense_Windows_Portable"
         shutil.rmtree(portable_dir, ignore_errors=True)
-        portable_dir.mkdir(parents=True, exist_ok=True)
 
-        # Copy entire distribution directory
-        shutil.copytree(dist_dir, portable_dir / "EntraLense", dirs_exist_ok=True)
+        seven_zip = shutil.which("7z") or shutil.which("7za")
+        if self.archive_format == "tar.zst" or seven_zip:
+            # External archivers need the whole package on disk. Hard links
+            # make that cheap; the tree is only read and deleted afterwards.
+            # Staged first, as copytree needs a destination that does not exist yet.
+            self._link_tree(dist_dir, portable_dir / "EntraLense")
 
         # Ensure config and data directories exist
-        (portable_dir / "EntraLense" / "config").mkdir(exist_ok=True)
+        (portable_dir / "EntraLense" / "config").mkdir(parents=True, exist_ok=True)
         (portable_dir / "EntraLense" / "data").mkdir(exist_ok=True)
 
         # Create exports and logs directories in parent
@@ -199,73 +674,151 @@ class EntraLenseBuilder:
         (portable_dir / "logs").mkdir(exist_ok=True)
 
         # Create README
-        readme_content = f"""# EntraLense - Windows Portable Version {self.version}
+        (portable_dir / "README.txt").write_bytes(self._readme_win)
 
-## Quick Start
-1. Double-click `Launch.bat` or run `EntraLense\\EntraLense.exe`
-2. Enter your Azure credentials when prompted
-3. Use the menu to generate reports
+        # Create batch file launcher
+        (portable_dir / "Launch.bat").write_bytes(self._launch_bat)
+
+        # Create archive
+        archive_path = None
+        if self.archive_format == "tar.zst":
+            archive_path = self._write_tar_zst(portable_dir)
+        elif seven_zip:
+            archive_path = self._write_7z_zip(seven_zip, portable_dir)
+
+        if archive_path is None:
+            # zipfile takes entries straight from dist_dir, so nothing is staged
+            archive_path, total_size = self._write_zip(portable_dir, dist_dir)
+        else:
+            total_size = self._tree_size(dist_dir)
 
-## Directory Structure
-- `EntraLense/` - Application files (DO NOT MODIFY)
-- `exports/` - CSV reports will be saved here
-- `logs/` - Application logs for troubleshooting
-- `Launch.bat` - Easy launcher
+        print(f"Portable package: {archive_path.name}")
+        print(f"Package size: {archive_path.stat().st_size / (1024*1024):.1f} MB")
 
-## Azure Setup Required
-Before first use, you need:
-1. Azure Tenant ID
-2. Azure Client ID
-3. (Optional) Client Secret
+        # Clean up
+        shutil.rmtree(portable_dir, ignore_errors=True)
 
-Get these from: https://portal.azure.com > Azure AD > App registrations
+        return total_size
 
-## Troubleshooting
-If the app fails to start:
-1. Check `logs/` folder for error details
-2. From the menu, press 'L' to open logs folder
-3. Ensure you're running as Administrator if needed
+    def _zip_path(self):
+        """Location of the portable ZIP package"""
+        return self.dist / f"EntraLense_Windows_v{self.version}.zip"
 
-## Support
-Email: stephen.cantoria@thisbyte.com
+    def _write_7z_zip(self, seven_zip, portable_dir: Path):
+        """Archive the staged portable directory with 7-Zip, or return None"""
+        zip_path = self._zip_path()
+        zip_path.unlink(missing_ok=True)
 
----
-EntraLense v{self.version} | The Full Stack and Beneath
-"""
+        # zipfile deflates on a single core; 7-Zip compresses entries in parallel
+        result = subprocess.run([
+            seven_zip, "a", "-tzip", "-mx=1", "-mmt=on", "-bso0", "-bsp0",
+            str(zip_path), portable_dir.name
+        ], cwd=portable_dir.parent)
+        if result.returncode == 0:
+            return zip_path
 
-        (portable_dir / "README.txt").write_text(readme_content, encoding="utf-8")
+        print("7-Zip failed, falling back to zipfile...")
+        zip_path.unlink(missing_ok=True)
+        return None
 
-        # Create batch file launcher
-        batch_content = f"""@echo off
-title EntraLense v{self.version}
-echo ========================================
-echo EntraLense - Azure AD Audit Tool
-echo Version {self.version}
-echo ========================================
-echo.
-echo Starting EntraLense...
-echo.
-cd /d "%~dp0"
-start "" "EntraLense\\EntraLense.exe"
-"""
+    def _write_zip(self, portable_dir: Path, dist_dir: Path):
+        """Archive the portable directory as a ZIP, with dist_dir as its EntraLense folder
 
-        (portable_dir / "Launch.bat").write_text(batch_content)
+        Returns the archive path and the total size of dist_dir.
+        """
+        zip_path = self._zip_path()
+        zip_path.unlink(missing_ok=True)
 
-        # Create ZIP archive
-        import zipfile
-        zip_path = self.project_root / "dist" / f"EntraLense_Windows_v{self.version}.zip"
+        # The package skeleton first, then the distribution. Any staged copy
+        # of the distribution (left by a failed archiver) is skipped.
+        sources = [
+            (portable_dir, portable_dir.name, ("EntraLense",)),
+            (dist_dir, f"{portable_dir.name}/EntraLense", ()),
+        ]
+
+        # A reader thread stats and reads small files ahead of the compressor,
+        # so disk latency overlaps with deflate (zlib releases the GIL)
+        pending = queue.Queue(maxsize=16)
+        reader = threading.Thread(target=self._read_ahead, args=(sources, pending), daemon=True)
+        reader.start()
+
+        # Binaries barely shrink past level 1, so only text files get level 6
+        try:
+            with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED, compresslevel=1) as zipf:
+                while not isinstance(item := pending.get(), int):
+                    if isinstance(item, Exception):
+                        raise item
+                    path, zinfo, data = item
+
+                    suffix = os.path.splitext(path)[1].lower()
+                    level = 6 if suffix in self.TEXT_SUFFIXES else 1
+
+                    if data is not None:
+                        zipf.writestr(zinfo, data, compresslevel=level)
+                    else:
+                        # ZipFile.write streams the file, so memory stays flat
+                        zipf.write(path, zinfo.filename, zinfo.compress_type, level)
+        finally:
+            # Unblock the reader if the archive failed part way through
+            while reader.is_alive():
+                try:
+                    pending.get(timeout=0.1)
+                except queue.Empty:
+                    pass
+
+        return zip_path, item
+
+    def _read_ahead(self, sources, pending):
+        """Queue (path, ZipInfo, data) for every file in sources, then the last root's size
+
+        sources holds (root, archive prefix, skipped directories) tuples. Files
+        up to READ_AHEAD_BYTES are read here; data is None for larger ones,
+        which the consumer streams so memory stays flat. Any error is queued
+        for the consumer to raise, ahead of the size it always waits for.
+        """
+        total_size = 0
+        try:
+            for root, prefix, skip_dirs in sources:
+                root_str = str(root)
+                total_size = 0
+                for entry in self._walk_files(root, skip_dirs):
+                    arcname = f"{prefix}/{os.path.relpath(entry.path, root_str)}"
+                    zinfo = zipfile.ZipInfo.from_file(entry.path, arcname)
+                    total_size += zinfo.file_size
+                    if os.path.splitext(entry.name)[1].lower() in self.STORED_SUFFIXES:
+                        zinfo.compress_type = zipfile.ZIP_STORED
+                    else:
+                        zinfo.compress_type = zipfile.ZIP_DEFLATED
+
+                    data = None
+                    if zinfo.file_size <= READ_AHEAD_BYTES:
+                        with open(entry.path, "rb") as src:
+                            data = src.read()
+                    pending.put((entry.path, zinfo, data))
+        except Exception as e:
+            # Not just OSError: ZipInfo.from_file raises ValueError for pre-1980 mtimes
+            pending.put(e)
+            total_size = 0
+        finally:
+            pending.put(total_size)
+
+    def _write_tar_zst(self, portable_dir: Path):
+        """Archive the portable directory as a multithreaded zstd tarball"""
+        try:
+            import zstandard
+        except ImportError:
+            print("Install zstandard for .tar.zst packages: pip install zstandard")
+            print("   Falling back to ZIP...")
+            return None
 
-        with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-            for file_path in portable_dir.rglob("*"):
-                if file_path.is_file():
-                    arcname = file_path.relative_to(portable_dir.parent)
-                    zipf.write(file_path, arcname)
+        tar_path = self.dist / f"EntraLense_Windows_v{self.version}.tar.zst"
+        cctx = zstandard.ZstdCompressor(level=3, threads=-1)
 
-        print(f"Portable package: {zip_path.name}")
-        print(f"Package size: {zip_path.stat().st_size / (1024*1024):.1f} MB")
+        with open(tar_path, "wb") as fh, cctx.stream_writer(fh) as zf:
+            with tarfile.open(mode="w|", fileobj=zf) as tf:
+                tf.add(portable_dir, arcname=portable_dir.name)
 
-        # Clean up
-        shutil.rmtree(portable_dir, ignore_errors=True)
+        return tar_path
 
     def build_macos(self):
         """Build macOS executable"""
@@ -273,70 +826,52 @@ start "" "EntraLense\\EntraLense.exe"
         print("Building macOS Application (--onedir)")
         print("="*60)
 
-        if platform.system() != "Darwin":
+        if PLATFORM != "Darwin":
             print("macOS builds must be created on macOS")
             print("   Skipping macOS build...")
             return False
 
-        # Clean previous builds
-        for dir_path in ["dist/macos", "build/macos"]:
-            shutil.rmtree(self.project_root / dir_path, ignore_errors=True)
-            (self.project_root / dir_path).mkdir(parents=True, exist_ok=True)
+        # Clean previous output; the work dir is kept between builds so
+        # PyInstaller can reuse its cached analysis unless --clean is given
+        dirs_to_clean = [self.dist_mac, self.build_mac] if self.clean else [self.dist_mac]
+        for dir_path in dirs_to_clean:
+            self._async_purge(dir_path)
+
+        # Host bytecode caches would otherwise be bundled by --add-data
+        self._remove_pycache()
 
         # Build with PyInstaller
-        cmd = [
-            sys.executable, "-m", "PyInstaller",
-            "--name", "EntraLense",
-            "--onedir",
-            "--console",
-            "--clean",
-            "--distpath", "dist/macos",
-            "--workpath", "build/macos",
-            "--add-data", "modules:modules",
-            "--add-data", "config:config",
-            "--add-data", "data:data",
-            *(["--add-data", ".env:."] if Path(".env").exists() else []),
-            "--hidden-import", "azure.identity",
-            "--hidden-import", "azure.identity._internal",
-            "--hidden-import", "azure.identity._credentials",
-            "--hidden-import", "azure.identity._credentials.browser",
-            "--hidden-import", "azure.identity._credentials.client_secret",
-            "--hidden-import", "msgraph",
-            "--hidden-import", "msgraph.generated",
-            "--hidden-import", "msgraph.generated.users",
-            "--hidden-import", "msgraph.generated.models",
-            "--hidden-import", "pandas",
-            "--hidden-import", "pandas._libs",
-            "--hidden-import", "pandas._libs.tslibs",
-            "--hidden-import", "colorama",
-            "--hidden-import", "aiohttp",
-            "--hidden-import", "aiohttp.client",
-            "--hidden-import", "charset_normalizer",
-            "--hidden-import", "dotenv",
-            "--hidden-import", "python_dotenv",
-            "--collect-all", "charset_normalizer",
-            "--collect-all", "azure.identity",
-            "--collect-all", "msgraph",
-            "entra_lense.py"
-        ]
+        cmd = self._pyinstaller_cmd("macos", ":")
 
-        # Filter out None values
-        cmd = [x for x in cmd if x is not None]
+        dist_root = self.dist_mac
+        build_hash = self._compute_build_hash("macos", cmd)
 
-        print("Running PyInstaller...")
-        result = subprocess.run(cmd, capture_output=True, text=True, cwd=self.project_root)
+        if self._restore_cached_dist(build_hash, dist_root):
+            print(f"Reusing cached build {build_hash[:12]} (set ENTRALENSE_NO_CACHE=1 to rebuild)")
+            success = True
+        else:
+            print("Running PyInstaller...")
+            returncode, output_tail = self._run_pyinstaller(cmd, "macos")
+            success = returncode == 0
 
-        if result.returncode == 0:
+            if success:
+                self._store_cached_dist(build_hash, dist_root)
+            else:
+                print("macOS build failed!")
+                print("\n".join(output_tail))
+
+        if success:
             print("macOS build successful!")
 
             # Clean up build directory to free disk space before packaging
-            shutil.rmtree(self.project_root / "build" / "macos", ignore_errors=True)
+            if self.clean:
+                shutil.rmtree(self.build_mac, ignore_errors=True)
 
             # Find the distribution directory
-            dist_dir = self.project_root / "dist" / "macos" / "EntraLense"
+            dist_dir = self.dist_mac / "EntraLense"
             if dist_dir.exists():
                 # Calculate total size
-                total_size = sum(f.stat().st_size for f in dist_dir.rglob('*') if f.is_file())
+                total_size = self._tree_size(dist_dir)
                 size_mb = total_size / (1024*1024)
 
                 print(f"Distribution: {dist_dir.name}/")
@@ -351,9 +886,6 @@ start "" "EntraLense\\EntraLense.exe"
                 self.create_macos_dmg(dist_dir)
 
                 return True
-        else:
-            print("macOS build failed!")
-            print("STDERR:", result.stderr[-500:])
 
         return False
 
@@ -364,67 +896,42 @@ start "" "EntraLense\\EntraLense.exe"
         try:
             # Create .app bundle structure
             app_name = "EntraLense.app"
-            app_path = self.project_root / "dist" / app_name
+            app_path = self.dist / app_name
 
             # Clean up old .app
             shutil.rmtree(app_path, ignore_errors=True)
 
-            # Create .app structure
-            (app_path / "Contents" / "MacOS").mkdir(parents=True, exist_ok=True)
+            # Create .app structure; Contents/MacOS is created by the copy below
             (app_path / "Contents" / "Resources").mkdir(parents=True, exist_ok=True)
 
             # Copy entire distribution directory into .app bundle
-            shutil.copytree(dist_dir, app_path / "Contents" / "MacOS" / "EntraLense", dirs_exist_ok=True)
+            self._fast_copytree(dist_dir, app_path / "Contents" / "MacOS" / "EntraLense")
 
             # Create launcher script that runs the executable
-            launcher_script = """#!/bin/bash
-cd "$(dirname "$0")/EntraLense"
-./EntraLense
-"""
             launcher_path = app_path / "Contents" / "MacOS" / "launcher.sh"
-            launcher_path.write_text(launcher_script)
+            launcher_path.write_bytes(self._launcher_sh)
             os.chmod(launcher_path, 0o755)
 
             # Create Info.plist pointing to launcher
-            plist_content = f"""<?xml version="1.0" encoding="UTF-8"?>
-<!DOCTYPE plist PUBLIC "-//Apple//DTD PLIST 1.0//EN" "http://www.apple.com/DTDs/PropertyList-1.0.dtd">
-<plist version="1.0">
-<dict>
-    <key>CFBundleName</key>
-    <string>EntraLense</string>
-    <key>CFBundleDisplayName</key>
-    <string>EntraLense</string>
-    <key>CFBundleIdentifier</key>
-    <string>com.thisbyte.entralense</string>
-    <key>CFBundleVersion</key>
-    <string>{self.version}</string>
-    <key>CFBundleShortVersionString</key>
-    <string>{self.version}</string>
-    <key>CFBundleExecutable</key>
-    <string>launcher.sh</string>
-    <key>LSMinimumSystemVersion</key>
-    <string>11.0</string>
-    <key>NSHumanReadableCopyright</key>
-    <string>Copyright 2026 ThisByte, LLC. All rights reserved.</string>
-</dict>
-</plist>
-"""
-
-            (app_path / "Contents" / "Info.plist").write_text(plist_content)
+            (app_path / "Contents" / "Info.plist").write_bytes(self._info_plist)
 
             # Create DMG using hdiutil
             dmg_name = f"EntraLense_v{self.version}.dmg"
-            dmg_path = self.project_root / "dist" / dmg_name
+            dmg_path = self.dist / dmg_name
 
             # Remove old DMG
             dmg_path.unlink(missing_ok=True)
 
             # Create DMG
+            # zlib level 1 compresses much faster than the default with a
+            # similar size, and skipping Spotlight indexing saves another pass
             subprocess.run([
                 "hdiutil", "create",
                 "-volname", "EntraLense",
                 "-srcfolder", str(app_path),
                 "-ov", "-format", "UDZO",
+                "-imagekey", "zlib-level=1",
+                "-nospotlight",
                 str(dmg_path)
             ], check=True)
 
@@ -441,20 +948,16 @@ cd "$(dirname "$0")/EntraLense"
         """Clear credentials before building"""
         print("\nClearing build credentials...")
 
-        # Run the clearing script
+        # Run the clearing script in-process; it is too small to justify a new interpreter
         clear_script = self.project_root / "clear_build_credentials.py"
 
         if clear_script.exists():
-            result = subprocess.run(
-                [sys.executable, str(clear_script)],
-                capture_output=True,
-                text=True
-            )
-
-            print(result.stdout)
+            if str(self.project_root) not in sys.path:
+                sys.path.insert(0, str(self.project_root))
+            from clear_build_credentials import clear_credentials
 
-            if result.returncode != 0:
-                print(f"Credential clearing failed: {result.stderr}")
+            if not clear_credentials():
+                print("Credential clearing failed")
                 return False
         else:
             print("clear_build_credentials.py not found")
@@ -468,27 +971,39 @@ cd "$(dirname "$0")/EntraLense"
         print("\n" + "="*60)
         print("EntraLense Build System")
         print(f"   Version: {self.version}")
-        print(f"   Platform: {platform.system()}")
+        print(f"   Platform: {PLATFORM}")
         print(f"   Mode: --onedir")
         print("="*60)
 
-        self.setup_environment()
-        self.create_icons()
+        # Installing build tools is network bound, so prepare icons and
+        # credentials while pip runs
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            setup = executor.submit(self.setup_environment)
+
+            self.create_icons()
+
+            # Clear credentials before building
+            if not self.clear_build_credentials():
+                print("Warning: Could not clear credentials")
+                print("   Continuing with build...")
 
-        # Clear credentials before building
-        if not self.clear_build_credentials():
-            print("Warning: Could not clear credentials")
-            print("   Continuing with build...")
+            try:
+                setup.result()
+            except subprocess.CalledProcessError as e:
+                # pip has already printed why; the build may still work with
+                # the tools that are installed, as it did before the check
+                print(f"Warning: Installing build tools failed (pip exited with {e.returncode})")
+                print("   Continuing with build...")
 
         results = {}
 
         # Build for current platform
-        if platform.system() == "Windows":
+        if PLATFORM == "Windows":
             results["Windows"] = self.build_windows()
-        elif platform.system() == "Darwin":
+        elif PLATFORM == "Darwin":
             results["macOS"] = self.build_macos()
         else:
-            print(f"Unsupported platform: {platform.system()}")
+            print(f"Unsupported platform: {PLATFORM}")
 
         # Summary
         print("\n" + "="*60)
@@ -508,5 +1023,19 @@ cd "$(dirname "$0")/EntraLense"
 
 
 if __name__ == "__main__":
-    builder = EntraLenseBuilder()
+    parser = argparse.ArgumentParser(description="Build EntraLense for the current platform")
+    parser.add_argument(
+        "--archive-format",
+        choices=["zip", "tar.zst"],
+        default="zip",
+        help="Portable package format (tar.zst needs the zstandard package)"
+    )
+    parser.add_argument(
+        "--clean",
+        action="store_true",
+        help="Discard PyInstaller's work directory and the build cache for a full rebuild"
+    )
+    args = parser.parse_args()
+
+    builder = EntraLenseBuilder(archive_format=args.archive_format, clean=args.clean)
     builder.build_all()
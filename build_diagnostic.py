@@ -6,22 +6,27 @@ This version prints extensive debugging information before starting the app.
 import os
 import sys
 import platform
+from importlib.util import find_spec
 from pathlib import Path
 
-def diagnostic_startup():
-    """Print diagnostic information on startup"""
+def diagnostic_startup(deep_check=False):
+    """Print diagnostic information on startup
+
+    Packages are only located, not imported, unless deep_check is set.
+    """
     print("=" * 80)
     print("EntraLense Diagnostic Build")
     print("=" * 80)
     print(f"\nPlatform: {platform.system()} {platform.release()}")
     print(f"Python: {sys.version}")
     print(f"Executable: {sys.executable}")
-    print(f"Frozen: {getattr(sys, 'frozen', False)}")
+    frozen = getattr(sys, 'frozen', False)
+    print(f"Frozen: {frozen}")
 
     # Determine base path
-    if getattr(sys, 'frozen', False):
+    if frozen:
         # Running as compiled executable
-        base_path = Path(sys._MEIPASS)  # PyInstaller temp directory
+        base_path = Path(sys._MEIPASS)  # Bundle contents (_internal/ in --onedir builds)
         app_path = Path(sys.executable).parent
     else:
         # Running as script
@@ -45,16 +50,24 @@ def diagnostic_startup():
         ('requirements.txt', 'requirements.txt')
     ]
 
+    # List each candidate directory once instead of probing every path;
+    # base_path and app_path are the same directory when not frozen
+    candidates = [base_path, app_path, Path.cwd()]
+    listings = {}
+    for directory in candidates:
+        if directory not in listings:
+            try:
+                listings[directory] = {entry.name for entry in os.scandir(directory)}
+            except OSError:
+                listings[directory] = set()
+
     for rel_path, description in critical_paths:
-        check_locations = [
-            base_path / rel_path,
-            app_path / rel_path,
-            Path.cwd() / rel_path
-        ]
+        name = rel_path.rstrip('/')
+        check_locations = [directory / rel_path for directory in candidates]
 
         found = False
-        for location in check_locations:
-            if location.exists():
+        for directory, location in zip(candidates, check_locations):
+            if name in listings[directory]:
                 print(f"  Found {description}: {location}")
                 found = True
                 break
@@ -92,7 +105,12 @@ def diagnostic_startup():
 
     for package in required_packages:
         try:
-            __import__(package)
+            # find_spec imports parent packages only, never the module itself
+            if find_spec(package) is None:
+                print(f"  {package}: MISSING")
+                continue
+            if deep_check:
+                __import__(package)
             print(f"  {package}")
         except ImportError as e:
             print(f"  {package}: {e}")
@@ -103,7 +121,7 @@ def diagnostic_startup():
     input()
 
 if __name__ == "__main__":
-    diagnostic_startup()
+    diagnostic_startup(deep_check="--deep-check" in sys.argv)
 
     # Import and run the main app
     try:
@@ -4,6 +4,7 @@ Clear credentials from config files before building production releases.
 This ensures test credentials don't end up in distributed executables.
 """
 import json
+import re
 from pathlib import Path
 import sys
 
@@ -47,20 +48,30 @@ def clear_credentials():
     
     try:
         # Load existing config
-        with open(config_file, 'r') as f:
-            config = json.load(f)
+        original_text = config_file.read_text(encoding='utf-8')
+        config = json.loads(original_text)
         
         # Clear sensitive fields
         original_tenant = config.get('tenant_id', '')
         original_client = config.get('client_id', '')
         
-        config['tenant_id'] = ""
-        config['client_id'] = ""
-        config['client_secret'] = None
+        # Patch the values in place so the rest of the file keeps its bytes
+        json_string = r'"(?:[^"\\]|\\.)*"'
+        text = re.sub(rf'"tenant_id"\s*:\s*{json_string}', '"tenant_id": ""', original_text)
+        text = re.sub(rf'"client_id"\s*:\s*{json_string}', '"client_id": ""', text)
+        text = re.sub(rf'"client_secret"\s*:\s*(?:{json_string}|null)', '"client_secret": null', text)
         
-        # Save cleared config
-        with open(config_file, 'w') as f:
-            json.dump(config, f, indent=2)
+        patched = json.loads(text)
+        if (patched.get('tenant_id'), patched.get('client_id'), patched.get('client_secret', '')) != ("", "", None):
+            # Missing or oddly typed fields: fall back to rewriting the whole file
+            config['tenant_id'] = ""
+            config['client_id'] = ""
+            config['client_secret'] = None
+            text = json.dumps(config, indent=2)
+        
+        # An unchanged file keeps its mtime, so build caches stay valid
+        if text != original_text:
+            config_file.write_text(text, encoding='utf-8')
         
         print(f"[OK] Credentials cleared from: {config_file}")
         
@@ -4,14 +4,25 @@ EntraLense - Azure AD User Activity & Security Audit Tool
 Command-line tool for compliance and security teams.
 CSV-focused output with filtering options.
 """
+from __future__ import annotations
 
 import asyncio
-import subprocess
+import csv
+import os
 import sys
+import time
+import traceback
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import partial, wraps
+from operator import itemgetter
 from pathlib import Path
-from typing import Optional
-import pandas as pd
+from typing import Optional, TYPE_CHECKING
+
+# pandas is only needed inside the report methods, which import it themselves
+if TYPE_CHECKING:
+    import pandas as pd
 
 # Add project root to path
 project_root = Path(__file__).parent
@@ -27,6 +38,297 @@ from modules.entralense_logger import get_global_logger, open_logs_folder
 
 logger = get_global_logger()
 
+# Section dividers used throughout the console output
+_SEP60 = "=" * 60
+_SEP80 = "=" * 80
+_RULE40 = "-" * 40
+_RULE60 = "-" * 60
+
+# Long enough to read a one-line message before a menu clears the screen
+_MESSAGE_PAUSE = 0.3
+
+# Display order, label and message color (None for plain text) of each warranty status
+_WARRANTY_STYLES = (
+    ("active", "Active", "success"),
+    ("expired", "Expired", "red"),
+    ("expiring_soon", "Expiring Soon", "yellow"),
+    ("none", "None", None),
+    ("unknown", "Unknown", None),
+)
+
+# Fields of a devices_needing_attention entry, fetched in one call per device
+_ATTENTION_DEVICE_FIELDS = itemgetter("device_name", "os", "version", "issues")
+
+# Compliance score bands in display order, as (distribution key, label, color)
+_COMPLIANCE_BANDS = (
+    ("excellent_90_100", "Excellent (90-100%)", "success"),
+    ("good_80_89", "Good (80-89%)", None),
+    ("fair_70_79", "Fair (70-79%)", "yellow"),
+    ("poor_60_69", "Poor (60-69%)", "yellow"),
+    ("critical_below_60", "Critical (<60%)", "red"),
+)
+
+# Write buffer for exported files, so large exports reach the disk in few syscalls
+EXPORT_BUFFER_BYTES = 4 * 1024 * 1024
+
+
+# Rows per batch handed to Arrow's CSV writer
+ARROW_CSV_BATCH_ROWS = 8192
+
+# Rows converted to text at a time, so an export never holds every cell as a string
+CSV_CHUNK_ROWS = 50_000
+
+
+def _csv_text(column: pd.Series):
+    """Cell text of column as pandas' CSV writer renders it, with missing values empty"""
+    import numpy as np
+
+    if isinstance(column.dtype, np.dtype) and column.dtype.kind in "biu":
+        # NumPy bool and integer columns cannot hold NaN, so skip the missing-value
+        # mask; the nullable Int64/boolean dtypes can hold pd.NA and still need it
+        return column.astype(str).to_numpy()
+    return column.astype(object).where(column.notna(), "").astype(str).to_numpy()
+
+
+def fast_to_csv(df: pd.DataFrame, path) -> Path:
+    """Write df like df.to_csv(path, index=False, encoding='utf-8-sig'), returning path
+
+    Cells are converted to text a column at a time, so values read the same as
+    pandas writes them, and CSV_CHUNK_ROWS rows at a time, so memory stays
+    bounded on large tenants. With pyarrow installed each chunk is streamed
+    through Arrow's CSV writer; otherwise it goes through csv.writer.writerows.
+    """
+    # One pass even for an empty frame, so the header is still written
+    starts = range(0, len(df), CSV_CHUNK_ROWS) or [0]
+    chunks = (df.iloc[start:start + CSV_CHUNK_ROWS] for start in starts)
+
+    try:
+        import pyarrow as pa
+        import pyarrow.csv as pa_csv
+    except ImportError:
+        pa = None
+
+    if pa is not None:
+        schema = pa.schema([(str(col), pa.string()) for col in df.columns])
+        with open(path, "wb", buffering=EXPORT_BUFFER_BYTES) as f:
+            f.write(b"\xef\xbb\xbf")
+            with pa_csv.CSVWriter(f, schema, write_options=pa_csv.WriteOptions(batch_size=ARROW_CSV_BATCH_ROWS)) as writer:
+                for chunk in chunks:
+                    writer.write_table(pa.Table.from_arrays(
+                        [pa.array(_csv_text(chunk[col]), type=pa.string()) for col in chunk.columns], schema=schema
+                    ))
+        return path
+
+    with open(path, "w", encoding="utf-8-sig", newline="", buffering=EXPORT_BUFFER_BYTES) as f:
+        writer = csv.writer(f, quoting=csv.QUOTE_MINIMAL, lineterminator="\n")
+        writer.writerow(df.columns)
+        for chunk in chunks:
+            writer.writerows(zip(*(_csv_text(chunk[col]) for col in chunk.columns)))
+    return path
+
+
+# Rows shown in a console table before the rest is left to the export
+MAX_TTY_ROWS = 200
+
+# Rows formatted and written per to_string call when printing a full table
+PRINT_PAGE_ROWS = 500
+
+
+def _float_formatter(column: pd.Series):
+    """Fixed-point formatter for a float column, with the decimals to_string would pick
+
+    to_string chooses one number of decimals per column from the values it
+    formats, so pages formatted separately would disagree; this chooses it
+    from the whole column instead.
+    """
+    import numpy as np
+    import pandas as pd
+
+    precision = pd.get_option("display.precision")
+    values = column.to_numpy(dtype=float, na_value=np.nan)
+    finite = np.round(values[np.isfinite(values)], precision)
+    decimals = next(
+        (d for d in range(1, precision + 1) if np.array_equal(np.round(finite, d), finite)), precision
+    )
+    return lambda value: "NaN" if value != value else f"{value:.{decimals}f}"
+
+
+def print_df(df: pd.DataFrame, columns=None, max_rows: Optional[int] = None,
+             page: int = PRINT_PAGE_ROWS) -> None:
+    """Print columns of df in pandas' to_string(index=False) format, at most max_rows rows
+
+    Every report table goes through here so they share pandas' formatting.
+    to_string builds its whole result before writing it, so tables longer
+    than page rows are formatted a page at a time. Float formats and column
+    widths come from all rows up front, so the pages line up as one table.
+    """
+    import numpy as np
+
+    capped = max_rows is not None and len(df) > max_rows
+    shown = df.head(max_rows) if capped else df
+    columns = list(shown.columns) if columns is None else list(columns)
+
+    if len(shown) <= page:
+        shown.to_string(buf=sys.stdout, columns=columns, index=False)
+        sys.stdout.write("\n")
+    else:
+        formatters = {
+            col: _float_formatter(shown[col]) for col in columns
+            if isinstance(shown[col].dtype, np.dtype) and shown[col].dtype.kind == "f"
+        }
+        col_space = {}
+        for col in columns:
+            column = shown[col]
+            if col in formatters:
+                width = max(len(formatters[col](value)) for value in column.to_numpy())
+            else:
+                # One column of text at a time, only to measure it
+                width = max(map(len, column.to_string(index=False, header=False).split("\n")))
+            # to_string puts a space before numeric headers
+            col_space[col] = max(len(str(col)) + (column.dtype.kind in "biufc"), width)
+
+        for start in range(0, len(shown), page):
+            shown.iloc[start:start + page].to_string(
+                buf=sys.stdout, columns=columns, index=False, header=start == 0,
+                formatters=formatters, col_space=col_space,
+            )
+            sys.stdout.write("\n")
+            # Show each page as soon as it is formatted, even when stdout is a pipe
+            sys.stdout.flush()
+
+    if capped:
+        print(f"... {len(df) - max_rows} more rows (export to CSV for full list)")
+
+
+def _emit(*lines: str) -> None:
+    """Print several lines with a single write to stdout"""
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+def ranked_distribution(dist: dict, total: int, by_count: bool = True) -> list:
+    """(name, count, percent of total) rows of dist, largest count first or by name
+
+    Sorting and the percentages are computed by pandas in one pass each,
+    instead of a Python sort key and a division per entry.
+    """
+    import pandas as pd
+
+    counts = pd.Series(dist, dtype="int64")
+    # Stable, so equal counts keep their original order as with sorted()
+    counts = counts.sort_values(ascending=False, kind="stable") if by_count else counts.sort_index()
+    pct = counts / total * 100 if total > 0 else counts * 0.0
+    return list(zip(counts.index, counts.tolist(), pct.tolist()))
+
+
+def encode_report(text: str) -> bytes:
+    """UTF-8 bytes of text, with the line endings a text-mode write would produce"""
+    if os.linesep != "\n":
+        text = text.replace("\n", os.linesep)
+    return text.encode("utf-8")
+
+
+def write_export_bytes(path: Path, data: bytes) -> Path:
+    """Write already-encoded report bytes to path and return the path
+
+    The bytes go straight to the file descriptor, normally in a single write
+    call, with no buffered file object in between.
+    """
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0), 0o666)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+    return path
+
+
+def run_export_tasks(tasks: list) -> list:
+    """Run independent export callables together and return their paths in order
+
+    Each task writes one file and returns its path; the writes are I/O bound,
+    so they overlap well on a small thread pool.
+    """
+    if len(tasks) <= 1:
+        return [task() for task in tasks]
+    with ThreadPoolExecutor(max_workers=min(5, len(tasks))) as executor:
+        return list(executor.map(lambda task: task(), tasks))
+
+
+EXPORT_FORMATS = ("csv", "feather", "parquet", "xlsx")
+
+
+def export_dataframe(df: pd.DataFrame, csv_path: Path, export_format: str = "csv") -> Path:
+    """Export df in the configured format and return the path written
+
+    Feather and Parquet need pyarrow and xlsx needs openpyxl; without them,
+    or for data Arrow cannot represent, the export falls back to CSV.
+    """
+    try:
+        if export_format == "xlsx":
+            path = csv_path.with_suffix(".xlsx")
+            df.to_excel(path, index=False)
+            return path
+        if export_format == "feather":
+            path = csv_path.with_suffix(".feather")
+            df.reset_index(drop=True).to_feather(path)
+            return path
+        if export_format == "parquet":
+            path = csv_path.with_suffix(".parquet")
+            # Low-level zstd keeps the write fast while still compressing well
+            df.to_parquet(path, index=False, compression="zstd", compression_level=1)
+            return path
+    except ImportError:
+        package = "openpyxl" if export_format == "xlsx" else "pyarrow"
+        print(f"⚠️ {export_format} export needs {package}. Run: pip install {package}")
+    except (TypeError, ValueError) as e:
+        print(f"⚠️ Could not export as {export_format}: {e}")
+
+    fast_to_csv(df, csv_path)
+    return csv_path
+
+
+def export_workbook(sheets: dict, xlsx_path: Path) -> Optional[Path]:
+    """Write each non-empty frame in sheets to its own worksheet of one .xlsx file
+
+    Returns None when there is nothing to write, no Excel writer is installed
+    or the data cannot be written (openpyxl rejects tz-aware datetimes, for
+    example), so the caller can fall back to CSV.
+    """
+    import pandas as pd
+
+    sheets = {name: frame for name, frame in sheets.items() if not frame.empty}
+    if not sheets:
+        return None
+
+    try:
+        with pd.ExcelWriter(xlsx_path) as writer:
+            for name, frame in sheets.items():
+                frame.to_excel(writer, sheet_name=name, index=False)
+    except ImportError:
+        print("⚠️ xlsx export needs openpyxl. Run: pip install openpyxl")
+        return None
+    except (TypeError, ValueError) as e:
+        print(f"⚠️ Could not export as xlsx: {e}")
+        # Drop the partly written workbook
+        xlsx_path.unlink(missing_ok=True)
+        return None
+
+    return xlsx_path
+
+
+def _guarded(report):
+    """Report the error and wait for a key when an interactive report raises"""
+    @wraps(report)
+    async def wrapper(self, *args, **kwargs):
+        try:
+            return await report(self, *args, **kwargs)
+        except Exception as e:
+            self.ui.print_message(f"\nError: {e}", "red")
+            traceback.print_exc()
+            self.ui.press_any_key()
+    return wrapper
+
 
 class EntraLense:
     """Main EntraLense application class"""
@@ -35,19 +337,24 @@ class EntraLense:
     auth: Optional[EntraAuth]
     reports: Optional[UserReports]
     ui: Optional[ConsoleUI]
+    equipment_reports: Optional[EquipmentReports]
 
     def __init__(self):
         self.config = None
         self.auth = None
         self.reports = None
         self.ui = None
+        self.equipment_reports = None
+        self._asset_tracker = None
+        self._export_dirs = {}
+        self._last_timestamp = ("", 0)
         self.is_running = True
 
     async def initialize(self):
         """Initialize the application"""
-        logger.info("=" * 60)
+        logger.info(_SEP60)
         logger.info("EntraLense Application Starting")
-        logger.info("=" * 60)
+        logger.info(_SEP60)
         print("Initializing EntraLense...")
 
         # Check for first-time setup using new SetupWizard
@@ -57,9 +364,9 @@ class EntraLense:
             temp_ui = ConsoleUI()
             temp_ui.clear_screen()
             temp_ui.print_header("Welcome to EntraLense v1.0")
-            print("\n" + "=" * 60)
+            print("\n" + _SEP60)
             print("First-time setup required")
-            print("=" * 60)
+            print(_SEP60)
             print("\nEntraLense needs to be configured with your Azure AD credentials.")
             print("This will take about 2-3 minutes.")
 
@@ -101,7 +408,7 @@ class EntraLense:
 
         # Initialize UI and reports with export directory
         self.ui = ConsoleUI()
-        export_dir = Path(self.config.export_path)
+        export_dir = self.config.export_root
         self.reports = UserReports(self.auth, export_dir=export_dir)
 
         logger.info("EntraLense initialized successfully")
@@ -152,14 +459,14 @@ class EntraLense:
             elif choice.upper() == "L":
                 open_logs_folder()
                 self.ui.print_message("Logs folder opened!", "success")
-                await asyncio.sleep(1)
+                await asyncio.sleep(_MESSAGE_PAUSE)
 
             elif choice == "9":
                 await self.reconfigure_credentials()
 
             else:
                 self.ui.print_message("Invalid selection!", "red")
-                await asyncio.sleep(1)
+                await asyncio.sleep(_MESSAGE_PAUSE)
 
     async def show_users_menu(self):
         """Display Users submenu"""
@@ -196,7 +503,7 @@ class EntraLense:
 
             else:
                 self.ui.print_message("Invalid selection!", "red")
-                await asyncio.sleep(1)
+                await asyncio.sleep(_MESSAGE_PAUSE)
 
     async def show_email_menu(self):
         """Display Email submenu"""
@@ -229,7 +536,7 @@ class EntraLense:
 
             else:
                 self.ui.print_message("Invalid selection!", "red")
-                await asyncio.sleep(1)
+                await asyncio.sleep(_MESSAGE_PAUSE)
 
     async def show_equipment_menu(self):
         """Display Equipment submenu"""
@@ -270,7 +577,7 @@ class EntraLense:
 
             else:
                 self.ui.print_message("Invalid selection!", "red")
-                await asyncio.sleep(1)
+                await asyncio.sleep(_MESSAGE_PAUSE)
 
     async def service_dashboard_menu(self) -> None:
         """Service Status Dashboard menu (coming soon)."""
@@ -282,7 +589,7 @@ class EntraLense:
         print("* Box.com status monitoring")
         print("* Real-time service status dashboard")
         print("* Automated incident reporting")
-        print("\n" + "=" * 60)
+        print("\n" + _SEP60)
         input("\nPress Enter to continue...")
 
     async def reconfigure_credentials(self) -> None:
@@ -318,6 +625,7 @@ class EntraLense:
                 ("2", f"Dark Mode: {'On' if (self.config and self.config.dark_mode) else 'Off'}"),
                 ("3", f"Max Users: {self.config.max_users if self.config else 5000}"),
                 ("4", "View Current Configuration"),
+                ("5", f"Export Format: {self.config.export_format if self.config else 'csv'}"),
                 ("B", "Back to Main Menu")
             ]
 
@@ -329,7 +637,7 @@ class EntraLense:
             elif choice == "1":
                 new_path = input("\nEnter new export path: ").strip()
                 if new_path and self.config:
-                    self.config.export_path = new_path
+                    self._set_export_path(new_path)
                     Path(new_path).mkdir(exist_ok=True)
                     config_manager.save()
                     self.ui.print_message("Export path updated!", "success")
@@ -363,871 +671,936 @@ class EntraLense:
                     print(f"Export Path: {self.config.export_path}")
                     print(f"Max Users: {self.config.max_users}")
                     print(f"Dark Mode: {self.config.dark_mode}")
+                    print(f"Export Format: {self.config.export_format}")
                 else:
                     print("\nNo configuration loaded.")
-                print("\n" + "=" * 60)
+                print("\n" + _SEP60)
                 self.ui.press_any_key()
 
+            elif choice == "5":
+                if self.config:
+                    # Cycle csv -> feather -> parquet -> xlsx
+                    current = self.config.export_format
+                    index = EXPORT_FORMATS.index(current) if current in EXPORT_FORMATS else -1
+                    self.config.export_format = EXPORT_FORMATS[(index + 1) % len(EXPORT_FORMATS)]
+                    config_manager.save()
+                    self.ui.print_message(f"Export format set to {self.config.export_format}!", "success")
+                    self.ui.press_any_key()
+
             else:
                 self.ui.print_message("Invalid selection!", "red")
-                await asyncio.sleep(1)
-
+                await asyncio.sleep(_MESSAGE_PAUSE)
+
+    def _export_timestamp(self) -> str:
+        """Timestamp for export file names, made unique for exports within the same second"""
+        timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+        last, count = self._last_timestamp
+        count = count + 1 if timestamp == last else 1
+        self._last_timestamp = (timestamp, count)
+        return timestamp if count == 1 else f"{timestamp}-{count}"
+
+    def _get_equipment_reports(self) -> EquipmentReports:
+        """Shared EquipmentReports instance, rebuilt when the export path changes"""
+        export_dir = self.config.equipment_dir
+        if self.equipment_reports is None or self.equipment_reports.export_dir != export_dir:
+            self.equipment_reports = EquipmentReports(self.auth, export_dir=export_dir, config=self.config)
+        return self.equipment_reports
+
+    def _set_export_path(self, new_path: str):
+        """Point exports at new_path, dropping every path cached from the old one"""
+        self.config.set_export_path(new_path)
+        self._export_dirs.clear()
+
+    def _equipment_export_dir(self, *parts: str) -> Path:
+        """Equipment export directory, built and created the first time it is used"""
+        export_dir = self._export_dirs.get(parts)
+        if export_dir is None:
+            export_dir = self.config.equipment_dir.joinpath(*parts)
+            export_dir.mkdir(parents=True, exist_ok=True)
+            self._export_dirs[parts] = export_dir
+        return export_dir
+
+    @_guarded
     async def run_encryption_status_report(self):
         """Generate device encryption status report"""
         assert self.ui is not None
 
-        start_time = datetime.now()
+        start_time = time.perf_counter()
 
         self.ui.clear_screen()
         self.ui.print_header("Device Encryption Status Report")
 
-        try:
-            # Initialize equipment reports
-            export_dir = Path(self.config.export_path) / "equipment"
-            equipment_reports = EquipmentReports(self.auth, export_dir=export_dir)
-
-            # Generate the report
-            result = await equipment_reports.generate_encryption_status_report(
-                export_to_csv=False,  # Let user choose
-                include_raw_data=True
-            )
+        # Initialize equipment reports
+        equipment_reports = self._get_equipment_reports()
 
-            df = result["dataframe"]
-            stats = result["statistics"]
+        # Generate the report
+        result = await equipment_reports.generate_encryption_status_report(
+            export_to_csv=False,  # Let user choose
+            include_raw_data=True
+        )
 
-            # Calculate execution time
-            end_time = datetime.now()
-            duration = (end_time - start_time).total_seconds()
+        df = result["dataframe"]
+        stats = result["statistics"]
 
-            if df.empty:
-                self.ui.print_message("\nNo devices found.", "yellow")
-                self.ui.press_any_key()
-                return
+        # Calculate execution time
+        duration = time.perf_counter() - start_time
 
-            # Display summary
-            self.ui.clear_screen()
-            self.ui.print_header("ENCRYPTION STATUS - RESULTS")
-
-            encryption = stats.get("encryption", {})
-            compliance = stats.get("compliance", {})
-
-            print("\nSummary Statistics:")
-            print(f"   Total devices: {stats.get('total_devices', 0)}")
-            self.ui.print_message(f"   Encrypted: {encryption.get('encrypted', 0)}", "success")
-            self.ui.print_message(f"   Not encrypted: {encryption.get('not_encrypted', 0)}", "red")
-            print(f"   Unknown: {encryption.get('unknown', 0)}")
-            print(f"   Encryption rate: {encryption.get('encryption_rate', 0):.1f}%")
-            print(f"   Compliance rate: {compliance.get('compliance_rate', 0):.1f}%")
-            print(f"   Duration: {duration:.2f} seconds")
-
-            # Show view options menu
-            while True:
-                print("\nView Options:")
-                print("1. Summary table")
-                print("2. Non-encrypted devices only")
-                print("3. OS distribution")
-                print("4. Export to CSV")
-                print("B. Back to menu")
-
-                view_choice = self.ui.get_input("\nSelect view option: ", "B")
-
-                if view_choice.upper() == "B":
-                    return
-
-                elif view_choice == "1":
-                    # Summary table
-                    print("\n" + "=" * 60)
-                    self.ui.print_message("ALL DEVICES", "cyan")
-                    print("=" * 60)
-                    display_cols = ["Device Name", "Operating System", "Is Encrypted",
-                                    "Encryption Method", "Compliance State", "User Principal Name"]
-                    available_cols = [c for c in display_cols if c in df.columns]
-                    print(df[available_cols].to_string(index=False))
-                    self.ui.press_any_key()
+        if df.empty:
+            self.ui.print_message("\nNo devices found.", "yellow")
+            self.ui.press_any_key()
+            return
 
-                elif view_choice == "2":
-                    # Non-encrypted devices only
-                    non_encrypted_df = df[df["Is Encrypted"] == False]
-                    print(f"\nNON-ENCRYPTED DEVICES ({len(non_encrypted_df)} found)")
-                    print("=" * 60)
-                    if not non_encrypted_df.empty:
-                        display_cols = ["Device Name", "Operating System", "Encryption Details",
-                                        "User Principal Name"]
-                        available_cols = [c for c in display_cols if c in non_encrypted_df.columns]
-                        print(non_encrypted_df[available_cols].to_string(index=False))
-                    else:
-                        self.ui.print_message("All devices are encrypted!", "success")
-                    self.ui.press_any_key()
+        # Display summary
+        self.ui.clear_screen()
+        self.ui.print_header("ENCRYPTION STATUS - RESULTS")
+
+        encryption = stats.get("encryption", {})
+        compliance = stats.get("compliance", {})
+
+        _emit(
+            "\nSummary Statistics:",
+            f"   Total devices: {stats.get('total_devices', 0)}"
+        )
+        self.ui.print_message(f"   Encrypted: {encryption.get('encrypted', 0)}", "success")
+        self.ui.print_message(f"   Not encrypted: {encryption.get('not_encrypted', 0)}", "red")
+        _emit(
+            f"   Unknown: {encryption.get('unknown', 0)}",
+            f"   Encryption rate: {encryption.get('encryption_rate', 0):.1f}%",
+            f"   Compliance rate: {compliance.get('compliance_rate', 0):.1f}%",
+            f"   Duration: {duration:.2f} seconds"
+        )
+
+        # Filter once, outside the view loop
+        non_encrypted_df = df[(df["Is Encrypted"] == False).to_numpy()]
+        all_cols = [c for c in ["Device Name", "Operating System", "Is Encrypted",
+                                "Encryption Method", "Compliance State", "User Principal Name"]
+                    if c in df.columns]
+        non_encrypted_cols = [c for c in ["Device Name", "Operating System", "Encryption Details",
+                                          "User Principal Name"]
+                              if c in df.columns]
+        os_counts = Counter(stats.get("os_distribution", {})).most_common()
+
+        # Show view options menu
+        while True:
+            print("\nView Options:")
+            print("1. Summary table")
+            print("2. Non-encrypted devices only")
+            print("3. OS distribution")
+            print("4. Export to CSV")
+            print("B. Back to menu")
 
-                elif view_choice == "3":
-                    # OS distribution
-                    print("\n" + "=" * 60)
-                    self.ui.print_message("OS DISTRIBUTION", "cyan")
-                    print("=" * 60)
-                    os_dist = stats.get("os_distribution", {})
-                    total = stats.get("total_devices", 1)
-                    for os_name, count in sorted(os_dist.items(), key=lambda x: x[1], reverse=True):
-                        pct = (count / total * 100) if total > 0 else 0
-                        print(f"   {os_name}: {count} devices ({pct:.1f}%)")
-                    self.ui.press_any_key()
+            view_choice = self.ui.get_input("\nSelect view option: ", "B")
 
-                elif view_choice == "4":
-                    # Export to CSV
-                    timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
-                    export_dir = Path(self.config.export_path) / "equipment"
-                    export_dir.mkdir(parents=True, exist_ok=True)
-                    csv_path = export_dir / f"EncryptionStatus_{timestamp}.csv"
-                    df.to_csv(csv_path, index=False, encoding='utf-8-sig')
-                    self.ui.print_message(f"\nExported to: {csv_path}", "success")
-                    self.ui.press_any_key()
+            if view_choice.upper() == "B":
+                return
 
+            elif view_choice == "1":
+                # Summary table
+                print("\n" + _SEP60)
+                self.ui.print_message("ALL DEVICES", "cyan")
+                print(_SEP60)
+                print_df(df, all_cols)
+                self.ui.press_any_key()
+
+            elif view_choice == "2":
+                # Non-encrypted devices only
+                print(f"\nNON-ENCRYPTED DEVICES ({len(non_encrypted_df)} found)")
+                print(_SEP60)
+                if not non_encrypted_df.empty:
+                    print_df(non_encrypted_df, non_encrypted_cols)
                 else:
-                    self.ui.print_message("Invalid option", "yellow")
-                    await asyncio.sleep(1)
+                    self.ui.print_message("All devices are encrypted!", "success")
+                self.ui.press_any_key()
 
-        except Exception as e:
-            self.ui.print_message(f"\nError: {e}", "red")
-            import traceback
-            traceback.print_exc()
-            self.ui.press_any_key()
+            elif view_choice == "3":
+                # OS distribution
+                print("\n" + _SEP60)
+                self.ui.print_message("OS DISTRIBUTION", "cyan")
+                print(_SEP60)
+                total = stats.get("total_devices", 1)
+                for os_name, count in os_counts:
+                    pct = (count / total * 100) if total > 0 else 0
+                    print(f"   {os_name}: {count} devices ({pct:.1f}%)")
+                self.ui.press_any_key()
+
+            elif view_choice == "4":
+                # Export to CSV
+                timestamp = self._export_timestamp()
+                export_dir = self._equipment_export_dir()
+                csv_path = export_dir / f"EncryptionStatus_{timestamp}.csv"
+                export_path = export_dataframe(df, csv_path, self.config.export_format)
+                self.ui.print_message(f"\nExported to: {export_path}", "success")
+                self.ui.press_any_key()
 
+            else:
+                self.ui.print_message("Invalid option", "yellow")
+
+    @_guarded
     async def run_compliance_policy_report(self):
         """Generate compliance policy adherence report with detailed policy checking"""
         assert self.ui is not None
+        import pandas as pd
 
-        start_time = datetime.now()
+        start_time = time.perf_counter()
 
         self.ui.clear_screen()
         self.ui.print_header("Compliance Policy Adherence Report")
 
-        try:
-            # Initialize equipment reports with config
-            export_dir = Path(self.config.export_path) / "equipment"
-            equipment_reports = EquipmentReports(self.auth, export_dir=export_dir, config=self.config)
-
-            # Generate the report
-            result = await equipment_reports.generate_compliance_policy_report(
-                export_to_csv=False,
-                include_raw_data=True
-            )
+        # Initialize equipment reports with config
+        equipment_reports = self._get_equipment_reports()
 
-            df = result.get("dataframe", pd.DataFrame())
-            stats = result.get("statistics", {})
-            report_text = result.get("report_text", "")
-            detailed_df = result.get("detailed_results", pd.DataFrame())
+        # Generate the report
+        result = await equipment_reports.generate_compliance_policy_report(
+            export_to_csv=False,
+            include_raw_data=True
+        )
 
-            # Calculate execution time
-            end_time = datetime.now()
-            duration = (end_time - start_time).total_seconds()
+        df = result.get("dataframe", pd.DataFrame())
+        stats = result.get("statistics", {})
+        report_text = result.get("report_text", "")
+        detailed_df = result.get("detailed_results", pd.DataFrame())
 
-            if df.empty and detailed_df.empty:
-                self.ui.print_message("\nNo devices found.", "yellow")
-                self.ui.press_any_key()
+        # Calculate execution time
+        duration = time.perf_counter() - start_time
+
+        if df.empty and detailed_df.empty:
+            self.ui.print_message("\nNo devices found.", "yellow")
+            self.ui.press_any_key()
+            return
+
+        # Display summary
+        self.ui.clear_screen()
+        self.ui.print_header("COMPLIANCE POLICY - RESULTS")
+
+        # Get device statistics
+        device_stats = stats.get("device_statistics", {})
+        status_dist = stats.get("status_distribution", {})
+        severity_dist = stats.get("severity_distribution", {})
+
+        _emit(
+            "\nSummary Statistics:",
+            f"   Total devices: {device_stats.get('total_devices', stats.get('total_devices', 0))}",
+            f"   Total checks: {stats.get('total_checks', 0)}"
+        )
+        self.ui.print_message(f"   Compliant checks: {status_dist.get('compliant', 0)}", "success")
+        self.ui.print_message(f"   Non-compliant checks: {status_dist.get('non_compliant', 0)}", "red")
+        _emit(
+            f"   Compliance rate: {stats.get('compliance_rate', 0):.1f}%",
+            f"   Devices requiring attention: {device_stats.get('devices_requiring_attention', 0)}",
+            f"   Duration: {duration:.2f} seconds"
+        )
+
+        # Show severity breakdown if available
+        if severity_dist:
+            print("\nIssues by Severity:")
+            if severity_dist.get('critical', 0) > 0:
+                self.ui.print_message(f"   Critical: {severity_dist.get('critical', 0)}", "red")
+            if severity_dist.get('high', 0) > 0:
+                self.ui.print_message(f"   High: {severity_dist.get('high', 0)}", "red")
+            if severity_dist.get('medium', 0) > 0:
+                self.ui.print_message(f"   Medium: {severity_dist.get('medium', 0)}", "yellow")
+            if severity_dist.get('low', 0) > 0:
+                print(f"   Low: {severity_dist.get('low', 0)}")
+
+        # Built on first use, then reused on later views and exports
+        detailed_head = None
+        report_bytes = None
+
+        # Resolve displayed columns once, outside the view loop
+        col_set = set(df.columns)
+        summary_cols = [c for c in ["device_name", "platform", "compliance_score",
+                                    "compliant_checks", "non_compliant_checks", "requires_attention"]
+                        if c in col_set]
+        attention_cols = [c for c in ["device_name", "platform", "compliance_score",
+                                      "critical_issues", "high_issues", "attention_reasons"]
+                          if c in col_set]
+        detailed_col_set = set(detailed_df.columns)
+        detailed_cols = [c for c in ["device_name", "policy_id", "status", "severity", "check_details"]
+                         if c in detailed_col_set]
+        failed_check_cols = [c for c in ["device_name", "policy_id", "severity", "check_details"]
+                             if c in detailed_col_set]
+        non_compliant = None  # Failed checks, filtered on first use
+
+        # Show view options menu
+        while True:
+            print("\nView Options:")
+            print("1. Device compliance summary")
+            print("2. Detailed check results")
+            print("3. Non-compliant devices only")
+            print("4. Top compliance issues")
+            print("5. Full report text")
+            print("6. Export to CSV")
+            print("B. Back to menu")
+
+            view_choice = self.ui.get_input("\nSelect view option: ", "B")
+
+            if view_choice.upper() == "B":
                 return
 
-            # Display summary
-            self.ui.clear_screen()
-            self.ui.print_header("COMPLIANCE POLICY - RESULTS")
-
-            # Get device statistics
-            device_stats = stats.get("device_statistics", {})
-            status_dist = stats.get("status_distribution", {})
-            severity_dist = stats.get("severity_distribution", {})
-
-            print("\nSummary Statistics:")
-            print(f"   Total devices: {device_stats.get('total_devices', stats.get('total_devices', 0))}")
-            print(f"   Total checks: {stats.get('total_checks', 0)}")
-            self.ui.print_message(f"   Compliant checks: {status_dist.get('compliant', 0)}", "success")
-            self.ui.print_message(f"   Non-compliant checks: {status_dist.get('non_compliant', 0)}", "red")
-            print(f"   Compliance rate: {stats.get('compliance_rate', 0):.1f}%")
-            print(f"   Devices requiring attention: {device_stats.get('devices_requiring_attention', 0)}")
-            print(f"   Duration: {duration:.2f} seconds")
-
-            # Show severity breakdown if available
-            if severity_dist:
-                print("\nIssues by Severity:")
-                if severity_dist.get('critical', 0) > 0:
-                    self.ui.print_message(f"   Critical: {severity_dist.get('critical', 0)}", "red")
-                if severity_dist.get('high', 0) > 0:
-                    self.ui.print_message(f"   High: {severity_dist.get('high', 0)}", "red")
-                if severity_dist.get('medium', 0) > 0:
-                    self.ui.print_message(f"   Medium: {severity_dist.get('medium', 0)}", "yellow")
-                if severity_dist.get('low', 0) > 0:
-                    print(f"   Low: {severity_dist.get('low', 0)}")
-
-            # Show view options menu
-            while True:
-                print("\nView Options:")
-                print("1. Device compliance summary")
-                print("2. Detailed check results")
-                print("3. Non-compliant devices only")
-                print("4. Top compliance issues")
-                print("5. Full report text")
-                print("6. Export to CSV")
-                print("B. Back to menu")
-
-                view_choice = self.ui.get_input("\nSelect view option: ", "B")
-
-                if view_choice.upper() == "B":
-                    return
-
-                elif view_choice == "1":
-                    # Device compliance summary
-                    print("\n" + "=" * 80)
-                    self.ui.print_message("DEVICE COMPLIANCE SUMMARY", "cyan")
-                    print("=" * 80)
-                    if not df.empty:
-                        display_cols = ["device_name", "platform", "compliance_score",
-                                        "compliant_checks", "non_compliant_checks", "requires_attention"]
-                        available_cols = [c for c in display_cols if c in df.columns]
-                        if available_cols:
-                            print(df[available_cols].to_string(index=False))
-                        else:
-                            print(df.to_string(index=False))
-                    else:
-                        print("No summary data available")
-                    self.ui.press_any_key()
+            elif view_choice == "1":
+                # Device compliance summary
+                print("\n" + _SEP80)
+                self.ui.print_message("DEVICE COMPLIANCE SUMMARY", "cyan")
+                print(_SEP80)
+                if not df.empty:
+                    print_df(df, summary_cols or None)
+                else:
+                    print("No summary data available")
+                self.ui.press_any_key()
 
-                elif view_choice == "2":
-                    # Detailed check results
-                    print("\n" + "=" * 80)
-                    self.ui.print_message("DETAILED CHECK RESULTS", "cyan")
-                    print("=" * 80)
-                    if not detailed_df.empty:
-                        display_cols = ["device_name", "policy_id", "status", "severity", "check_details"]
-                        available_cols = [c for c in display_cols if c in detailed_df.columns]
-                        if available_cols:
-                            print(detailed_df[available_cols].head(50).to_string(index=False))
-                            if len(detailed_df) > 50:
-                                print(f"\n... and {len(detailed_df) - 50} more results")
-                        else:
-                            print(detailed_df.head(50).to_string(index=False))
-                    else:
-                        print("No detailed results available")
-                    self.ui.press_any_key()
+            elif view_choice == "2":
+                # Detailed check results
+                print("\n" + _SEP80)
+                self.ui.print_message("DETAILED CHECK RESULTS", "cyan")
+                print(_SEP80)
+                if not detailed_df.empty:
+                    if detailed_head is None:
+                        detailed_head = (detailed_df[detailed_cols] if detailed_cols else detailed_df).head(50).to_string(index=False)
+                        if detailed_cols and len(detailed_df) > 50:
+                            detailed_head += f"\n\n... and {len(detailed_df) - 50} more results"
+                    print(detailed_head)
+                else:
+                    print("No detailed results available")
+                self.ui.press_any_key()
 
-                elif view_choice == "3":
-                    # Non-compliant devices only
-                    print("\n" + "=" * 80)
-                    self.ui.print_message("DEVICES REQUIRING ATTENTION", "cyan")
-                    print("=" * 80)
-                    if not df.empty and "requires_attention" in df.columns:
-                        attention_df = df[df["requires_attention"] == True]
-                        if not attention_df.empty:
-                            display_cols = ["device_name", "platform", "compliance_score",
-                                            "critical_issues", "high_issues", "attention_reasons"]
-                            available_cols = [c for c in display_cols if c in attention_df.columns]
-                            print(attention_df[available_cols].to_string(index=False))
-                        else:
-                            self.ui.print_message("All devices are compliant!", "success")
-                    elif not detailed_df.empty and "status" in detailed_df.columns:
-                        non_compliant = detailed_df[detailed_df["status"] == "non_compliant"]
-                        if not non_compliant.empty:
-                            display_cols = ["device_name", "policy_id", "severity", "check_details"]
-                            available_cols = [c for c in display_cols if c in non_compliant.columns]
-                            print(non_compliant[available_cols].to_string(index=False))
-                        else:
-                            self.ui.print_message("All checks passed!", "success")
+            elif view_choice == "3":
+                # Non-compliant devices only
+                print("\n" + _SEP80)
+                self.ui.print_message("DEVICES REQUIRING ATTENTION", "cyan")
+                print(_SEP80)
+                if not df.empty and "requires_attention" in df.columns:
+                    # Plain boolean mask; NaN counts as not requiring attention, as with == True
+                    attention_df = df[df["requires_attention"].fillna(False).to_numpy(dtype=bool)]
+                    if not attention_df.empty:
+                        print_df(attention_df, attention_cols)
                     else:
-                        print("No compliance data available")
-                    self.ui.press_any_key()
-
-                elif view_choice == "4":
-                    # Top compliance issues
-                    print("\n" + "=" * 60)
-                    self.ui.print_message("TOP COMPLIANCE ISSUES", "cyan")
-                    print("=" * 60)
-                    top_issues = stats.get("top_non_compliant_policies", {})
-                    if top_issues:
-                        for policy, count in top_issues.items():
-                            print(f"   {policy}: {count} occurrences")
+                        self.ui.print_message("All devices are compliant!", "success")
+                elif not detailed_df.empty and "status" in detailed_col_set:
+                    if non_compliant is None:
+                        non_compliant = detailed_df[detailed_df["status"].to_numpy() == "non_compliant"]
+                    if not non_compliant.empty:
+                        print_df(non_compliant, failed_check_cols)
                     else:
-                        self.ui.print_message("No compliance issues found!", "success")
-                    self.ui.press_any_key()
+                        self.ui.print_message("All checks passed!", "success")
+                else:
+                    print("No compliance data available")
+                self.ui.press_any_key()
 
-                elif view_choice == "5":
-                    # Full report text
-                    print("\n")
-                    if report_text:
-                        print(report_text)
-                    else:
-                        print("No detailed report text available")
-                    self.ui.press_any_key()
+            elif view_choice == "4":
+                # Top compliance issues
+                print("\n" + _SEP60)
+                self.ui.print_message("TOP COMPLIANCE ISSUES", "cyan")
+                print(_SEP60)
+                top_issues = stats.get("top_non_compliant_policies", {})
+                if top_issues:
+                    for policy, count in top_issues.items():
+                        print(f"   {policy}: {count} occurrences")
+                else:
+                    self.ui.print_message("No compliance issues found!", "success")
+                self.ui.press_any_key()
 
-                elif view_choice == "6":
-                    # Export to CSV
-                    timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
-                    export_dir = Path(self.config.export_path) / "equipment" / "compliance"
-                    export_dir.mkdir(parents=True, exist_ok=True)
+            elif view_choice == "5":
+                # Full report text
+                print("\n")
+                if report_text:
+                    print(report_text)
+                else:
+                    print("No detailed report text available")
+                self.ui.press_any_key()
+
+            elif view_choice == "6":
+                # Export to CSV
+                timestamp = self._export_timestamp()
+                export_dir = self._equipment_export_dir("compliance")
 
-                    files_exported = []
+                files_exported = []
 
+                # One workbook holds every part of the report
+                export_format = self.config.export_format
+                if export_format == "xlsx":
+                    sheets = {"summary": df, "detailed": detailed_df}
+                    if report_text:
+                        sheets["report"] = pd.DataFrame({"report": report_text.splitlines()})
+                    workbook = export_workbook(sheets, export_dir / f"compliance_{timestamp}.xlsx")
+                    if workbook:
+                        files_exported.append(workbook)
+                    else:
+                        export_format = "csv"
+
+                if not files_exported:
                     # Export summary
                     if not df.empty:
                         csv_path = export_dir / f"compliance_summary_{timestamp}.csv"
-                        df.to_csv(csv_path, index=False, encoding='utf-8-sig')
-                        files_exported.append(csv_path)
+                        files_exported.append(export_dataframe(df, csv_path, export_format))
 
                     # Export detailed results
                     if not detailed_df.empty:
                         csv_path = export_dir / f"compliance_detailed_{timestamp}.csv"
-                        detailed_df.to_csv(csv_path, index=False, encoding='utf-8-sig')
-                        files_exported.append(csv_path)
+                        files_exported.append(export_dataframe(detailed_df, csv_path, export_format))
 
                     # Export report text
                     if report_text:
                         txt_path = export_dir / f"compliance_report_{timestamp}.txt"
-                        with open(txt_path, 'w', encoding='utf-8') as f:
-                            f.write(report_text)
-                        files_exported.append(txt_path)
-
-                    if files_exported:
-                        self.ui.print_message(f"\nExported {len(files_exported)} files to: {export_dir}", "success")
-                        for f in files_exported:
-                            print(f"   - {f.name}")
-                    else:
-                        self.ui.print_message("No data to export", "yellow")
-                    self.ui.press_any_key()
-
+                        if report_bytes is None:
+                            report_bytes = encode_report(report_text)
+                        files_exported.append(write_export_bytes(txt_path, report_bytes))
+
+                if files_exported:
+                    self.ui.print_message(f"\nExported {len(files_exported)} files to: {export_dir}", "success")
+                    for f in files_exported:
+                        print(f"   - {f.name}")
                 else:
-                    self.ui.print_message("Invalid option", "yellow")
-                    await asyncio.sleep(1)
+                    self.ui.print_message("No data to export", "yellow")
+                self.ui.press_any_key()
 
-        except Exception as e:
-            self.ui.print_message(f"\nError: {e}", "red")
-            import traceback
-            traceback.print_exc()
-            self.ui.press_any_key()
+            else:
+                self.ui.print_message("Invalid option", "yellow")
 
+    @_guarded
     async def run_os_patch_report(self):
         """Generate OS version/patch status report with detailed analysis"""
         assert self.ui is not None
+        import pandas as pd
 
-        start_time = datetime.now()
+        start_time = time.perf_counter()
 
         self.ui.clear_screen()
         self.ui.print_header("OS Version/Patch Status Report")
 
-        try:
-            # Initialize equipment reports with config
-            export_dir = Path(self.config.export_path) / "equipment"
-            equipment_reports = EquipmentReports(self.auth, export_dir=export_dir, config=self.config)
-
-            # Generate the report
-            result = await equipment_reports.generate_os_patch_report(
-                export_to_csv=False,
-                include_raw_data=True
-            )
+        # Initialize equipment reports with config
+        equipment_reports = self._get_equipment_reports()
 
-            df = result.get("dataframe", pd.DataFrame())
-            stats = result.get("statistics", {})
-            report_text = result.get("report_text", "")
-            detailed_df = result.get("detailed_results", pd.DataFrame())
-            patch_statuses = result.get("patch_statuses", [])
+        # Generate the report
+        result = await equipment_reports.generate_os_patch_report(
+            export_to_csv=False,
+            include_raw_data=True
+        )
 
-            # Calculate execution time
-            end_time = datetime.now()
-            duration = (end_time - start_time).total_seconds()
+        df = result.get("dataframe", pd.DataFrame())
+        stats = result.get("statistics", {})
+        report_text = result.get("report_text", "")
+        detailed_df = result.get("detailed_results", pd.DataFrame())
+        patch_statuses = result.get("patch_statuses", [])
 
-            if df.empty:
-                self.ui.print_message("\nNo devices found.", "yellow")
-                self.ui.press_any_key()
-                return
+        # Calculate execution time
+        duration = time.perf_counter() - start_time
 
-            # Display summary
-            self.ui.clear_screen()
-            self.ui.print_header("OS VERSION/PATCH STATUS - RESULTS")
-
-            # Get key statistics
-            summary = stats.get("summary", {})
-            patch_metrics = stats.get("patch_metrics", {})
-            status_dist = stats.get("status_distribution", {})
-            vuln_dist = stats.get("vulnerability_distribution", {})
-            compliance_scores = stats.get("compliance_scores", {})
-
-            print("\nSummary Statistics:")
-            print(f"   Total devices: {stats.get('total_devices', 0)}")
-            print(f"   Patch compliance rate: {summary.get('patch_compliance_rate', 0):.1f}%")
-            print(f"   Overall health: {summary.get('overall_health', 'Unknown')}")
-            print(f"   Average compliance score: {compliance_scores.get('average', 0):.1f}%")
-            print(f"   Duration: {duration:.2f} seconds")
-
-            # Show patch status breakdown
-            print("\nPatch Status:")
-            self.ui.print_message(f"   Up to date: {status_dist.get('up_to_date', 0)}", "success")
-            if status_dist.get('security_updates_available', 0) > 0:
-                self.ui.print_message(f"   Security updates available: {status_dist.get('security_updates_available', 0)}", "yellow")
-            if status_dist.get('feature_updates_available', 0) > 0:
-                print(f"   Feature updates available: {status_dist.get('feature_updates_available', 0)}")
-            if status_dist.get('outdated', 0) > 0:
-                self.ui.print_message(f"   Outdated: {status_dist.get('outdated', 0)}", "red")
-            if status_dist.get('unsupported', 0) > 0:
-                self.ui.print_message(f"   Unsupported OS: {status_dist.get('unsupported', 0)}", "red")
-
-            # Show vulnerability levels
-            if vuln_dist.get('critical', 0) > 0 or vuln_dist.get('high', 0) > 0:
-                print("\nVulnerability Levels:")
-                if vuln_dist.get('critical', 0) > 0:
-                    self.ui.print_message(f"   Critical: {vuln_dist.get('critical', 0)}", "red")
-                if vuln_dist.get('high', 0) > 0:
-                    self.ui.print_message(f"   High: {vuln_dist.get('high', 0)}", "red")
-                if vuln_dist.get('medium', 0) > 0:
-                    self.ui.print_message(f"   Medium: {vuln_dist.get('medium', 0)}", "yellow")
-
-            # Show view options menu
-            while True:
-                print("\nView Options:")
-                print("1. Device patch status summary")
-                print("2. OS distribution breakdown")
-                print("3. Devices needing attention")
-                print("4. Compliance score distribution")
-                print("5. Full report text")
-                print("6. Export to CSV")
-                print("B. Back to menu")
-
-                view_choice = self.ui.get_input("\nSelect view option: ", "B")
-
-                if view_choice.upper() == "B":
-                    return
-
-                elif view_choice == "1":
-                    # Device patch status summary
-                    print("\n" + "=" * 80)
-                    self.ui.print_message("DEVICE PATCH STATUS SUMMARY", "cyan")
-                    print("=" * 80)
-                    if not df.empty:
-                        display_cols = ["device_name", "os_name", "os_version", "release_name",
-                                        "patch_status", "vulnerability_level", "patch_compliance_score", "is_supported"]
-                        available_cols = [c for c in display_cols if c in df.columns]
-                        if available_cols:
-                            print(df[available_cols].to_string(index=False))
-                        else:
-                            print(df.to_string(index=False))
-                    else:
-                        print("No summary data available")
-                    self.ui.press_any_key()
+        if df.empty:
+            self.ui.print_message("\nNo devices found.", "yellow")
+            self.ui.press_any_key()
+            return
 
-                elif view_choice == "2":
-                    # OS distribution
-                    print("\n" + "=" * 60)
-                    self.ui.print_message("OS DISTRIBUTION", "cyan")
-                    print("=" * 60)
-                    os_dist = stats.get("os_distribution", {})
-                    total = stats.get("total_devices", 1)
-                    for os_name, count in sorted(os_dist.items(), key=lambda x: x[1], reverse=True):
-                        pct = (count / total * 100) if total > 0 else 0
-                        print(f"   {os_name}: {count} devices ({pct:.1f}%)")
-
-                    # Also show support status by OS
-                    print("\nSupport Status by OS:")
-                    if patch_statuses:
-                        supported_by_os = {}
-                        unsupported_by_os = {}
-                        for status in patch_statuses:
-                            os_name = status.os_info.os_name
-                            if status.os_info.is_supported:
-                                supported_by_os[os_name] = supported_by_os.get(os_name, 0) + 1
-                            else:
-                                unsupported_by_os[os_name] = unsupported_by_os.get(os_name, 0) + 1
-
-                        for os_name in set(list(supported_by_os.keys()) + list(unsupported_by_os.keys())):
-                            supported = supported_by_os.get(os_name, 0)
-                            unsupported = unsupported_by_os.get(os_name, 0)
-                            if unsupported > 0:
-                                self.ui.print_message(f"   {os_name}: {supported} supported, {unsupported} unsupported", "yellow")
-                            else:
-                                print(f"   {os_name}: {supported} supported")
+        # Display summary
+        self.ui.clear_screen()
+        self.ui.print_header("OS VERSION/PATCH STATUS - RESULTS")
+
+        # Get key statistics
+        summary = stats.get("summary", {})
+        patch_metrics = stats.get("patch_metrics", {})
+        status_dist = stats.get("status_distribution", {})
+        vuln_dist = stats.get("vulnerability_distribution", {})
+        compliance_scores = stats.get("compliance_scores", {})
+        total_devices = stats.get("total_devices", 0)
+
+        _emit(
+            "\nSummary Statistics:",
+            f"   Total devices: {total_devices}",
+            f"   Patch compliance rate: {summary.get('patch_compliance_rate', 0):.1f}%",
+            f"   Overall health: {summary.get('overall_health', 'Unknown')}",
+            f"   Average compliance score: {compliance_scores.get('average', 0):.1f}%",
+            f"   Duration: {duration:.2f} seconds"
+        )
+
+        # Show patch status breakdown, written as one block
+        lines = ["\nPatch Status:", self.ui.format_message(f"   Up to date: {status_dist.get('up_to_date', 0)}", "success")]
+        if status_dist.get('security_updates_available', 0) > 0:
+            lines.append(self.ui.format_message(f"   Security updates available: {status_dist.get('security_updates_available', 0)}", "yellow"))
+        if status_dist.get('feature_updates_available', 0) > 0:
+            lines.append(f"   Feature updates available: {status_dist.get('feature_updates_available', 0)}")
+        if status_dist.get('outdated', 0) > 0:
+            lines.append(self.ui.format_message(f"   Outdated: {status_dist.get('outdated', 0)}", "red"))
+        if status_dist.get('unsupported', 0) > 0:
+            lines.append(self.ui.format_message(f"   Unsupported OS: {status_dist.get('unsupported', 0)}", "red"))
+
+        # Show vulnerability levels
+        if vuln_dist.get('critical', 0) > 0 or vuln_dist.get('high', 0) > 0:
+            lines.append("\nVulnerability Levels:")
+            if vuln_dist.get('critical', 0) > 0:
+                lines.append(self.ui.format_message(f"   Critical: {vuln_dist.get('critical', 0)}", "red"))
+            if vuln_dist.get('high', 0) > 0:
+                lines.append(self.ui.format_message(f"   High: {vuln_dist.get('high', 0)}", "red"))
+            if vuln_dist.get('medium', 0) > 0:
+                lines.append(self.ui.format_message(f"   Medium: {vuln_dist.get('medium', 0)}", "yellow"))
+        _emit(*lines)
+
+        # Encoded on first export, then reused
+        report_bytes = None
+
+        # Resolve displayed columns once, outside the view loop
+        summary_cols = [c for c in ["device_name", "os_name", "os_version", "release_name",
+                                    "patch_status", "vulnerability_level", "patch_compliance_score",
+                                    "is_supported"]
+                        if c in df.columns]
+
+        # Show view options menu
+        while True:
+            _emit(
+                "\nView Options:",
+                "1. Device patch status summary",
+                "2. OS distribution breakdown",
+                "3. Devices needing attention",
+                "4. Compliance score distribution",
+                "5. Full report text",
+                "6. Export to CSV",
+                "B. Back to menu"
+            )
 
-                    self.ui.press_any_key()
+            view_choice = self.ui.get_input("\nSelect view option: ", "B")
 
-                elif view_choice == "3":
-                    # Devices needing attention
-                    print("\n" + "=" * 80)
-                    self.ui.print_message("DEVICES NEEDING ATTENTION", "cyan")
-                    print("=" * 80)
-                    attention = stats.get("devices_needing_attention", {})
-                    if attention.get("count", 0) > 0:
-                        print(f"Total devices needing attention: {attention['count']}\n")
-                        for i, device in enumerate(attention.get("devices", [])[:10], 1):
-                            print(f"{i}. {device['device_name']}")
-                            print(f"   OS: {device['os']} {device['version']}")
-                            print(f"   Issues: {', '.join(device['issues'])}")
-                            print()
-                        if attention['count'] > 10:
-                            print(f"... and {attention['count'] - 10} more devices")
-                    else:
-                        self.ui.print_message("No devices needing attention!", "success")
-                    self.ui.press_any_key()
+            if view_choice.upper() == "B":
+                return
 
-                elif view_choice == "4":
-                    # Compliance score distribution
-                    print("\n" + "=" * 60)
-                    self.ui.print_message("COMPLIANCE SCORE DISTRIBUTION", "cyan")
-                    print("=" * 60)
-                    distribution = compliance_scores.get("distribution", {})
-                    total = stats.get("total_devices", 1)
-
-                    self.ui.print_message(f"   Excellent (90-100%): {distribution.get('excellent_90_100', 0)}", "success")
-                    print(f"   Good (80-89%): {distribution.get('good_80_89', 0)}")
-                    self.ui.print_message(f"   Fair (70-79%): {distribution.get('fair_70_79', 0)}", "yellow")
-                    self.ui.print_message(f"   Poor (60-69%): {distribution.get('poor_60_69', 0)}", "yellow")
-                    self.ui.print_message(f"   Critical (<60%): {distribution.get('critical_below_60', 0)}", "red")
-
-                    print(f"\n   Average Score: {compliance_scores.get('average', 0):.1f}%")
-                    print(f"   Min Score: {compliance_scores.get('min', 0):.1f}%")
-                    print(f"   Max Score: {compliance_scores.get('max', 0):.1f}%")
-                    self.ui.press_any_key()
+            elif view_choice == "1":
+                # Device patch status summary
+                print("\n" + _SEP80)
+                self.ui.print_message("DEVICE PATCH STATUS SUMMARY", "cyan")
+                print(_SEP80)
+                if not df.empty:
+                    if summary_cols:
+                        print_df(df, summary_cols, max_rows=MAX_TTY_ROWS)
+                    else:
+                        print_df(df, max_rows=MAX_TTY_ROWS)
+                else:
+                    print("No summary data available")
+                self.ui.press_any_key()
 
-                elif view_choice == "5":
-                    # Full report text
-                    print("\n")
-                    if report_text:
-                        print(report_text)
+            elif view_choice == "2":
+                # OS distribution
+                print("\n" + _SEP60)
+                self.ui.print_message("OS DISTRIBUTION", "cyan")
+                print(_SEP60)
+                os_dist = stats.get("os_distribution", {})
+                for os_name, count, pct in ranked_distribution(os_dist, total_devices):
+                    print(f"   {os_name}: {count} devices ({pct:.1f}%)")
+
+                # Also show support status by OS
+                print("\nSupport Status by OS:")
+                if patch_statuses:
+                    if {"os_name", "is_supported"}.issubset(df.columns):
+                        support_frame = df[["os_name", "is_supported"]]
                     else:
-                        print("No detailed report text available")
-                    self.ui.press_any_key()
+                        support_frame = pd.DataFrame.from_records(
+                            [(status.os_info.os_name, status.os_info.is_supported) for status in patch_statuses],
+                            columns=["os_name", "is_supported"]
+                        )
+                    # One grouped pass: supported = True count, unsupported = the rest
+                    counts = support_frame["is_supported"].astype(bool).groupby(support_frame["os_name"]).agg(["sum", "count"])
+
+                    for os_name, supported, total_for_os in counts.itertuples():
+                        supported = int(supported)
+                        unsupported = int(total_for_os) - supported
+                        if unsupported > 0:
+                            self.ui.print_message(f"   {os_name}: {supported} supported, {unsupported} unsupported", "yellow")
+                        else:
+                            print(f"   {os_name}: {supported} supported")
 
-                elif view_choice == "6":
-                    # Export to CSV
-                    timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
-                    export_dir = Path(self.config.export_path) / "equipment" / "os_patch"
-                    export_dir.mkdir(parents=True, exist_ok=True)
+                self.ui.press_any_key()
 
-                    files_exported = []
+            elif view_choice == "3":
+                # Devices needing attention
+                print("\n" + _SEP80)
+                self.ui.print_message("DEVICES NEEDING ATTENTION", "cyan")
+                print(_SEP80)
+                attention = stats.get("devices_needing_attention", {})
+                if attention.get("count", 0) > 0:
+                    print(f"Total devices needing attention: {attention['count']}\n")
+                    lines = []
+                    for i, device in enumerate(attention.get("devices", [])[:10], 1):
+                        name, os_name, version, issues = _ATTENTION_DEVICE_FIELDS(device)
+                        lines += [
+                            f"{i}. {name}",
+                            f"   OS: {os_name} {version}",
+                            f"   Issues: {', '.join(issues)}",
+                            "",
+                        ]
+                    if lines:
+                        _emit(*lines)
+                    if attention['count'] > 10:
+                        print(f"... and {attention['count'] - 10} more devices")
+                else:
+                    self.ui.print_message("No devices needing attention!", "success")
+                self.ui.press_any_key()
 
-                    # Export summary
-                    if not df.empty:
-                        csv_path = export_dir / f"os_patch_summary_{timestamp}.csv"
-                        df.to_csv(csv_path, index=False, encoding='utf-8-sig')
-                        files_exported.append(csv_path)
+            elif view_choice == "4":
+                # Compliance score distribution
+                print("\n" + _SEP60)
+                self.ui.print_message("COMPLIANCE SCORE DISTRIBUTION", "cyan")
+                print(_SEP60)
+                distribution = compliance_scores.get("distribution", {})
+
+                lines = []
+                for key, label, color in _COMPLIANCE_BANDS:
+                    line = f"   {label}: {distribution.get(key, 0)}"
+                    lines.append(self.ui.format_message(line, color) if color else line)
+                _emit(*lines)
+
+                print(f"\n   Average Score: {compliance_scores.get('average', 0):.1f}%")
+                print(f"   Min Score: {compliance_scores.get('min', 0):.1f}%")
+                print(f"   Max Score: {compliance_scores.get('max', 0):.1f}%")
+                self.ui.press_any_key()
 
-                    # Export detailed results
-                    if not detailed_df.empty:
-                        # Limit to 1000 rows
-                        if len(detailed_df) > 1000:
-                            detailed_sample = detailed_df.head(1000)
-                        else:
-                            detailed_sample = detailed_df
-                        csv_path = export_dir / f"os_patch_detailed_{timestamp}.csv"
-                        detailed_sample.to_csv(csv_path, index=False, encoding='utf-8-sig')
-                        files_exported.append(csv_path)
+            elif view_choice == "5":
+                # Full report text
+                print("\n")
+                if report_text:
+                    print(report_text)
+                else:
+                    print("No detailed report text available")
+                self.ui.press_any_key()
 
-                    # Export report text
-                    if report_text:
-                        txt_path = export_dir / f"os_patch_report_{timestamp}.txt"
-                        with open(txt_path, 'w', encoding='utf-8') as f:
-                            f.write(report_text)
-                        files_exported.append(txt_path)
-
-                    if files_exported:
-                        self.ui.print_message(f"\nExported {len(files_exported)} files to: {export_dir}", "success")
-                        for f in files_exported:
-                            print(f"   - {f.name}")
-                    else:
-                        self.ui.print_message("No data to export", "yellow")
-                    self.ui.press_any_key()
+            elif view_choice == "6":
+                # Export to CSV
+                timestamp = self._export_timestamp()
+                export_dir = self._equipment_export_dir("os_patch")
+
+                export_tasks = []
 
+                # Export summary
+                if not df.empty:
+                    csv_path = export_dir / f"os_patch_summary_{timestamp}.csv"
+                    export_tasks.append(partial(export_dataframe, df, csv_path, self.config.export_format))
+
+                # Export detailed results
+                if not detailed_df.empty:
+                    # Limit to 1000 rows; head() slices without copying the column data
+                    detailed_sample = detailed_df.head(1000)
+                    csv_path = export_dir / f"os_patch_detailed_{timestamp}.csv"
+                    export_tasks.append(partial(export_dataframe, detailed_sample, csv_path, self.config.export_format))
+
+                # Export report text
+                if report_text:
+                    txt_path = export_dir / f"os_patch_report_{timestamp}.txt"
+                    if report_bytes is None:
+                        report_bytes = encode_report(report_text)
+                    export_tasks.append(partial(write_export_bytes, txt_path, report_bytes))
+
+                # The files are independent, so write them concurrently
+                files_exported = run_export_tasks(export_tasks)
+
+                if files_exported:
+                    self.ui.print_message(f"\nExported {len(files_exported)} files to: {export_dir}", "success")
+                    for f in files_exported:
+                        print(f"   - {f.name}")
                 else:
-                    self.ui.print_message("Invalid option", "yellow")
-                    await asyncio.sleep(1)
+                    self.ui.print_message("No data to export", "yellow")
+                self.ui.press_any_key()
 
-        except Exception as e:
-            self.ui.print_message(f"\nError: {e}", "red")
-            import traceback
-            traceback.print_exc()
-            self.ui.press_any_key()
+            else:
+                self.ui.print_message("Invalid option", "yellow")
 
+    @_guarded
     async def run_asset_tracking_report(self):
         """Generate comprehensive asset tracking report with serial numbers,
         financial tracking, warranty management, and audit capabilities"""
         assert self.ui is not None
+        import pandas as pd
 
-        start_time = datetime.now()
+        start_time = time.perf_counter()
 
         self.ui.clear_screen()
         self.ui.print_header("Asset Tracking & Inventory Report")
 
-        try:
-            # Initialize equipment reports with config
-            export_dir = Path(self.config.export_path) / "equipment"
-            equipment_reports = EquipmentReports(self.auth, export_dir=export_dir, config=self.config)
-
-            # Generate the report
-            result = await equipment_reports.generate_asset_tracking_report(
-                export_to_csv=False,
-                include_raw_data=True
-            )
-
-            df = result["dataframe"]
-            stats = result["statistics"]
-            assets = result.get("assets", [])
-            summary = result.get("summary")
-            report_text = result.get("report_text", "")
-            audit_report = result.get("audit_report", "")
-            assets_df = result.get("assets_inventory", pd.DataFrame())
-            financial_df = result.get("financial_details", pd.DataFrame())
-            asset_tracker = result.get("asset_tracker")
-
-            # Calculate execution time
-            end_time = datetime.now()
-            duration = (end_time - start_time).total_seconds()
-
-            if df.empty:
-                self.ui.print_message("\nNo devices found.", "yellow")
-                self.ui.press_any_key()
-                return
+        # Initialize equipment reports with config
+        equipment_reports = self._get_equipment_reports()
+
+        # Generate the report
+        result = await equipment_reports.generate_asset_tracking_report(
+            export_to_csv=False,
+            include_raw_data=True
+        )
+
+        df = result["dataframe"]
+        stats = result["statistics"]
+        assets = result.get("assets", [])
+        summary = result.get("summary")
+        report_text = result.get("report_text", "")
+        audit_report = result.get("audit_report", "")
+        assets_df = result.get("assets_inventory", pd.DataFrame())
+        financial_df = result.get("financial_details", pd.DataFrame())
+        asset_tracker = result.get("asset_tracker")
+
+        # Calculate execution time
+        duration = time.perf_counter() - start_time
+
+        if df.empty:
+            self.ui.print_message("\nNo devices found.", "yellow")
+            self.ui.press_any_key()
+            return
 
-            # Display summary
-            self.ui.clear_screen()
-            self.ui.print_header("ASSET TRACKING & INVENTORY - RESULTS")
-
-            print("\nInventory Summary:")
-            print(f"   Total devices: {stats.get('total_devices', 0)}")
-            print(f"   With serial number: {stats.get('with_serial_number', 0)}")
-            print(f"   Without serial number: {stats.get('without_serial_number', 0)}")
-            print(f"   Serial coverage: {stats.get('serial_coverage', 0):.1f}%")
-            print(f"   Duration: {duration:.2f} seconds")
-
-            # Show extended statistics
-            if summary:
-                print("\nFinancial Summary:")
-                self.ui.print_message(f"   Total Current Value: ${stats.get('total_current_value', 0):,.2f}", "success")
-                print(f"   Total Purchase Value: ${stats.get('total_purchase_value', 0):,.2f}")
-                print(f"   Total Depreciation: ${stats.get('total_depreciation', 0):,.2f}")
-
-                if stats.get('assets_needing_attention', 0) > 0:
-                    self.ui.print_message(f"\n   Assets Needing Attention: {stats.get('assets_needing_attention', 0)}", "red")
-
-            # Show view options menu
-            while True:
-                print("\nView Options:")
-                print("1. Summary table (all devices)")
-                print("2. Asset type breakdown")
-                print("3. Warranty status breakdown")
-                print("4. Financial details")
-                print("5. Assets needing attention")
-                print("6. Audit report")
-                print("7. Full inventory report")
-                print("8. Search assets")
-                print("9. Export to CSV")
-                print("B. Back to menu")
-
-                view_choice = self.ui.get_input("\nSelect view option: ", "B")
-
-                if view_choice.upper() == "B":
-                    return
-
-                elif view_choice == "1":
-                    # Summary table
-                    print("\n" + "=" * 80)
-                    self.ui.print_message("ALL DEVICES", "cyan")
-                    print("=" * 80)
-                    display_cols = ["Device Name", "Serial Number", "Manufacturer",
+        # Display summary
+        self.ui.clear_screen()
+        self.ui.print_header("ASSET TRACKING & INVENTORY - RESULTS")
+
+        # Read the figures shown by several views once
+        total_devices = stats.get("total_devices", 0)
+        total_purchase = stats.get("total_purchase_value", 0)
+        total_current = stats.get("total_current_value", 0)
+        total_depreciation = stats.get("total_depreciation", 0)
+        attention_count = stats.get("assets_needing_attention", 0)
+        dep_rate = (total_depreciation / total_purchase * 100) if total_purchase > 0 else 0
+
+        _emit(
+            "\nInventory Summary:",
+            f"   Total devices: {total_devices}",
+            f"   With serial number: {stats.get('with_serial_number', 0)}",
+            f"   Without serial number: {stats.get('without_serial_number', 0)}",
+            f"   Serial coverage: {stats.get('serial_coverage', 0):.1f}%",
+            f"   Duration: {duration:.2f} seconds"
+        )
+
+        # Show extended statistics
+        if summary:
+            print("\nFinancial Summary:")
+            self.ui.print_message(f"   Total Current Value: ${total_current:,.2f}", "success")
+            print(f"   Total Purchase Value: ${total_purchase:,.2f}")
+            print(f"   Total Depreciation: ${total_depreciation:,.2f}")
+
+            if attention_count > 0:
+                self.ui.print_message(f"\n   Assets Needing Attention: {attention_count}", "red")
+
+        # Encoded on first export, then reused
+        report_bytes = None
+        audit_bytes = None
+
+        # Resolve displayed columns once, outside the view loop
+        summary_cols = [c for c in ["Device Name", "Serial Number", "Manufacturer",
                                     "Model", "Operating System", "Assigned User"]
-                    available_cols = [c for c in display_cols if c in df.columns]
-                    print(df[available_cols].to_string(index=False))
-                    self.ui.press_any_key()
+                        if c in df.columns]
+
+        # Filter and sort once, outside the view loop
+        attention_assets = [a for a in assets if a.requires_attention]
+        top_financial_df = None
+        top_financial_cols = []
+        if not financial_df.empty:
+            top_financial_df = financial_df.sort_values("current_value", ascending=False).head(10)
+            top_financial_cols = [c for c in ["device_name", "asset_type", "purchase_price", "current_value"]
+                                  if c in top_financial_df.columns]
+
+        # Show view options menu
+        while True:
+            _emit(
+                "\nView Options:",
+                "1. Summary table (all devices)",
+                "2. Asset type breakdown",
+                "3. Warranty status breakdown",
+                "4. Financial details",
+                "5. Assets needing attention",
+                "6. Audit report",
+                "7. Full inventory report",
+                "8. Search assets",
+                "9. Export to CSV",
+                "B. Back to menu"
+            )
 
-                elif view_choice == "2":
-                    # Asset type breakdown
-                    print("\n" + "=" * 60)
-                    self.ui.print_message("ASSET TYPE BREAKDOWN", "cyan")
-                    print("=" * 60)
-                    type_counts = stats.get("type_counts", {})
-                    total = stats.get("total_devices", 1)
-                    if type_counts:
-                        for asset_type, count in sorted(type_counts.items(), key=lambda x: x[1], reverse=True):
-                            pct = (count / total * 100) if total > 0 else 0
-                            print(f"   {asset_type.title()}: {count} devices ({pct:.1f}%)")
-                    else:
-                        # Fallback to manufacturer breakdown
-                        mfr_dist = stats.get("manufacturer_distribution", {})
-                        for mfr, count in sorted(mfr_dist.items(), key=lambda x: x[1], reverse=True):
-                            pct = (count / total * 100) if total > 0 else 0
-                            print(f"   {mfr}: {count} devices ({pct:.1f}%)")
-                    self.ui.press_any_key()
+            view_choice = self.ui.get_input("\nSelect view option: ", "B")
 
-                elif view_choice == "3":
-                    # Warranty status breakdown
-                    print("\n" + "=" * 60)
-                    self.ui.print_message("WARRANTY STATUS BREAKDOWN", "cyan")
-                    print("=" * 60)
-                    warranty_counts = stats.get("warranty_counts", {})
-                    total = stats.get("total_devices", 1)
-                    if warranty_counts:
-                        for status, count in sorted(warranty_counts.items()):
-                            pct = (count / total * 100) if total > 0 else 0
-                            status_display = status.replace('_', ' ').title()
-                            if status == "expired":
-                                self.ui.print_message(f"   {status_display}: {count} ({pct:.1f}%)", "red")
-                            elif status == "expiring_soon":
-                                self.ui.print_message(f"   {status_display}: {count} ({pct:.1f}%)", "yellow")
-                            elif status == "active":
-                                self.ui.print_message(f"   {status_display}: {count} ({pct:.1f}%)", "success")
-                            else:
-                                print(f"   {status_display}: {count} ({pct:.1f}%)")
-                    else:
-                        print("   No warranty data available")
-                    self.ui.press_any_key()
+            if view_choice.upper() == "B":
+                return
 
-                elif view_choice == "4":
-                    # Financial details
-                    print("\n" + "=" * 60)
-                    self.ui.print_message("FINANCIAL DETAILS", "cyan")
-                    print("=" * 60)
-                    print(f"\n   Total Purchase Value: ${stats.get('total_purchase_value', 0):,.2f}")
-                    print(f"   Total Current Value: ${stats.get('total_current_value', 0):,.2f}")
-                    print(f"   Total Depreciation: ${stats.get('total_depreciation', 0):,.2f}")
-
-                    purchase_val = stats.get('total_purchase_value', 0)
-                    depreciation = stats.get('total_depreciation', 0)
-                    if purchase_val > 0:
-                        dep_rate = (depreciation / purchase_val * 100)
-                        print(f"   Overall Depreciation Rate: {dep_rate:.1f}%")
-
-                    # Show age distribution
-                    age_dist = stats.get("assets_by_age", {})
-                    if age_dist:
-                        print("\n   Asset Age Distribution:")
-                        for age_group, count in sorted(age_dist.items()):
-                            pct = (count / stats.get('total_devices', 1) * 100) if stats.get('total_devices', 0) > 0 else 0
-                            print(f"      {age_group}: {count} ({pct:.1f}%)")
-
-                    # Show financial details table if available
-                    if not financial_df.empty:
-                        print("\n   Top 10 Assets by Value:")
-                        print("-" * 60)
-                        sorted_df = financial_df.sort_values("current_value", ascending=False).head(10)
-                        display_cols = ["device_name", "asset_type", "purchase_price", "current_value"]
-                        available_cols = [c for c in display_cols if c in sorted_df.columns]
-                        if available_cols:
-                            print(sorted_df[available_cols].to_string(index=False))
+            elif view_choice == "1":
+                # Summary table
+                print("\n" + _SEP80)
+                self.ui.print_message("ALL DEVICES", "cyan")
+                print(_SEP80)
+                print_df(df, summary_cols, max_rows=MAX_TTY_ROWS)
+                self.ui.press_any_key()
 
-                    self.ui.press_any_key()
+            elif view_choice == "2":
+                # Asset type breakdown
+                print("\n" + _SEP60)
+                self.ui.print_message("ASSET TYPE BREAKDOWN", "cyan")
+                print(_SEP60)
+                type_counts = stats.get("type_counts", {})
+                if type_counts:
+                    for asset_type, count, pct in ranked_distribution(type_counts, total_devices):
+                        print(f"   {asset_type.title()}: {count} devices ({pct:.1f}%)")
+                else:
+                    # Fallback to manufacturer breakdown
+                    mfr_dist = stats.get("manufacturer_distribution", {})
+                    for mfr, count, pct in ranked_distribution(mfr_dist, total_devices):
+                        print(f"   {mfr}: {count} devices ({pct:.1f}%)")
+                self.ui.press_any_key()
 
-                elif view_choice == "5":
-                    # Assets needing attention
-                    print("\n" + "=" * 80)
-                    self.ui.print_message("ASSETS NEEDING ATTENTION", "cyan")
-                    print("=" * 80)
-
-                    attention_count = stats.get('assets_needing_attention', 0)
-                    if attention_count > 0:
-                        print(f"\nTotal: {attention_count} assets require attention\n")
-
-                        # Get attention assets
-                        attention_assets = [a for a in assets if a.requires_attention]
-                        for i, asset in enumerate(attention_assets[:15], 1):  # Show first 15
-                            print(f"{i}. {asset.device_name}")
-                            print(f"   Type: {asset.asset_type.value.title()}")
-                            print(f"   Serial: {asset.serial_number[:20]}{'...' if len(asset.serial_number) > 20 else ''}")
-                            self.ui.print_message(f"   Issues: {asset.attention_reason}", "yellow")
-                            if i < len(attention_assets) and i < 15:
-                                print()
-
-                        if len(attention_assets) > 15:
-                            print(f"\n... and {len(attention_assets) - 15} more assets")
-                    else:
-                        self.ui.print_message("No assets require immediate attention!", "success")
+            elif view_choice == "3":
+                # Warranty status breakdown
+                print("\n" + _SEP60)
+                self.ui.print_message("WARRANTY STATUS BREAKDOWN", "cyan")
+                print(_SEP60)
+                warranty_counts = stats.get("warranty_counts", {})
+                if warranty_counts:
+                    lines = []
+                    for status, label, color in _WARRANTY_STYLES:
+                        if status not in warranty_counts:
+                            continue
+                        count = warranty_counts[status]
+                        pct = (count / total_devices * 100) if total_devices > 0 else 0
+                        line = f"   {label}: {count} ({pct:.1f}%)"
+                        lines.append(self.ui.format_message(line, color) if color else line)
+                    if lines:
+                        _emit(*lines)
+                else:
+                    print("   No warranty data available")
+                self.ui.press_any_key()
 
-                    self.ui.press_any_key()
+            elif view_choice == "4":
+                # Financial details
+                print("\n" + _SEP60)
+                self.ui.print_message("FINANCIAL DETAILS", "cyan")
+                print(_SEP60)
+                print(f"\n   Total Purchase Value: ${total_purchase:,.2f}")
+                print(f"   Total Current Value: ${total_current:,.2f}")
+                print(f"   Total Depreciation: ${total_depreciation:,.2f}")
+
+                if total_purchase > 0:
+                    print(f"   Overall Depreciation Rate: {dep_rate:.1f}%")
+
+                # Show age distribution
+                age_dist = stats.get("assets_by_age", {})
+                if age_dist:
+                    print("\n   Asset Age Distribution:")
+                    for age_group, count, pct in ranked_distribution(age_dist, total_devices, by_count=False):
+                        print(f"      {age_group}: {count} ({pct:.1f}%)")
+
+                # Show financial details table if available
+                if top_financial_df is not None:
+                    print("\n   Top 10 Assets by Value:")
+                    print(_RULE60)
+                    if top_financial_cols:
+                        print_df(top_financial_df, top_financial_cols)
 
-                elif view_choice == "6":
-                    # Audit report
-                    print("\n" + "=" * 80)
-                    self.ui.print_message("AUDIT REPORT", "cyan")
-                    print("=" * 80)
-                    if audit_report:
-                        print("\n" + audit_report)
-                    else:
-                        print("\nNo audit report available")
-                    self.ui.press_any_key()
+                self.ui.press_any_key()
 
-                elif view_choice == "7":
-                    # Full inventory report
-                    print("\n")
-                    if report_text:
-                        print(report_text)
-                    else:
-                        print("No detailed report text available")
-                    self.ui.press_any_key()
+            elif view_choice == "5":
+                # Assets needing attention
+                print("\n" + _SEP80)
+                self.ui.print_message("ASSETS NEEDING ATTENTION", "cyan")
+                print(_SEP80)
+
+                if attention_count > 0:
+                    print(f"\nTotal: {attention_count} assets require attention\n")
+
+                    lines = []
+                    for i, asset in enumerate(attention_assets[:15], 1):  # Show first 15
+                        serial = asset.serial_number
+                        lines += [
+                            f"{i}. {asset.device_name}",
+                            f"   Type: {asset.asset_type.value.title()}",
+                            f"   Serial: {serial[:20]}{'...' if len(serial) > 20 else ''}",
+                            self.ui.format_message(f"   Issues: {asset.attention_reason}", "yellow"),
+                        ]
+                        if i < len(attention_assets) and i < 15:
+                            lines.append("")
+                    if lines:
+                        _emit(*lines)
+
+                    if len(attention_assets) > 15:
+                        print(f"\n... and {len(attention_assets) - 15} more assets")
+                else:
+                    self.ui.print_message("No assets require immediate attention!", "success")
 
-                elif view_choice == "8":
-                    # Search assets
-                    await self._search_assets_menu(asset_tracker)
+                self.ui.press_any_key()
 
-                elif view_choice == "9":
-                    # Export to CSV
-                    timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
-                    export_dir = Path(self.config.export_path) / "equipment" / "asset_tracking"
-                    export_dir.mkdir(parents=True, exist_ok=True)
+            elif view_choice == "6":
+                # Audit report
+                print("\n" + _SEP80)
+                self.ui.print_message("AUDIT REPORT", "cyan")
+                print(_SEP80)
+                if audit_report:
+                    print("\n" + audit_report)
+                else:
+                    print("\nNo audit report available")
+                self.ui.press_any_key()
 
-                    files_exported = []
+            elif view_choice == "7":
+                # Full inventory report
+                print("\n")
+                if report_text:
+                    print(report_text)
+                else:
+                    print("No detailed report text available")
+                self.ui.press_any_key()
 
-                    # Export device list
-                    if not df.empty:
-                        csv_path = export_dir / f"device_list_{timestamp}.csv"
-                        df.to_csv(csv_path, index=False, encoding='utf-8-sig')
-                        files_exported.append(csv_path)
-
-                    # Export asset inventory
-                    if not assets_df.empty:
-                        csv_path = export_dir / f"asset_inventory_{timestamp}.csv"
-                        assets_df.to_csv(csv_path, index=False, encoding='utf-8-sig')
-                        files_exported.append(csv_path)
-
-                    # Export financial details
-                    if not financial_df.empty:
-                        csv_path = export_dir / f"asset_financial_{timestamp}.csv"
-                        financial_df.to_csv(csv_path, index=False, encoding='utf-8-sig')
-                        files_exported.append(csv_path)
+            elif view_choice == "8":
+                # Search assets
+                await self._search_assets_menu(asset_tracker)
 
-                    # Export report text
-                    if report_text:
-                        txt_path = export_dir / f"asset_report_{timestamp}.txt"
-                        with open(txt_path, 'w', encoding='utf-8') as f:
-                            f.write(report_text)
-                        files_exported.append(txt_path)
-
-                    # Export audit report
-                    if audit_report:
-                        txt_path = export_dir / f"asset_audit_{timestamp}.txt"
-                        with open(txt_path, 'w', encoding='utf-8') as f:
-                            f.write(audit_report)
-                        files_exported.append(txt_path)
-
-                    if files_exported:
-                        self.ui.print_message(f"\nExported {len(files_exported)} files to: {export_dir}", "success")
-                        for f in files_exported:
-                            print(f"   - {f.name}")
-                    else:
-                        self.ui.print_message("No data to export", "yellow")
+            elif view_choice == "9":
+                # Export to CSV
+                timestamp = self._export_timestamp()
+                export_dir = self._equipment_export_dir("asset_tracking")
 
-                    self.ui.press_any_key()
+                export_tasks = []
 
+                # Export device list
+                if not df.empty:
+                    csv_path = export_dir / f"device_list_{timestamp}.csv"
+                    export_tasks.append(partial(fast_to_csv, df, csv_path))
+
+                # Export asset inventory
+                if not assets_df.empty:
+                    csv_path = export_dir / f"asset_inventory_{timestamp}.csv"
+                    export_tasks.append(partial(fast_to_csv, assets_df, csv_path))
+
+                # Export financial details
+                if not financial_df.empty:
+                    csv_path = export_dir / f"asset_financial_{timestamp}.csv"
+                    export_tasks.append(partial(fast_to_csv, financial_df, csv_path))
+
+                # Export report text
+                if report_text:
+                    txt_path = export_dir / f"asset_report_{timestamp}.txt"
+                    if report_bytes is None:
+                        report_bytes = encode_report(report_text)
+                    export_tasks.append(partial(write_export_bytes, txt_path, report_bytes))
+
+                # Export audit report
+                if audit_report:
+                    txt_path = export_dir / f"asset_audit_{timestamp}.txt"
+                    if audit_bytes is None:
+                        audit_bytes = encode_report(audit_report)
+                    export_tasks.append(partial(write_export_bytes, txt_path, audit_bytes))
+
+                # The files are independent, so write them concurrently
+                files_exported = run_export_tasks(export_tasks)
+
+                if files_exported:
+                    self.ui.print_message(f"\nExported {len(files_exported)} files to: {export_dir}", "success")
+                    for f in files_exported:
+                        print(f"   - {f.name}")
                 else:
-                    self.ui.print_message("Invalid option", "yellow")
-                    await asyncio.sleep(1)
+                    self.ui.print_message("No data to export", "yellow")
 
-        except Exception as e:
-            self.ui.print_message(f"\nError: {e}", "red")
-            import traceback
-            traceback.print_exc()
-            self.ui.press_any_key()
+                self.ui.press_any_key()
+
+            else:
+                self.ui.print_message("Invalid option", "yellow")
 
     async def _search_assets_menu(self, asset_tracker=None):
         """Interactive asset search submenu"""
         from modules.asset_tracker import AssetTracker, AssetType
 
-        if not asset_tracker:
-            export_dir = Path(self.config.export_path) / "equipment"
-            equipment_reports = EquipmentReports(self.auth, export_dir=export_dir, config=self.config)
-            asset_tracker = AssetTracker(self.auth, self.config)
+        # Reuse the tracker from the last asset report, or build one only once
+        if asset_tracker:
+            self._asset_tracker = asset_tracker
+        elif self._asset_tracker:
+            asset_tracker = self._asset_tracker
+        else:
+            asset_tracker = self._asset_tracker = AssetTracker(self.auth, self.config)
 
         while True:
-            print("\n" + "=" * 60)
+            print("\n" + _SEP60)
             self.ui.print_message("ASSET SEARCH", "cyan")
-            print("=" * 60)
+            print(_SEP60)
             print("\n1. Search by serial number")
             print("2. Search by user/assignee")
             print("3. Search by asset type")
@@ -1278,7 +1651,7 @@ class EntraLense:
 
                 if type_choice in type_map:
                     asset_type = type_map[type_choice]
-                    matches = [a for a in asset_tracker.assets.values() if a.asset_type == asset_type]
+                    matches = asset_tracker.find_assets_by_type(asset_type)
                     self._display_asset_search_results(matches, f"type '{asset_type.value}'")
                 else:
                     self.ui.print_message("Invalid selection", "yellow")
@@ -1295,548 +1668,502 @@ class EntraLense:
             return
 
         self.ui.print_message(f"\nFound {len(matches)} assets with {search_desc}", "success")
-        print("\n" + "=" * 80)
+        print("\n" + _SEP80)
 
+        # Collected and written in one go rather than a print per field
+        lines = []
         for i, asset in enumerate(matches[:20], 1):  # Show first 20
-            print(f"\n{i}. {asset.device_name}")
-            print(f"   Serial: {asset.serial_number}")
-            print(f"   Type: {asset.asset_type.value.title()}")
-            print(f"   Manufacturer: {asset.manufacturer}")
-            print(f"   Model: {asset.model}")
-            print(f"   Assigned to: {asset.assigned_to or 'Unassigned'}")
-            print(f"   Status: {asset.status.value.title()}")
-            print(f"   Warranty: {asset.warranty_status.value.replace('_', ' ').title()}")
+            lines += [
+                f"\n{i}. {asset.device_name}",
+                f"   Serial: {asset.serial_number}",
+                f"   Type: {asset.asset_type.value.title()}",
+                f"   Manufacturer: {asset.manufacturer}",
+                f"   Model: {asset.model}",
+                f"   Assigned to: {asset.assigned_to or 'Unassigned'}",
+                f"   Status: {asset.status.value.title()}",
+                f"   Warranty: {asset.warranty_status.value.replace('_', ' ').title()}",
+            ]
 
             if asset.requires_attention:
-                self.ui.print_message(f"   Requires attention: {asset.attention_reason}", "yellow")
+                lines.append(self.ui.format_message(f"   Requires attention: {asset.attention_reason}", "yellow"))
+        _emit(*lines)
 
         if len(matches) > 20:
             print(f"\n... and {len(matches) - 20} more assets")
 
-        print("\n" + "=" * 80)
+        print("\n" + _SEP80)
 
+    @_guarded
     async def run_login_activity_report(self):
         """Generate login activity report (Limited Batch Mode)"""
         assert self.ui is not None
         assert self.reports is not None
 
         days = 30  # Default period
-        start_time = datetime.now()
+        start_time = time.perf_counter()
 
         self.ui.clear_screen()
         self.ui.print_header("Login Activity Report")
 
-        try:
-            # Call the report
-            result = await self.reports.get_login_activity(
-                days_back=days,
-                specific_user=None,
-                output_csv=False,  # Don't auto-export, let user choose
-                max_users=None,
-                include_raw_data=True
-            )
+        # Call the report
+        result = await self.reports.get_login_activity(
+            days_back=days,
+            specific_user=None,
+            output_csv=False,  # Don't auto-export, let user choose
+            max_users=None,
+            include_raw_data=True
+        )
 
-            df = result["dataframe"]
-            raw_data = result["raw_data"]
-            users_processed = result["users_processed"]
+        df = result["dataframe"]
+        raw_data = result["raw_data"]
+        users_processed = result["users_processed"]
 
-            # Calculate execution time
-            end_time = datetime.now()
-            duration = (end_time - start_time).total_seconds()
+        # Calculate execution time
+        duration = time.perf_counter() - start_time
 
-            if df.empty:
-                self.ui.print_message("\nNo data returned.", "yellow")
-                self.ui.press_any_key()
-                return
+        if df.empty:
+            self.ui.print_message("\nNo data returned.", "yellow")
+            self.ui.press_any_key()
+            return
 
-            # Display summary
-            print("\n" + "=" * 60)
-            self.ui.print_message("                    REPORT SUMMARY", "yellow")
-            print("=" * 60)
-            print(f"\nProcessed: {users_processed} users")
-            print(f"Duration: {duration:.2f} seconds")
-            print(f"Period: Last {days} days")
-
-            # Show view options menu
-            while True:
-                print("\nView Options:")
-                print("1. Summary table")
-                print("2. Raw API response (first user)")
-                print("3. Export to CSV")
-                print("B. Back to menu")
-
-                view_choice = self.ui.get_input("\nSelect view option: ", "B")
-
-                if view_choice.upper() == "B":
-                    return
-
-                elif view_choice == "1":
-                    # Display summary table
-                    print("\n" + "=" * 60)
-                    self.ui.print_message("SUMMARY TABLE", "cyan")
-                    print("=" * 60)
-                    display_cols = ["User Principal Name", "Display Name", "Account Enabled", "Total Sign-Ins", "Last Sign-In"]
-                    available_cols = [c for c in display_cols if c in df.columns]
-                    print(df[available_cols].to_string(index=False))
-                    self.ui.press_any_key()
+        # Display summary
+        print("\n" + _SEP60)
+        self.ui.print_message("                    REPORT SUMMARY", "yellow")
+        print(_SEP60)
+        print(f"\nProcessed: {users_processed} users")
+        print(f"Duration: {duration:.2f} seconds")
+        print(f"Period: Last {days} days")
 
-                elif view_choice == "2":
-                    # Show raw API response for first user with data
-                    user_with_data = None
-                    for user_data in raw_data:
-                        if user_data.get("sign_ins"):
-                            user_with_data = user_data
-                            break
-
-                    if user_with_data:
-                        print(f"\nRaw API Response for: {user_with_data['user_principal_name']}")
-                        print("=" * 60)
-                        sign_ins = user_with_data["sign_ins"][:3]  # Show first 3
-                        for i, signin in enumerate(sign_ins):
-                            print(f"\n--- Sign-in {i+1} ---")
-                            print(f"  Created: {signin.created_date_time}")
-                            print(f"  App: {signin.app_display_name}")
-                            print(f"  Status: {signin.status.error_code if signin.status else 'N/A'}")
-                            print(f"  IP: {signin.ip_address}")
-                            print(f"  Location: {signin.location.city if signin.location else 'N/A'}, {signin.location.country_or_region if signin.location else 'N/A'}")
-                        print(f"\n(Showing first 3 of {len(user_with_data['sign_ins'])} sign-ins)")
-                    else:
-                        self.ui.print_message("No sign-in data available to display", "yellow")
-                    self.ui.press_any_key()
+        # Resolve displayed columns once, outside the view loop
+        summary_cols = [c for c in ["User Principal Name", "Display Name", "Account Enabled",
+                                    "Total Sign-Ins", "Last Sign-In"]
+                        if c in df.columns]
 
-                elif view_choice == "3":
-                    # Export to CSV
-                    timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
-                    csv_path = self.reports.export_dir / f"LoginReport_{timestamp}.csv"
-                    df.to_csv(csv_path, index=False, encoding='utf-8-sig')
-                    self.ui.print_message(f"\nExported to: {csv_path}", "success")
-                    self.ui.press_any_key()
+        # Show view options menu
+        while True:
+            print("\nView Options:")
+            print("1. Summary table")
+            print("2. Raw API response (first user)")
+            print("3. Export to CSV")
+            print("B. Back to menu")
+
+            view_choice = self.ui.get_input("\nSelect view option: ", "B")
+
+            if view_choice.upper() == "B":
+                return
+
+            elif view_choice == "1":
+                # Display summary table
+                print("\n" + _SEP60)
+                self.ui.print_message("SUMMARY TABLE", "cyan")
+                print(_SEP60)
+                print_df(df, summary_cols)
+                self.ui.press_any_key()
 
+            elif view_choice == "2":
+                # Show raw API response for first user with data (located while the report ran)
+                idx = result.get("first_signin_idx")
+                user_with_data = raw_data[idx] if idx is not None else None
+
+                if user_with_data:
+                    print(f"\nRaw API Response for: {user_with_data['user_principal_name']}")
+                    print(_SEP60)
+                    sign_ins = user_with_data["sign_ins"][:3]  # Show first 3
+                    for i, signin in enumerate(sign_ins):
+                        print(f"\n--- Sign-in {i+1} ---")
+                        print(f"  Created: {signin.created_date_time}")
+                        print(f"  App: {signin.app_display_name}")
+                        print(f"  Status: {signin.status.error_code if signin.status else 'N/A'}")
+                        print(f"  IP: {signin.ip_address}")
+                        print(f"  Location: {signin.location.city if signin.location else 'N/A'}, {signin.location.country_or_region if signin.location else 'N/A'}")
+                    print(f"\n(Showing first 3 of {len(user_with_data['sign_ins'])} sign-ins)")
                 else:
-                    self.ui.print_message("Invalid option", "yellow")
-                    await asyncio.sleep(1)
+                    self.ui.print_message("No sign-in data available to display", "yellow")
+                self.ui.press_any_key()
 
-        except Exception as e:
-            self.ui.print_message(f"\nError: {e}", "red")
-            import traceback
-            traceback.print_exc()
-            self.ui.press_any_key()
+            elif view_choice == "3":
+                # Export to CSV
+                timestamp = self._export_timestamp()
+                csv_path = self.reports.export_dir / f"LoginReport_{timestamp}.csv"
+                export_path = export_dataframe(df, csv_path, self.config.export_format)
+                self.ui.print_message(f"\nExported to: {export_path}", "success")
+                self.ui.press_any_key()
 
+            else:
+                self.ui.print_message("Invalid option", "yellow")
+
+    @_guarded
     async def run_privileged_access_report(self):
         """Generate privileged access inventory report"""
         assert self.ui is not None
         assert self.reports is not None
 
         user_limit = None  # None = all users
-        start_time = datetime.now()
+        start_time = time.perf_counter()
 
         self.ui.clear_screen()
         self.ui.print_header("Privileged Access Inventory Report")
 
-        try:
-            # Call the report
-            result = await self.reports.get_privileged_access_inventory(
-                max_users=user_limit,
-                include_raw_data=True
-            )
+        # Call the report
+        result = await self.reports.get_privileged_access_inventory(
+            max_users=user_limit,
+            include_raw_data=True
+        )
 
-            df = result["dataframe"]
-            raw_data = result["raw_data"]
-            users_scanned = result["users_scanned"]
-            users_with_roles = result["users_with_roles"]
-            high_risk_count = result["high_risk_count"]
+        df = result["dataframe"]
+        raw_data = result["raw_data"]
+        users_scanned = result["users_scanned"]
+        users_with_roles = result["users_with_roles"]
+        high_risk_count = result["high_risk_count"]
 
-            # Calculate execution time
-            end_time = datetime.now()
-            duration = (end_time - start_time).total_seconds()
+        # Calculate execution time
+        duration = time.perf_counter() - start_time
 
-            # Display summary
-            self.ui.clear_screen()
-            self.ui.print_header("PRIVILEGED ACCESS INVENTORY - RESULTS")
+        # Display summary
+        self.ui.clear_screen()
+        self.ui.print_header("PRIVILEGED ACCESS INVENTORY - RESULTS")
+
+        _emit(
+            "\nSummary Statistics:",
+            f"   Users scanned: {users_scanned}",
+            f"   Users with privileged roles: {users_with_roles}",
+            f"   High-risk roles found: {high_risk_count}",
+            f"   Duration: {duration:.2f} seconds"
+        )
+
+        if df.empty:
+            self.ui.print_message(f"\nNo users with privileged roles found in first {users_scanned} users", "yellow")
+            self.ui.press_any_key()
+            return
 
-            print("\nSummary Statistics:")
-            print(f"   Users scanned: {users_scanned}")
-            print(f"   Users with privileged roles: {users_with_roles}")
-            print(f"   High-risk roles found: {high_risk_count}")
-            print(f"   Duration: {duration:.2f} seconds")
+        # Resolve displayed columns once, outside the view loop
+        col_set = set(df.columns)
+        summary_cols = [c for c in ["User Principal Name", "Display Name", "Account Enabled",
+                                    "Privileged Role Count", "High Risk Role Count", "Roles"]
+                        if c in col_set]
+        high_risk_cols = [c for c in ["User Principal Name", "Display Name", "High Risk Roles"]
+                          if c in col_set]
 
-            if df.empty:
-                self.ui.print_message(f"\nNo users with privileged roles found in first {users_scanned} users", "yellow")
-                self.ui.press_any_key()
-                return
+        # Filter once, outside the view loop
+        high_risk_df = df[df["High Risk Role Count"].to_numpy() > 0].reset_index(drop=True)
 
-            # Show view options menu
-            while True:
-                print("\nView Options:")
-                print("1. Summary table")
-                print("2. Raw role data (first user with roles)")
-                print("3. High-risk users only")
-                print("4. Export to CSV")
-                print("B. Back to menu")
-
-                view_choice = self.ui.get_input("\nSelect view option: ", "B")
-
-                if view_choice.upper() == "B":
-                    return
-
-                elif view_choice == "1":
-                    # Summary table
-                    print("\n" + "=" * 60)
-                    self.ui.print_message("SUMMARY TABLE", "cyan")
-                    print("=" * 60)
-                    display_cols = ["User Principal Name", "Display Name", "Account Enabled",
-                                    "Privileged Role Count", "High Risk Role Count", "Roles"]
-                    available_cols = [c for c in display_cols if c in df.columns]
-                    print(df[available_cols].to_string(index=False))
-                    self.ui.press_any_key()
+        # Show view options menu
+        while True:
+            print("\nView Options:")
+            print("1. Summary table")
+            print("2. Raw role data (first user with roles)")
+            print("3. High-risk users only")
+            print("4. Export to CSV")
+            print("B. Back to menu")
 
-                elif view_choice == "2":
-                    # Raw data view
-                    if raw_data:
-                        user_with_roles = raw_data[0]
-                        print(f"\nRaw Role Data for: {user_with_roles['user_principal_name']}")
-                        print("=" * 60)
-                        for role in user_with_roles["roles"]:
-                            print(f"\n  Role Name: {role['role_name']}")
-                            print(f"  Role ID: {role['role_id']}")
-                            print(f"  Role Type: {role['role_type']}")
-                            print(f"  High Risk: {role['is_high_risk']}")
-                            print(f"  Assignment Source: {role['assignment_source']}")
-                    else:
-                        self.ui.print_message("No role data available to display", "yellow")
-                    self.ui.press_any_key()
+            view_choice = self.ui.get_input("\nSelect view option: ", "B")
 
-                elif view_choice == "3":
-                    # High-risk users only
-                    high_risk_df = df[df["High Risk Role Count"] > 0]
-                    print(f"\nHIGH-RISK USERS ({len(high_risk_df)} found)")
-                    print("=" * 60)
-                    if not high_risk_df.empty:
-                        display_cols = ["User Principal Name", "Display Name", "High Risk Roles"]
-                        available_cols = [c for c in display_cols if c in high_risk_df.columns]
-                        print(high_risk_df[available_cols].to_string(index=False))
-                    else:
-                        self.ui.print_message("No high-risk users found", "yellow")
-                    self.ui.press_any_key()
+            if view_choice.upper() == "B":
+                return
 
-                elif view_choice == "4":
-                    # Export to CSV
-                    timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
-                    csv_path = self.reports.export_dir / f"PrivilegedAccess_{timestamp}.csv"
-                    df.to_csv(csv_path, index=False, encoding='utf-8-sig')
-                    self.ui.print_message(f"\nExported to: {csv_path}", "success")
-                    self.ui.press_any_key()
+            elif view_choice == "1":
+                # Summary table
+                print("\n" + _SEP60)
+                self.ui.print_message("SUMMARY TABLE", "cyan")
+                print(_SEP60)
+                print_df(df, summary_cols)
+                self.ui.press_any_key()
 
+            elif view_choice == "2":
+                # Raw data view
+                if raw_data:
+                    user_with_roles = raw_data[0]
+                    print(f"\nRaw Role Data for: {user_with_roles['user_principal_name']}")
+                    print(_SEP60)
+                    for role in user_with_roles["roles"]:
+                        print(f"\n  Role Name: {role['role_name']}")
+                        print(f"  Role ID: {role['role_id']}")
+                        print(f"  Role Type: {role['role_type']}")
+                        print(f"  High Risk: {role['is_high_risk']}")
+                        print(f"  Assignment Source: {role['assignment_source']}")
                 else:
-                    self.ui.print_message("Invalid option", "yellow")
-                    await asyncio.sleep(1)
+                    self.ui.print_message("No role data available to display", "yellow")
+                self.ui.press_any_key()
 
-        except Exception as e:
-            self.ui.print_message(f"\nError: {e}", "red")
-            import traceback
-            traceback.print_exc()
-            self.ui.press_any_key()
+            elif view_choice == "3":
+                # High-risk users only
+                print(f"\nHIGH-RISK USERS ({len(high_risk_df)} found)")
+                print(_SEP60)
+                if not high_risk_df.empty:
+                    print_df(high_risk_df, high_risk_cols, max_rows=MAX_TTY_ROWS)
+                else:
+                    self.ui.print_message("No high-risk users found", "yellow")
+                self.ui.press_any_key()
 
+            elif view_choice == "4":
+                # Export to CSV
+                timestamp = self._export_timestamp()
+                csv_path = self.reports.export_dir / f"PrivilegedAccess_{timestamp}.csv"
+                export_path = export_dataframe(df, csv_path, self.config.export_format)
+                self.ui.print_message(f"\nExported to: {export_path}", "success")
+                self.ui.press_any_key()
+
+            else:
+                self.ui.print_message("Invalid option", "yellow")
+
+    @_guarded
     async def run_mfa_status_report(self):
         """Generate MFA status compliance report"""
         assert self.ui is not None
         assert self.reports is not None
 
-        start_time = datetime.now()
+        start_time = time.perf_counter()
 
         self.ui.clear_screen()
         self.ui.print_header("MFA Status Report (Compliance)")
 
-        try:
-            # Call the report
-            result = await self.reports.get_mfa_status(
-                include_raw_data=True
-            )
+        # Call the report
+        result = await self.reports.get_mfa_status(
+            include_raw_data=True
+        )
 
-            df = result["dataframe"]
-            raw_data = result["raw_data"]
-            users_scanned = result["users_scanned"]
-            compliant_count = result["compliant_count"]
-            non_compliant_count = result["non_compliant_count"]
+        df = result["dataframe"]
+        raw_data = result["raw_data"]
+        users_scanned = result["users_scanned"]
+        compliant_count = result["compliant_count"]
+        non_compliant_count = result["non_compliant_count"]
 
-            # Calculate execution time
-            end_time = datetime.now()
-            duration = (end_time - start_time).total_seconds()
+        # Calculate execution time
+        duration = time.perf_counter() - start_time
 
-            # Display summary
-            self.ui.clear_screen()
-            self.ui.print_header("MFA STATUS - RESULTS")
+        # Display summary
+        self.ui.clear_screen()
+        self.ui.print_header("MFA STATUS - RESULTS")
+
+        _emit(
+            "\nSummary Statistics:",
+            f"   Users scanned: {users_scanned}"
+        )
+        self.ui.print_message(f"   Compliant users: {compliant_count}", "success")
+        self.ui.print_message(f"   Non-compliant users: {non_compliant_count}", "red")
+        print(f"   Duration: {duration:.2f} seconds")
+
+        if df.empty:
+            self.ui.print_message(f"\nNo users found", "yellow")
+            self.ui.press_any_key()
+            return
 
-            print("\nSummary Statistics:")
-            print(f"   Users scanned: {users_scanned}")
-            self.ui.print_message(f"   Compliant users: {compliant_count}", "success")
-            self.ui.print_message(f"   Non-compliant users: {non_compliant_count}", "red")
-            print(f"   Duration: {duration:.2f} seconds")
+        # Resolve displayed and exported columns once, outside the view loop
+        col_set = set(df.columns)
+        summary_cols = [c for c in ["User Principal Name", "Display Name", "Account Enabled",
+                                    "MFA Registered", "MFA Compliant", "Methods Count", "Method Types"]
+                        if c in col_set]
+        non_compliant_cols = [c for c in ["User Principal Name", "Display Name", "Method Types"]
+                              if c in col_set]
+        export_cols = [c for c in ["User Principal Name", "Display Name", "Account Enabled",
+                                   "MFA Registered", "MFA Compliant", "Methods Count",
+                                   "Method Types", "Last MFA Activity"]
+                       if c in col_set]
 
-            if df.empty:
-                self.ui.print_message(f"\nNo users found", "yellow")
-                self.ui.press_any_key()
-                return
+        # Filter once, outside the view loop
+        non_compliant_df = df[(df["MFA Compliant"] == False).to_numpy()].reset_index(drop=True)
 
-            # Show view options menu
-            while True:
-                print("\nView Options:")
-                print("1. Summary table (all users)")
-                print("2. Non-compliant users only")
-                print("3. Raw MFA data (first non-compliant user)")
-                print("4. Export to CSV")
-                print("B. Back to menu")
-
-                view_choice = self.ui.get_input("\nSelect view option: ", "B")
-
-                if view_choice.upper() == "B":
-                    return
-
-                elif view_choice == "1":
-                    # Summary table
-                    print("\n" + "=" * 60)
-                    self.ui.print_message("SUMMARY TABLE", "cyan")
-                    print("=" * 60)
-                    display_cols = ["User Principal Name", "Display Name", "Account Enabled",
-                                    "MFA Registered", "MFA Compliant", "Methods Count", "Method Types"]
-                    available_cols = [c for c in display_cols if c in df.columns]
-                    print(df[available_cols].to_string(index=False))
-                    self.ui.press_any_key()
+        # Show view options menu
+        while True:
+            print("\nView Options:")
+            print("1. Summary table (all users)")
+            print("2. Non-compliant users only")
+            print("3. Raw MFA data (first non-compliant user)")
+            print("4. Export to CSV")
+            print("B. Back to menu")
 
-                elif view_choice == "2":
-                    # Non-compliant users only
-                    non_compliant_df = df[df["MFA Compliant"] == False]
-                    print(f"\nNON-COMPLIANT USERS ({len(non_compliant_df)} found)")
-                    print("=" * 60)
-                    if not non_compliant_df.empty:
-                        display_cols = ["User Principal Name", "Display Name", "Method Types"]
-                        available_cols = [c for c in display_cols if c in non_compliant_df.columns]
-                        print(non_compliant_df[available_cols].to_string(index=False))
-                    else:
-                        self.ui.print_message("All scanned users are MFA compliant!", "success")
-                    self.ui.press_any_key()
+            view_choice = self.ui.get_input("\nSelect view option: ", "B")
 
-                elif view_choice == "3":
-                    # Raw MFA data view
-                    non_compliant_user = None
-                    for user_data in raw_data:
-                        if not user_data.get("is_compliant"):
-                            non_compliant_user = user_data
-                            break
-
-                    if non_compliant_user:
-                        print(f"\nRaw MFA Data for: {non_compliant_user['user_principal_name']}")
-                        print("=" * 60)
-                        print(f"  Display Name: {non_compliant_user['display_name']}")
-                        print(f"  Account Enabled: {non_compliant_user['account_enabled']}")
-                        print(f"  Method Types: {non_compliant_user['method_types']}")
-                        print(f"\n  Raw Methods ({len(non_compliant_user['methods'])} total):")
-                        for method in non_compliant_user['methods']:
-                            method_type = method.odata_type if hasattr(method, 'odata_type') else type(method).__name__
-                            print(f"    - {method_type}")
-                    else:
-                        self.ui.print_message("No non-compliant users or no raw data available", "yellow")
-                    self.ui.press_any_key()
+            if view_choice.upper() == "B":
+                return
 
-                elif view_choice == "4":
-                    # Export to CSV
-                    timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
-                    csv_path = self.reports.export_dir / f"MFA_Status_Report_{timestamp}.csv"
-                    export_cols = ["User Principal Name", "Display Name", "Account Enabled",
-                                   "MFA Registered", "MFA Compliant", "Methods Count",
-                                   "Method Types", "Last MFA Activity"]
-                    available_cols = [c for c in export_cols if c in df.columns]
-                    df[available_cols].to_csv(csv_path, index=False, encoding='utf-8-sig')
-                    self.ui.print_message(f"\nExported to: {csv_path}", "success")
-                    self.ui.press_any_key()
+            elif view_choice == "1":
+                # Summary table
+                print("\n" + _SEP60)
+                self.ui.print_message("SUMMARY TABLE", "cyan")
+                print(_SEP60)
+                print_df(df, summary_cols)
+                self.ui.press_any_key()
 
+            elif view_choice == "2":
+                # Non-compliant users only
+                print(f"\nNON-COMPLIANT USERS ({len(non_compliant_df)} found)")
+                print(_SEP60)
+                if not non_compliant_df.empty:
+                    print_df(non_compliant_df, non_compliant_cols, max_rows=MAX_TTY_ROWS)
                 else:
-                    self.ui.print_message("Invalid option", "yellow")
-                    await asyncio.sleep(1)
+                    self.ui.print_message("All scanned users are MFA compliant!", "success")
+                self.ui.press_any_key()
 
-        except Exception as e:
-            self.ui.print_message(f"\nError: {e}", "red")
-            import traceback
-            traceback.print_exc()
-            self.ui.press_any_key()
+            elif view_choice == "3":
+                # Raw MFA data view (first non-compliant user, located while the report ran)
+                idx = result.get("first_noncompliant_idx")
+                non_compliant_user = raw_data[idx] if idx is not None else None
+
+                if non_compliant_user:
+                    print(f"\nRaw MFA Data for: {non_compliant_user['user_principal_name']}")
+                    print(_SEP60)
+                    print(f"  Display Name: {non_compliant_user['display_name']}")
+                    print(f"  Account Enabled: {non_compliant_user['account_enabled']}")
+                    print(f"  Method Types: {non_compliant_user['method_types']}")
+                    print(f"\n  Raw Methods ({len(non_compliant_user['methods'])} total):")
+                    for method in non_compliant_user['methods']:
+                        method_type = method.odata_type if hasattr(method, 'odata_type') else type(method).__name__
+                        print(f"    - {method_type}")
+                else:
+                    self.ui.print_message("No non-compliant users or no raw data available", "yellow")
+                self.ui.press_any_key()
+
+            elif view_choice == "4":
+                # Export to CSV
+                timestamp = self._export_timestamp()
+                csv_path = self.reports.export_dir / f"MFA_Status_Report_{timestamp}.csv"
+                export_path = export_dataframe(df[export_cols], csv_path, self.config.export_format)
+                self.ui.print_message(f"\nExported to: {export_path}", "success")
+                self.ui.press_any_key()
+
+            else:
+                self.ui.print_message("Invalid option", "yellow")
 
+    @_guarded
     async def run_license_usage_report(self):
         """Generate license assignment vs usage report"""
         assert self.ui is not None
         assert self.reports is not None
 
         user_limit = None  # None = all users
-        start_time = datetime.now()
+        start_time = time.perf_counter()
 
         self.ui.clear_screen()
         self.ui.print_header("License Assignment vs Usage Report")
 
-        try:
-            # Call the report
-            result = await self.reports.get_license_usage(
-                max_users=user_limit,
-                include_raw_data=True
-            )
+        # Call the report
+        # No view shows raw license data, so don't collect it
+        result = await self.reports.get_license_usage(
+            max_users=user_limit,
+            include_raw_data=False
+        )
 
-            df = result["dataframe"]
-            raw_data = result["raw_data"]
-            users_scanned = result["users_scanned"]
-            active_count = result["active_count"]
-            inactive_count = result["inactive_count"]
-            license_breakdown = result["license_breakdown"]
+        df = result["dataframe"]
+        users_scanned = result["users_scanned"]
+        active_count = result["active_count"]
+        inactive_count = result["inactive_count"]
+        license_breakdown = result["license_breakdown"]
 
-            # Calculate execution time
-            end_time = datetime.now()
-            duration = (end_time - start_time).total_seconds()
-
-            # Display summary
-            self.ui.clear_screen()
-            self.ui.print_header("LICENSE USAGE - RESULTS")
+        # Calculate execution time
+        duration = time.perf_counter() - start_time
 
-            print("\nSummary Statistics:")
-            print(f"   Licensed users scanned: {users_scanned}")
-            self.ui.print_message(f"   Active users: {active_count}", "success")
-            self.ui.print_message(f"   Inactive users: {inactive_count}", "red")
-            print(f"   Duration: {duration:.2f} seconds")
-
-            if df.empty:
-                self.ui.print_message("\nNo licensed users found", "yellow")
-                self.ui.press_any_key()
-                return
+        # Display summary
+        self.ui.clear_screen()
+        self.ui.print_header("LICENSE USAGE - RESULTS")
+
+        _emit(
+            "\nSummary Statistics:",
+            f"   Licensed users scanned: {users_scanned}"
+        )
+        self.ui.print_message(f"   Active users: {active_count}", "success")
+        self.ui.print_message(f"   Inactive users: {inactive_count}", "red")
+        print(f"   Duration: {duration:.2f} seconds")
+
+        if df.empty:
+            self.ui.print_message("\nNo licensed users found", "yellow")
+            self.ui.press_any_key()
+            return
 
-            # Show view options menu
-            while True:
-                print("\nView Options:")
-                print("1. Summary table (all licensed users)")
-                print("2. Inactive licensed users only")
-                print("3. License types breakdown")
-                print("4. Export to CSV")
-                print("B. Back to menu")
-
-                view_choice = self.ui.get_input("\nSelect view option: ", "B")
-
-                if view_choice.upper() == "B":
-                    return
-
-                elif view_choice == "1":
-                    # Summary table
-                    print("\n" + "=" * 60)
-                    self.ui.print_message("ALL LICENSED USERS", "cyan")
-                    print("=" * 60)
-                    display_cols = ["User Principal Name", "Display Name", "Account Enabled",
+        # Resolve displayed and exported columns once, outside the view loop
+        col_set = set(df.columns)
+        summary_cols = [c for c in ["User Principal Name", "Display Name", "Account Enabled",
                                     "License Count", "Licenses Assigned", "Usage Status", "Last Sign-In"]
-                    available_cols = [c for c in display_cols if c in df.columns]
-                    print(df[available_cols].to_string(index=False))
-                    self.ui.press_any_key()
-
-                elif view_choice == "2":
-                    # Inactive licensed users only
-                    inactive_df = df[df["Has Activity"] == False]
-                    print(f"\nINACTIVE LICENSED USERS ({len(inactive_df)} found)")
-                    print("=" * 60)
-                    if not inactive_df.empty:
-                        display_cols = ["User Principal Name", "Display Name", "License Count",
-                                        "Licenses Assigned", "Last Sign-In"]
-                        available_cols = [c for c in display_cols if c in inactive_df.columns]
-                        print(inactive_df[available_cols].to_string(index=False))
-                    else:
-                        self.ui.print_message("All licensed users are active!", "success")
-                    self.ui.press_any_key()
-
-                elif view_choice == "3":
-                    # License type breakdown
-                    print("\n" + "=" * 60)
-                    self.ui.print_message("LICENSE TYPE BREAKDOWN", "cyan")
-                    print("=" * 60)
-                    if license_breakdown:
-                        breakdown_data = []
-                        for license_type, counts in license_breakdown.items():
-                            breakdown_data.append({
-                                "License Type": license_type,
-                                "Total Users": counts["total"],
-                                "Active Users": counts["active"],
-                                "Inactive Users": counts["inactive"]
-                            })
-                        import pandas as pd
-                        breakdown_df = pd.DataFrame(breakdown_data)
-                        print(breakdown_df.to_string(index=False))
-                    else:
-                        print("No license breakdown data available")
-                    self.ui.press_any_key()
-
-                elif view_choice == "4":
-                    # Export to CSV
-                    timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
-                    csv_path = self.reports.export_dir / f"License_Usage_Report_{timestamp}.csv"
-                    export_cols = ["User Principal Name", "Display Name", "Account Enabled",
+                        if c in col_set]
+        inactive_cols = [c for c in ["User Principal Name", "Display Name", "License Count",
+                                     "Licenses Assigned", "Last Sign-In"]
+                         if c in col_set]
+        export_cols = [c for c in ["User Principal Name", "Display Name", "Account Enabled",
                                    "License Count", "Licenses Assigned", "Has Activity",
                                    "Last Sign-In", "Usage Status"]
-                    available_cols = [c for c in export_cols if c in df.columns]
-                    df[available_cols].to_csv(csv_path, index=False, encoding='utf-8-sig')
-                    self.ui.print_message(f"\nExported to: {csv_path}", "success")
-                    self.ui.press_any_key()
+                       if c in col_set]
 
-                else:
-                    self.ui.print_message("Invalid option", "yellow")
-                    await asyncio.sleep(1)
+        # Filter once, outside the view loop
+        inactive_df = df[(df["Has Activity"] == False).to_numpy()].reset_index(drop=True)
 
-        except Exception as e:
-            self.ui.print_message(f"\nError: {e}", "red")
-            import traceback
-            traceback.print_exc()
-            self.ui.press_any_key()
+        # Show view options menu
+        while True:
+            print("\nView Options:")
+            print("1. Summary table (all licensed users)")
+            print("2. Inactive licensed users only")
+            print("3. License types breakdown")
+            print("4. Export to CSV")
+            print("B. Back to menu")
 
-    async def run_mailbox_sizes_report(self):
-        """Run the PowerShell Mailbox Sizes Report"""
-        assert self.ui is not None
+            view_choice = self.ui.get_input("\nSelect view option: ", "B")
 
-        self.ui.print_message("\nRunning Mailbox Sizes Report...", "yellow")
+            if view_choice.upper() == "B":
+                return
 
-        try:
-            # Get the path to the PowerShell script
-            script_path = Path(__file__).parent / "SecurityCompliancePortal.ps1"
+            elif view_choice == "1":
+                # Summary table
+                print("\n" + _SEP60)
+                self.ui.print_message("ALL LICENSED USERS", "cyan")
+                print(_SEP60)
+                print_df(df, summary_cols)
+                self.ui.press_any_key()
 
-            # Run the PowerShell function with full terminal I/O passthrough
-            ps_command = f'. "{script_path}"; Invoke-MailboxSizesReport'
+            elif view_choice == "2":
+                # Inactive licensed users only
+                print(f"\nINACTIVE LICENSED USERS ({len(inactive_df)} found)")
+                print(_SEP60)
+                if not inactive_df.empty:
+                    print_df(inactive_df, inactive_cols, max_rows=MAX_TTY_ROWS)
+                else:
+                    self.ui.print_message("All licensed users are active!", "success")
+                self.ui.press_any_key()
 
-            process = subprocess.run(
-                ["pwsh", "-NoProfile", "-Command", ps_command],
-                stdin=sys.stdin,
-                stdout=sys.stdout,
-                stderr=sys.stderr
-            )
+            elif view_choice == "3":
+                # License type breakdown
+                print("\n" + _SEP60)
+                self.ui.print_message("LICENSE TYPE BREAKDOWN", "cyan")
+                print(_SEP60)
+                if license_breakdown:
+                    # A few rows only, so format them directly instead of via a DataFrame
+                    headers = ("License Type", "Total Users", "Active Users", "Inactive Users")
+                    rows = [(str(license_type), str(counts["total"]), str(counts["active"]), str(counts["inactive"]))
+                            for license_type, counts in license_breakdown.items()]
+                    widths = [max(len(header), *(len(row[i]) for row in rows)) for i, header in enumerate(headers)]
+                    _emit(*(" ".join(value.rjust(width) for value, width in zip(row, widths))
+                            for row in [headers, *rows]))
+                else:
+                    print("No license breakdown data available")
+                self.ui.press_any_key()
 
-            if process.returncode != 0:
-                self.ui.print_message("\nPowerShell report completed with warnings", "yellow")
+            elif view_choice == "4":
+                # Export to CSV
+                timestamp = self._export_timestamp()
+                csv_path = self.reports.export_dir / f"License_Usage_Report_{timestamp}.csv"
+                export_path = export_dataframe(df[export_cols], csv_path, self.config.export_format)
+                self.ui.print_message(f"\nExported to: {export_path}", "success")
+                self.ui.press_any_key()
 
-        except FileNotFoundError:
-            self.ui.print_message("\nError: PowerShell (pwsh) not found. Please install PowerShell Core.", "red")
-            self.ui.press_any_key()
-        except Exception as e:
-            self.ui.print_message(f"\nError running PowerShell report: {e}", "red")
-            self.ui.press_any_key()
+            else:
+                self.ui.print_message("Invalid option", "yellow")
 
-    async def run_external_sharing_report(self):
-        """Run the PowerShell External Sharing/Forwarding Rules Report"""
+    async def _run_powershell_report(self, title: str, function_name: str):
+        """Run a SecurityCompliancePortal.ps1 report function with full terminal I/O passthrough"""
         assert self.ui is not None
 
-        self.ui.print_message("\nRunning External Sharing/Forwarding Rules Report...", "yellow")
+        self.ui.print_message(f"\nRunning {title}...", "yellow")
 
         try:
             # Get the path to the PowerShell script
             script_path = Path(__file__).parent / "SecurityCompliancePortal.ps1"
+            ps_command = f'. "{script_path}"; {function_name}'
 
-            # Run the PowerShell function with full terminal I/O passthrough
-            ps_command = f'. "{script_path}"; Invoke-ExternalSharingReport'
-
-            process = subprocess.run(
-                ["pwsh", "-NoProfile", "-Command", ps_command],
-                stdin=sys.stdin,
-                stdout=sys.stdout,
-                stderr=sys.stderr
+            # The child inherits the console handles; awaiting it keeps the event loop free
+            process = await asyncio.create_subprocess_exec(
+                "pwsh", "-NoProfile", "-Command", ps_command
             )
+            returncode = await process.wait()
 
-            if process.returncode != 0:
+            if returncode != 0:
                 self.ui.print_message("\nPowerShell report completed with warnings", "yellow")
 
         except FileNotFoundError:
@@ -1846,35 +2173,17 @@ class EntraLense:
             self.ui.print_message(f"\nError running PowerShell report: {e}", "red")
             self.ui.press_any_key()
 
-    async def run_distribution_list_report(self):
-        """Run the PowerShell Distribution List Membership Report"""
-        assert self.ui is not None
-
-        self.ui.print_message("\nRunning Distribution List Membership Report...", "yellow")
-
-        try:
-            # Get the path to the PowerShell script
-            script_path = Path(__file__).parent / "SecurityCompliancePortal.ps1"
-
-            # Run the PowerShell function with full terminal I/O passthrough
-            ps_command = f'. "{script_path}"; Invoke-DistributionListReport'
-
-            process = subprocess.run(
-                ["pwsh", "-NoProfile", "-Command", ps_command],
-                stdin=sys.stdin,
-                stdout=sys.stdout,
-                stderr=sys.stderr
-            )
+    async def run_mailbox_sizes_report(self):
+        """Run the PowerShell Mailbox Sizes Report"""
+        await self._run_powershell_report("Mailbox Sizes Report", "Invoke-MailboxSizesReport")
 
-            if process.returncode != 0:
-                self.ui.print_message("\nPowerShell report completed with warnings", "yellow")
+    async def run_external_sharing_report(self):
+        """Run the PowerShell External Sharing/Forwarding Rules Report"""
+        await self._run_powershell_report("External Sharing/Forwarding Rules Report", "Invoke-ExternalSharingReport")
 
-        except FileNotFoundError:
-            self.ui.print_message("\nError: PowerShell (pwsh) not found. Please install PowerShell Core.", "red")
-            self.ui.press_any_key()
-        except Exception as e:
-            self.ui.print_message(f"\nError running PowerShell report: {e}", "red")
-            self.ui.press_any_key()
+    async def run_distribution_list_report(self):
+        """Run the PowerShell Distribution List Membership Report"""
+        await self._run_powershell_report("Distribution List Membership Report", "Invoke-DistributionListReport")
 
     async def run_security_groups_report(self):
         """Generate security group membership report (CSV output)"""
@@ -1885,7 +2194,7 @@ class EntraLense:
         self.ui.print_header("Security Group Membership Report")
 
         print("📋 Configure Security Group Report")
-        print("-" * 40)
+        print(_RULE40)
 
         # User filter
         print("👤 User Filter:")
@@ -1918,7 +2227,6 @@ class EntraLense:
 
         except Exception as e:
             self.ui.print_message(f"❌ Error: {e}", "red")
-            import traceback
             traceback.print_exc()
 
         self.ui.press_any_key()
@@ -1932,7 +2240,7 @@ class EntraLense:
         self.ui.print_header("User Status Report")
 
         print("📋 Configure User Status Report")
-        print("-" * 40)
+        print(_RULE40)
 
         # User filter
         print("👤 User Filter:")
@@ -1965,7 +2273,6 @@ class EntraLense:
 
         except Exception as e:
             self.ui.print_message(f"❌ Error: {e}", "red")
-            import traceback
             traceback.print_exc()
 
         self.ui.press_any_key()
@@ -1992,14 +2299,14 @@ class EntraLense:
             return
 
         print("\n⏳ Generating all reports...")
-        print("-" * 40)
+        print(_RULE40)
 
         try:
             results = await self.reports.get_all_reports(output_csv=True)
 
-            print("\n" + "=" * 60)
+            print("\n" + _SEP60)
             print("📊 BATCH REPORT SUMMARY")
-            print("=" * 60)
+            print(_SEP60)
 
             for report_name, df in results.items():
                 if not df.empty:
@@ -2007,21 +2314,20 @@ class EntraLense:
                 else:
                     print(f"   ⚠️ {report_name}: No data")
 
-            print("=" * 60)
+            print(_SEP60)
             print("\n✅ All reports generated and saved to exports folder!")
 
         except Exception as e:
             self.ui.print_message(f"❌ Error: {e}", "red")
-            import traceback
             traceback.print_exc()
 
         self.ui.press_any_key()
 
     def _show_report_summary(self, df, report_type: str):
         """Show summary statistics for a report"""
-        print("\n" + "=" * 60)
+        print("\n" + _SEP60)
         print(f"📊 {report_type.upper()} SUMMARY")
-        print("=" * 60)
+        print(_SEP60)
 
         print(f"   Total Records: {len(df)}")
 
@@ -2049,7 +2355,7 @@ class EntraLense:
                 print(f"   Unique Users: {unique_users}")
                 print(f"   Unique Groups: {unique_groups}")
 
-        print("=" * 60)
+        print(_SEP60)
 
     def show_configuration(self):
         """Display current configuration"""
@@ -2075,10 +2381,12 @@ class EntraLense:
 
         if choice == "1":
             self.config = config_manager.run_setup_wizard()
+            # The wizard may have changed the export path
+            self._export_dirs.clear()
         elif choice == "2":
             new_path = input("Enter new export path: ").strip()
             if new_path:
-                self.config.export_path = new_path
+                self._set_export_path(new_path)
                 config_manager.save()
                 print("✅ Export path updated!")
 
@@ -3,6 +3,7 @@
 import asyncio
 import logging
 import re
+from collections import defaultdict
 from datetime import datetime, timedelta, timezone
 from typing import Dict, List, Any, Optional, Tuple, Set
 from dataclasses import dataclass, field
@@ -10,6 +11,12 @@ from enum import Enum
 import json
 from pathlib import Path
 
+# orjson reads and writes the inventory file much faster; stdlib json is the fallback
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from modules.azure_auth import EntraAuth
 from modules.console_ui import ConsoleUI
 
@@ -248,6 +255,7 @@ class AssetTracker:
         self.ui = ConsoleUI()
         self.assets: Dict[str, Asset] = {}  # Key: asset_id
         self.summary: Optional[AssetSummary] = None
+        self._type_index: Optional[Dict[AssetType, List[Asset]]] = None  # Built on first type search
 
         # Load existing asset data if available
         self._load_asset_data()
@@ -257,8 +265,11 @@ class AssetTracker:
         data_file = Path("data/asset_inventory.json")
         if data_file.exists():
             try:
-                with open(data_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
+                if orjson is not None:
+                    data = orjson.loads(data_file.read_bytes())
+                else:
+                    with open(data_file, 'r', encoding='utf-8') as f:
+                        data = json.load(f)
 
                 for asset_data in data.get("assets", []):
                     asset = self._dict_to_asset(asset_data)
@@ -282,8 +293,11 @@ class AssetTracker:
                 "assets": [asset.to_dict() for asset in self.assets.values()]
             }
 
-            with open(data_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False, default=str)
+            if orjson is not None:
+                data_file.write_bytes(orjson.dumps(data, default=str, option=orjson.OPT_INDENT_2))
+            else:
+                with open(data_file, 'w', encoding='utf-8') as f:
+                    json.dump(data, f, indent=2, ensure_ascii=False, default=str)
 
             logger.info(f"Saved {len(self.assets)} assets to inventory file")
 
@@ -388,6 +402,9 @@ class AssetTracker:
             except Exception as e:
                 logger.error(f"Error creating asset from device {device_info.get('device_name', 'unknown')}: {e}")
 
+        # Inventory changed, so rebuild the type index on next use
+        self._type_index = None
+
         # Update asset statuses
         for asset in self.assets.values():
             asset.warranty_status = asset.calculate_warranty_status()
@@ -821,6 +838,15 @@ class AssetTracker:
 
         return matches
 
+    def find_assets_by_type(self, asset_type: AssetType) -> List[Asset]:
+        """Find assets of a given type."""
+        if self._type_index is None:
+            self._type_index = defaultdict(list)
+            for asset in self.assets.values():
+                self._type_index[asset.asset_type].append(asset)
+
+        return list(self._type_index.get(asset_type, []))
+
     def find_duplicate_serial_numbers(self) -> Dict[str, List[Asset]]:
         """Find duplicate serial numbers in inventory."""
         serial_map = {}
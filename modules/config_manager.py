@@ -10,6 +10,7 @@ import platform
 from pathlib import Path
 from typing import Dict, Optional, Any
 from dataclasses import dataclass, asdict, field
+from functools import cached_property
 from modules.entralense_logger import get_global_logger
 
 logger = get_global_logger()
@@ -37,6 +38,7 @@ class EntraConfig:
     export_path: str = "./exports"
     dark_mode: bool = True
     last_report_type: str = "all"
+    export_format: str = "csv"  # csv, feather, parquet, xlsx
 
     # Compliance Policy Settings
     compliance_check_types: list = field(default_factory=lambda: [
@@ -47,6 +49,22 @@ class EntraConfig:
     compliance_report_format: str = "detailed"  # detailed, summary, executive
     compliance_alert_threshold: float = 80.0  # percent compliance threshold
     include_remediation_details: bool = True
+
+    @cached_property
+    def export_root(self) -> Path:
+        """Export directory as a Path (set_export_path refreshes it)"""
+        return Path(self.export_path)
+
+    @cached_property
+    def equipment_dir(self) -> Path:
+        """Export directory for equipment reports"""
+        return self.export_root / "equipment"
+
+    def set_export_path(self, export_path: str) -> None:
+        """Change export_path and drop the paths cached from the old one"""
+        self.export_path = export_path
+        self.__dict__.pop("export_root", None)
+        self.__dict__.pop("equipment_dir", None)
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'EntraConfig':
@@ -185,7 +203,7 @@ class ConfigManager:
         # Ask about export preferences
         export_dir = input("\n📁 Export directory [default: ./exports]: ").strip()
         if export_dir:
-            self.config.export_path = export_dir
+            self.config.set_export_path(export_dir)
             # Create directory if it doesn't exist
             Path(export_dir).mkdir(exist_ok=True)
         
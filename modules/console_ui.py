@@ -4,6 +4,7 @@ Console UI utilities for EntraLense.
 Provides colored output, menus, and user interaction.
 """
 import os
+import sys
 from typing import Any, List, Optional
 from colorama import init, Fore, Back, Style
 
@@ -13,8 +14,12 @@ init(autoreset=True)
 class ConsoleUI:
     """Handles console UI elements: colors, menus, displays"""
     
+    # Clear screen and move the cursor home; colorama translates this on Windows
+    ANSI_CLEAR = "\x1b[2J\x1b[H"
+    
     def __init__(self, dark_mode: bool = True):
         self.dark_mode = dark_mode
+        self._screen_cleared = False
         self.setup_colors()
     
     def setup_colors(self):
@@ -38,7 +43,13 @@ class ConsoleUI:
     
     def clear_screen(self):
         """Clear console screen"""
+        if self._screen_cleared:
+            # Repaints skip the cls/clear subprocess spawned on first use
+            sys.stdout.write(self.ANSI_CLEAR)
+            sys.stdout.flush()
+            return
         os.system('cls' if os.name == 'nt' else 'clear')
+        self._screen_cleared = True
     
     def print_header(self, title: str):
         """Print application header"""
@@ -49,6 +60,10 @@ class ConsoleUI:
     
     def print_message(self, message: str, msg_type: str = "info"):
         """Print a colored message"""
+        print(self.format_message(message, msg_type))
+    
+    def format_message(self, message: str, msg_type: str = "info") -> str:
+        """Return message wrapped in its color codes, for batching with other output"""
         colors = {
             "info": self.info_color,
             "success": self.success_color,
@@ -61,7 +76,7 @@ class ConsoleUI:
         }
         
         color = colors.get(msg_type, self.text_color)
-        print(f"{color}{message}{Style.RESET_ALL}")
+        return f"{color}{message}{Style.RESET_ALL}"
     
     def display_menu(self, title: str, menu_items: list[tuple[str, str]]) -> str:
         """Display a menu and get user choice"""
@@ -2,6 +2,7 @@
 
 import asyncio
 import logging
+from collections import Counter
 from datetime import datetime
 from typing import Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass, field
@@ -59,6 +60,9 @@ class IntuneDevice:
 class IntuneIntegration:
     """Microsoft Intune integration handler."""
 
+    # Concurrent per-device Graph requests
+    MAX_CONCURRENT_REQUESTS = 20
+
     def __init__(self, auth, config):
         """
         Initialize Intune integration.
@@ -254,22 +258,31 @@ class IntuneIntegration:
 
         total = len(devices)
         error_counts = {}  # Track errors by type
+        processed = 0
 
-        for i, device in enumerate(devices, 1):
-            try:
-                policies, error_code = await self.get_device_compliance_policies(device.device_id)
-                device.compliance_policies = policies
+        # Requests run concurrently, capped at Graph's 20-request batch size
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_REQUESTS)
 
-                if error_code:
-                    error_counts[error_code] = error_counts.get(error_code, 0) + 1
+        async def enrich(device: IntuneDevice) -> None:
+            nonlocal processed
+            async with semaphore:
+                try:
+                    policies, error_code = await self.get_device_compliance_policies(device.device_id)
+                    device.compliance_policies = policies
 
-                # Show progress
-                if i % 50 == 0 or i == total:
-                    print(f"   Processed {i}/{total} devices")
+                    if error_code:
+                        error_counts[error_code] = error_counts.get(error_code, 0) + 1
 
-            except Exception as e:
-                logger.debug(f"Error enriching device {device.device_name}: {e}")
-                error_counts["Unknown"] = error_counts.get("Unknown", 0) + 1
+                except Exception as e:
+                    logger.debug(f"Error enriching device {device.device_name}: {e}")
+                    error_counts["Unknown"] = error_counts.get("Unknown", 0) + 1
+
+            # Show progress
+            processed += 1
+            if processed % 50 == 0 or processed == total:
+                print(f"   Processed {processed}/{total} devices")
+
+        await asyncio.gather(*(enrich(device) for device in devices))
 
         # Show error summary if any errors occurred
         if error_counts:
@@ -424,26 +437,21 @@ class IntuneIntegration:
 
         total = len(devices)
 
-        # Encryption statistics
-        encrypted = sum(1 for d in devices if d.is_encrypted is True)
-        not_encrypted = sum(1 for d in devices if d.is_encrypted is False)
-        unknown = sum(1 for d in devices if d.is_encrypted is None)
+        # Counter tallies in C, one pass per attribute
+        encryption_counts = Counter(d.is_encrypted for d in devices)
+        encrypted = encryption_counts[True]
+        not_encrypted = encryption_counts[False]
+        unknown = encryption_counts[None]
 
         # OS distribution
-        os_distribution = {}
-        for device in devices:
-            os = device.operating_system
-            os_distribution[os] = os_distribution.get(os, 0) + 1
+        os_distribution = dict(Counter(d.operating_system for d in devices))
 
         # Compliance status
         compliant = sum(1 for d in devices if "compliant" in d.compliance_state.lower() and "non" not in d.compliance_state.lower())
         non_compliant = total - compliant
 
         # Management agent distribution
-        agent_distribution = {}
-        for device in devices:
-            agent = device.management_agent
-            agent_distribution[agent] = agent_distribution.get(agent, 0) + 1
+        agent_distribution = dict(Counter(d.management_agent for d in devices))
 
         return {
             "total_devices": total,
@@ -3,6 +3,7 @@
 User report generation for EntraLense.
 CSV-focused output with filtering options.
 """
+import asyncio
 import pandas as pd
 from datetime import datetime, timedelta, timezone
 from typing import Optional, Dict, Any, List
@@ -15,11 +16,18 @@ from msgraph.generated.users.users_request_builder import UsersRequestBuilder
 class UserReports:
     """Generates various user activity and security reports - CSV focused"""
 
+    # Graph requests in flight at once across the reports get_all_reports runs
+    # together; each report on its own only ever has one
+    MAX_CONCURRENT_REQUESTS = 2
+
     def __init__(self, auth, export_dir: Path = Path("./exports")):
         self.auth = auth
         self.graph_client = None
         self.export_dir = Path(export_dir)
         self.export_dir.mkdir(exist_ok=True)
+        self._graph_slots = asyncio.Semaphore(self.MAX_CONCURRENT_REQUESTS)
+        # Set while get_all_reports runs, so the reports' progress lines don't interleave
+        self._in_batch = False
 
     async def _get_client(self):
         """Get authenticated Graph client"""
@@ -27,6 +35,16 @@ class UserReports:
             self.graph_client = await self.auth.get_graph_client()
         return self.graph_client
 
+    async def _graph(self, request):
+        """Await a Graph request while holding one of the shared request slots"""
+        async with self._graph_slots:
+            return await request
+
+    def _progress(self, message: str) -> None:
+        """Print a per-user progress line, unless reports are running together"""
+        if not self._in_batch:
+            print(message)
+
     async def get_login_activity(
         self,
         days_back: int = 30,
@@ -46,11 +64,13 @@ class UserReports:
             include_raw_data: Whether to include raw sign-in data in results
 
         Returns:
-            Dict with 'dataframe', 'raw_data', and 'users_processed' keys
+            Dict with 'dataframe', 'raw_data', 'first_signin_idx' and 'users_processed' keys
+            ('first_signin_idx' is the raw_data index of the first user with sign-ins, or None)
         """
         result = {
             "dataframe": pd.DataFrame(),
             "raw_data": [],
+            "first_signin_idx": None,
             "users_processed": 0,
             "csv_path": None
         }
@@ -68,7 +88,7 @@ class UserReports:
             request_config = UsersRequestBuilder.UsersRequestBuilderGetRequestConfiguration(
                 query_parameters=query_params
             )
-            users_response = await client.users.get(request_configuration=request_config)
+            users_response = await self._graph(client.users.get(request_configuration=request_config))
 
             if not users_response.value:
                 print("No users found in tenant")
@@ -92,10 +112,11 @@ class UserReports:
             print(f"Found {len(users)} users")
 
             # Show users being processed
-            print("\nUsers to analyze:")
-            for user in users:
-                print(f"   - {user.user_principal_name}")
-            print()
+            if not self._in_batch:
+                print("\nUsers to analyze:")
+                for user in users:
+                    print(f"   - {user.user_principal_name}")
+                print()
 
             activity_data = []
             raw_sign_in_data = []
@@ -104,7 +125,7 @@ class UserReports:
 
             for i, user in enumerate(users):
                 user_num = i + 1
-                print(f"Processing user {user_num}/{total_users}: {user.user_principal_name}")
+                self._progress(f"Processing user {user_num}/{total_users}: {user.user_principal_name}")
 
                 try:
                     # Get sign-ins for this user
@@ -116,14 +137,16 @@ class UserReports:
                     request_config = SignInsRequestBuilder.SignInsRequestBuilderGetRequestConfiguration(
                         query_parameters=query_params
                     )
-                    sign_ins_response = await client.audit_logs.sign_ins.get(
+                    sign_ins_response = await self._graph(client.audit_logs.sign_ins.get(
                         request_configuration=request_config
-                    )
+                    ))
 
                     sign_ins = sign_ins_response.value if sign_ins_response.value else []
 
                     # Store raw data if requested
                     if include_raw_data:
+                        if sign_ins and result["first_signin_idx"] is None:
+                            result["first_signin_idx"] = len(raw_sign_in_data)
                         raw_sign_in_data.append({
                             "user_principal_name": user.user_principal_name,
                             "display_name": user.display_name,
@@ -132,21 +155,11 @@ class UserReports:
                             "sign_ins": sign_ins
                         })
 
-                    # Calculate metrics
-                    recent_signins = 0
-                    last_signin = None
-                    first_signin = None
-
-                    for signin in sign_ins:
-                        if signin.created_date_time:
-                            if signin.created_date_time > cutoff_date:
-                                recent_signins += 1
-
-                            # Track first and last
-                            if not last_signin or signin.created_date_time > last_signin:
-                                last_signin = signin.created_date_time
-                            if not first_signin or signin.created_date_time < first_signin:
-                                first_signin = signin.created_date_time
+                    # Calculate metrics from one pass over the SDK objects' timestamps
+                    signin_times = [t for t in (signin.created_date_time for signin in sign_ins) if t]
+                    recent_signins = sum(1 for t in signin_times if t > cutoff_date)
+                    last_signin = max(signin_times) if signin_times else None
+                    first_signin = min(signin_times) if signin_times else None
 
                     # Determine activity status
                     if not user.account_enabled:
@@ -240,7 +253,7 @@ class UserReports:
 
             # Get all groups first
             print("   Fetching all security groups...")
-            groups_response = await client.groups.get()
+            groups_response = await self._graph(client.groups.get())
 
             group_dict = {}
             if groups_response.value:
@@ -260,7 +273,7 @@ class UserReports:
             request_config = UsersRequestBuilder.UsersRequestBuilderGetRequestConfiguration(
                 query_parameters=query_params
             )
-            users_response = await client.users.get(request_configuration=request_config)
+            users_response = await self._graph(client.users.get(request_configuration=request_config))
 
             if not users_response.value:
                 print("No users found")
@@ -284,11 +297,11 @@ class UserReports:
 
             for i, user in enumerate(users):
                 if i % 10 == 0:
-                    print(f"   Progress: {i+1}/{total_users}")
+                    self._progress(f"   Progress: {i+1}/{total_users}")
 
                 try:
                     # Get user's group memberships
-                    memberships_response = await client.users.by_user_id(user.id).member_of.get()
+                    memberships_response = await self._graph(client.users.by_user_id(user.id).member_of.get())
 
                     user_groups = []
                     for membership in memberships_response.value:
@@ -374,7 +387,7 @@ class UserReports:
             request_config = UsersRequestBuilder.UsersRequestBuilderGetRequestConfiguration(
                 query_parameters=query_params
             )
-            users_response = await client.users.get(request_configuration=request_config)
+            users_response = await self._graph(client.users.get(request_configuration=request_config))
 
             if not users_response.value:
                 print("No users found")
@@ -399,7 +412,7 @@ class UserReports:
 
             for i, user in enumerate(users):
                 if i % 10 == 0:
-                    print(f"   Progress: {i+1}/{total_users}")
+                    self._progress(f"   Progress: {i+1}/{total_users}")
 
                 try:
                     # Get last sign-in
@@ -413,9 +426,9 @@ class UserReports:
                         request_config = SignInsRequestBuilder.SignInsRequestBuilderGetRequestConfiguration(
                             query_parameters=query_params
                         )
-                        sign_ins_response = await client.audit_logs.sign_ins.get(
+                        sign_ins_response = await self._graph(client.audit_logs.sign_ins.get(
                             request_configuration=request_config
-                        )
+                        ))
 
                         if sign_ins_response.value and sign_ins_response.value[0].created_date_time:
                             last_signin = sign_ins_response.value[0].created_date_time
@@ -494,11 +507,25 @@ class UserReports:
     async def get_all_reports(self, output_csv: bool = True) -> Dict[str, pd.DataFrame]:
         """Get all reports at once"""
         print("Running batch report generation...")
-        login_result = await self.get_login_activity(30, output_csv=output_csv)
+        # Create the shared client first so the concurrent reports don't each build one
+        await self._get_client()
+
+        # The reports are independent and network-bound, so run them together.
+        # Their Graph requests share _graph_slots, and only their start and
+        # summary lines are printed.
+        self._in_batch = True
+        try:
+            login_result, user_status, security_groups = await asyncio.gather(
+                self.get_login_activity(30, output_csv=output_csv),
+                self.get_user_status_report(output_csv=output_csv),
+                self.get_user_security_groups(output_csv=output_csv)
+            )
+        finally:
+            self._in_batch = False
         return {
             "login_activity": login_result["dataframe"],
-            "user_status": await self.get_user_status_report(output_csv=output_csv),
-            "security_groups": await self.get_user_security_groups(output_csv=output_csv)
+            "user_status": user_status,
+            "security_groups": security_groups
         }
 
     async def get_privileged_access_inventory(
@@ -656,11 +683,14 @@ class UserReports:
             include_raw_data: Whether to include raw MFA method data in results
 
         Returns:
-            Dict with 'dataframe', 'raw_data', 'users_scanned', 'compliant_count', 'non_compliant_count'
+            Dict with 'dataframe', 'raw_data', 'first_noncompliant_idx', 'users_scanned',
+            'compliant_count', 'non_compliant_count'
+            ('first_noncompliant_idx' is the raw_data index of the first non-compliant user, or None)
         """
         result = {
             "dataframe": pd.DataFrame(),
             "raw_data": [],
+            "first_noncompliant_idx": None,
             "users_scanned": 0,
             "compliant_count": 0,
             "non_compliant_count": 0
@@ -753,6 +783,8 @@ class UserReports:
                     })
 
                     if include_raw_data:
+                        if not is_compliant and result["first_noncompliant_idx"] is None:
+                            result["first_noncompliant_idx"] = len(raw_mfa_data)
                         raw_mfa_data.append({
                             "user_principal_name": user.user_principal_name,
                             "display_name": user.display_name,
@@ -0,0 +1,138 @@
+# test_build_all.py
+"""
+Test the packaging helpers in build_all.py.
+"""
+import os
+import random
+import sys
+import tempfile
+import threading
+import zipfile
+import zlib
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+from build_all import EntraLenseBuilder, READ_AHEAD_BYTES
+
+
+def _deflated_size(data, level):
+    """Size of data as a raw DEFLATE stream at the given level"""
+    compressor = zlib.compressobj(level, zlib.DEFLATED, -15)
+    return len(compressor.compress(data) + compressor.flush())
+
+
+def _sample_text(size):
+    """Deterministic text that compresses differently at level 1 and level 6"""
+    rng = random.Random(0)
+    words = [f"word{n}" for n in range(2000)]
+    text = " ".join(rng.choice(words) for _ in range(size // 4))
+    return text.encode()[:size]
+
+
+def _make_builder(root: Path):
+    builder = EntraLenseBuilder()
+    builder.dist = root / "dist"
+    builder.dist.mkdir()
+    return builder
+
+
+def test_streamed_zip_entries_use_fixed_levels():
+    """Entries larger than READ_AHEAD_BYTES keep the level the small ones get"""
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        builder = _make_builder(root)
+
+        portable_dir = root / "EntraLense_Windows_Portable"
+        portable_dir.mkdir()
+        dist_dir = root / "onedir"
+        dist_dir.mkdir()
+
+        data = _sample_text(READ_AHEAD_BYTES * 2)
+        (dist_dir / "library.dat").write_bytes(data)
+        (dist_dir / "notes.txt").write_bytes(data)
+        assert _deflated_size(data, 1) != _deflated_size(data, 6)
+
+        zip_path, total_size = builder._write_zip(portable_dir, dist_dir)
+        assert total_size == 2 * len(data)
+
+        with zipfile.ZipFile(zip_path) as zipf:
+            binary = zipf.getinfo(f"{portable_dir.name}/EntraLense/library.dat")
+            text = zipf.getinfo(f"{portable_dir.name}/EntraLense/notes.txt")
+            assert zipf.read(binary) == data
+
+        assert binary.compress_size == _deflated_size(data, 1)
+        assert text.compress_size == _deflated_size(data, 6)
+
+
+def test_portable_package_is_staged_with_hard_links():
+    """External archivers get a hard-linked tree that still has the config/data skeleton"""
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        builder = _make_builder(root)
+        builder.archive_format = "tar.zst"
+
+        dist_dir = root / "onedir"
+        (dist_dir / "_internal").mkdir(parents=True)
+        (dist_dir / "EntraLense.exe").write_bytes(b"MZ" * 1024)
+        (dist_dir / "_internal" / "base_library.zip").write_bytes(b"PK" * 1024)
+
+        staged = {}
+
+        def write_tar_zst(portable_dir):
+            app_dir = portable_dir / "EntraLense"
+            staged["links"] = {
+                name: (app_dir / name).stat().st_nlink
+                for name in ("EntraLense.exe", "_internal/base_library.zip")
+            }
+            staged["skeleton"] = (app_dir / "config").is_dir() and (app_dir / "data").is_dir()
+            archive_path = builder.dist / "EntraLense_Windows.tar.zst"
+            archive_path.write_bytes(b"")
+            return archive_path
+
+        builder._write_tar_zst = write_tar_zst
+        builder.create_windows_portable(dist_dir)
+
+        assert all(nlink > 1 for nlink in staged["links"].values()), staged["links"]
+        assert staged["skeleton"]
+
+
+def test_zip_reader_errors_reach_the_writer():
+    """A file zipfile rejects fails the archive instead of hanging it"""
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        builder = _make_builder(root)
+
+        portable_dir = root / "EntraLense_Windows_Portable"
+        portable_dir.mkdir()
+        dist_dir = root / "onedir"
+        dist_dir.mkdir()
+
+        # ZIP timestamps start in 1980, so ZipInfo.from_file raises ValueError
+        old_file = dist_dir / "old.dll"
+        old_file.write_bytes(b"MZ")
+        os.utime(old_file, (0, 0))
+
+        errors = []
+
+        def write_zip():
+            try:
+                builder._write_zip(portable_dir, dist_dir)
+            except Exception as e:
+                errors.append(e)
+
+        writer = threading.Thread(target=write_zip, daemon=True)
+        writer.start()
+        writer.join(timeout=10)
+
+        assert not writer.is_alive(), "_write_zip is still waiting on the reader"
+        assert len(errors) == 1 and isinstance(errors[0], ValueError), errors
+
+
+if __name__ == "__main__":
+    test_streamed_zip_entries_use_fixed_levels()
+    test_portable_package_is_staged_with_hard_links()
+    test_zip_reader_errors_reach_the_writer()
+    print("✅ build_all: PASS")
@@ -0,0 +1,36 @@
+# test_exports.py
+"""
+Test the export helpers in entra_lense.py.
+"""
+import sys
+import tempfile
+from pathlib import Path
+
+import pandas as pd
+
+# Add project root to path
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+from entra_lense import fast_to_csv
+
+
+def test_fast_to_csv_leaves_nullable_missing_values_empty():
+    """pd.NA in Int64 and boolean columns is written as an empty field, like to_csv"""
+    df = pd.DataFrame({
+        "Device Count": pd.array([3, None, 1], dtype="Int64"),
+        "MFA Enabled": pd.array([True, None, False], dtype="boolean"),
+        "License Count": [2, 0, 5],
+    })
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = fast_to_csv(df, Path(tmp) / "users.csv")
+        written = path.read_text(encoding="utf-8-sig")
+
+    assert "<NA>" not in written
+    assert written == df.to_csv(index=False, lineterminator="\n")
+
+
+if __name__ == "__main__":
+    test_fast_to_csv_leaves_nullable_missing_values_empty()
+    print("✅ exports: PASS")